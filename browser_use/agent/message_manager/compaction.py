@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Callable
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
+
+from browser_use.agent.message_manager.views import CompactionReport, ManagedMessage, MessageHistory, MessageMetadata
+
+logger = logging.getLogger(__name__)
+
+# never compacted: system prompt, task, procedural memory, new tasks and the current state message
+PINNED_MESSAGE_TYPES = {'init', 'memory', 'task', 'state'}
+
+DEFAULT_TYPE_BUDGETS = {
+	'action_result': 8000,
+	'page_actions': 2000,
+	'plan': 4000,
+	'model_output': 24000,
+	'collapsed': 4000,
+}
+
+SUMMARY_PROMPT = """You compress the history of a browser automation agent.
+Summarize the given earlier steps (and the previous summary, if any) in at most 10 short lines.
+Keep visited URLs, data that was found, progress counters and failed approaches. Leave out anything else."""
+
+
+class HistoryCompactionPolicy(ABC):
+	"""Decides which history messages are collapsed, evicted or summarized once the history grows past its budget"""
+
+	@abstractmethod
+	def compact(
+		self, history: MessageHistory, max_tokens: int, count_tokens: Callable[[BaseMessage], int]
+	) -> CompactionReport: ...
+
+	def cancel(self) -> None:
+		"""Stop background work of the policy when the agent closes"""
+
+
+class BudgetedCompactionPolicy(HistoryCompactionPolicy):
+	"""
+	Keeps the history inside max_tokens and inside per message type token budgets, cheapest information loss first:
+	1. action results older than max_action_result_age steps are evicted
+	2. messages of a type over its budget are evicted oldest first (model outputs are collapsed instead)
+	3. model outputs older than keep_recent_steps steps are collapsed into one-line step summaries
+	4. the oldest unpinned messages are evicted
+
+	Compaction only runs once a budget is exceeded and then goes down to low_water_ratio of it, so it happens every
+	few dozen steps instead of every step (each compaction invalidates the cached prompt prefix).
+	With a summary_llm, the collapsed step summaries are additionally merged into a rolling summary in the background,
+	the result replaces them at a later compaction - the agent step never waits for it.
+	"""
+
+	def __init__(
+		self,
+		type_budgets: dict[str, int] | None = None,
+		max_action_result_age: int = 10,
+		keep_recent_steps: int = 5,
+		low_water_ratio: float = 0.75,
+		summary_llm: BaseChatModel | None = None,
+		summarize_after: int = 20,
+	):
+		self.type_budgets = DEFAULT_TYPE_BUDGETS | (type_budgets or {})
+		self.max_action_result_age = max_action_result_age
+		self.keep_recent_steps = keep_recent_steps
+		self.low_water_ratio = low_water_ratio
+		self.summary_llm = summary_llm
+		self.summarize_after = summarize_after
+		self._summary_task: asyncio.Task[BaseMessage] | None = None
+		self._summarized: list[ManagedMessage] = []
+
+	def compact(self, history: MessageHistory, max_tokens: int, count_tokens: Callable[[BaseMessage], int]) -> CompactionReport:
+		report = CompactionReport(tokens_before=history.current_tokens)
+		self._apply_summary(history, count_tokens, report)
+
+		tokens_by_type = Counter()
+		for m in history.messages:
+			tokens_by_type[m.metadata.message_type] += m.metadata.tokens
+		over_budget = [t for t, budget in self.type_budgets.items() if tokens_by_type[t] > budget]
+
+		if over_budget or history.current_tokens > max_tokens:
+			target_tokens = int(max_tokens * self.low_water_ratio)
+			self._evict_stale_action_results(history, report)
+			for message_type in over_budget:
+				self._enforce_type_budget(
+					history, message_type, int(self.type_budgets[message_type] * self.low_water_ratio), report
+				)
+			if 'model_output' in over_budget or self._total_tokens(history) > target_tokens:
+				self._collapse_old_steps(history, count_tokens, report)
+			if self._total_tokens(history) > target_tokens:
+				self._evict_oldest(history, target_tokens, report)
+			self._schedule_summary(history)
+
+		history.current_tokens = self._total_tokens(history)
+		report.tokens_after = history.current_tokens
+		return report
+
+	@staticmethod
+	def _total_tokens(history: MessageHistory) -> int:
+		return sum(m.metadata.tokens for m in history.messages)
+
+	@staticmethod
+	def _is_pinned(history: MessageHistory, index: int) -> bool:
+		managed = history.messages[index]
+		return (
+			index == len(history.messages) - 1
+			or managed.metadata.message_type in PINNED_MESSAGE_TYPES
+			or isinstance(managed.message, SystemMessage)
+		)
+
+	@staticmethod
+	def _is_model_output(managed: ManagedMessage) -> bool:
+		return isinstance(managed.message, AIMessage) and bool(managed.message.tool_calls)
+
+	def _step_ages(self, history: MessageHistory) -> list[int]:
+		"""Number of model outputs after each message, i.e. how many steps ago it was added"""
+		ages = [0] * len(history.messages)
+		age = 0
+		for i in range(len(history.messages) - 1, -1, -1):
+			ages[i] = age
+			if self._is_model_output(history.messages[i]):
+				age += 1
+		return ages
+
+	def _remove(self, history: MessageHistory, indices: set[int]) -> None:
+		"""Remove messages, together with the tool responses of removed tool calls so the history stays well-formed"""
+		for i in sorted(indices):
+			if self._is_model_output(history.messages[i]):
+				call_ids = {call['id'] for call in history.messages[i].message.tool_calls}  # type: ignore
+				j = i + 1
+				while j < len(history.messages) and isinstance(history.messages[j].message, ToolMessage):
+					if history.messages[j].message.tool_call_id in call_ids:  # type: ignore
+						indices.add(j)
+					j += 1
+		history.messages[:] = [m for i, m in enumerate(history.messages) if i not in indices]
+
+	def _evict_stale_action_results(self, history: MessageHistory, report: CompactionReport) -> None:
+		ages = self._step_ages(history)
+		stale = {
+			i
+			for i, m in enumerate(history.messages)
+			if m.metadata.message_type == 'action_result'
+			and ages[i] > self.max_action_result_age
+			and not self._is_pinned(history, i)
+		}
+		report.evicted_action_results += len(stale)
+		self._remove(history, stale)
+
+	def _enforce_type_budget(self, history: MessageHistory, message_type: str, budget: int, report: CompactionReport) -> None:
+		if message_type == 'model_output':
+			# model outputs are collapsed instead, see _collapse_old_steps
+			return
+		candidates = [
+			i
+			for i, m in enumerate(history.messages)
+			if m.metadata.message_type == message_type and not self._is_pinned(history, i)
+		]
+		tokens = sum(history.messages[i].metadata.tokens for i in candidates)
+		evicted = set()
+		for i in candidates:
+			if tokens <= budget:
+				break
+			tokens -= history.messages[i].metadata.tokens
+			evicted.add(i)
+		if message_type == 'action_result':
+			report.evicted_action_results += len(evicted)
+		else:
+			report.evicted_messages += len(evicted)
+		self._remove(history, evicted)
+
+	def _collapse_old_steps(
+		self, history: MessageHistory, count_tokens: Callable[[BaseMessage], int], report: CompactionReport
+	) -> None:
+		ages = self._step_ages(history)
+		tool_responses = set()
+		for i, managed in enumerate(history.messages):
+			if not self._is_model_output(managed) or ages[i] < self.keep_recent_steps or self._is_pinned(history, i):
+				continue
+			call_ids = {call['id'] for call in managed.message.tool_calls}  # type: ignore
+			for j in range(i + 1, len(history.messages)):
+				message = history.messages[j].message
+				if not isinstance(message, ToolMessage):
+					break
+				if message.tool_call_id in call_ids:
+					tool_responses.add(j)
+			summary = HumanMessage(content=self.summarize_step(managed.message))  # type: ignore
+			history.messages[i] = ManagedMessage(
+				message=summary, metadata=MessageMetadata(tokens=count_tokens(summary), message_type='collapsed')
+			)
+			report.collapsed_steps += 1
+		history.messages[:] = [m for i, m in enumerate(history.messages) if i not in tool_responses]
+
+	@staticmethod
+	def summarize_step(message: AIMessage) -> str:
+		"""One-line summary of an AgentOutput tool call: the actions and the goal they were taken for"""
+		args = message.tool_calls[0]['args'] if message.tool_calls else {}
+		actions = []
+		for action in args.get('action') or []:
+			for name, params in action.items():
+				params = json.dumps(params, ensure_ascii=False) if params else ''
+				actions.append(f'{name}({params[:100]})')
+		next_goal = ' '.join(str((args.get('current_state') or {}).get('next_goal', '')).split())
+		line = f'Earlier step: {", ".join(actions) or "no action"}'
+		if next_goal:
+			line += f' - goal: {next_goal[:200]}'
+		return line
+
+	def _evict_oldest(self, history: MessageHistory, target_tokens: int, report: CompactionReport) -> None:
+		tokens = self._total_tokens(history)
+		evicted = set()
+		for i, managed in enumerate(history.messages):
+			if tokens <= target_tokens:
+				break
+			if i in evicted or self._is_pinned(history, i):
+				continue
+			evicted.add(i)
+			tokens -= managed.metadata.tokens
+			# a tool call goes together with its tool responses
+			if self._is_model_output(managed):
+				j = i + 1
+				while j < len(history.messages) and isinstance(history.messages[j].message, ToolMessage):
+					evicted.add(j)
+					tokens -= history.messages[j].metadata.tokens
+					j += 1
+		report.evicted_messages += len(evicted)
+		self._remove(history, evicted)
+
+	def _schedule_summary(self, history: MessageHistory) -> None:
+		"""Start merging the collapsed steps (and the previous summary) into one summary in the background"""
+		if self.summary_llm is None or self._summary_task is not None:
+			return
+		candidates = [m for m in history.messages if m.metadata.message_type in {'collapsed', 'summary'}]
+		if sum(m.metadata.message_type == 'collapsed' for m in candidates) < self.summarize_after:
+			return
+		try:
+			loop = asyncio.get_running_loop()
+		except RuntimeError:
+			return
+		self._summarized = candidates
+		self._summary_task = loop.create_task(
+			self.summary_llm.ainvoke(
+				[
+					SystemMessage(content=SUMMARY_PROMPT),
+					HumanMessage(content='\n'.join(str(m.message.content) for m in candidates)),
+				]
+			)
+		)
+
+	def _apply_summary(
+		self, history: MessageHistory, count_tokens: Callable[[BaseMessage], int], report: CompactionReport
+	) -> None:
+		"""Replace the summarized messages with the summary once the background summarization finished"""
+		if self._summary_task is None or not self._summary_task.done():
+			return
+		task, self._summary_task = self._summary_task, None
+		summarized, self._summarized = {id(m) for m in self._summarized}, []
+		try:
+			summary_text = str(task.result().content)
+		except Exception as e:
+			logger.warning(f'⚠️ Background history summarization failed: {type(e).__name__}: {e}')
+			return
+		indices = [i for i, m in enumerate(history.messages) if id(m) in summarized]
+		if not indices:
+			return
+		summary = HumanMessage(content=f'Summary of the earlier steps:\n{summary_text}')
+		history.messages[indices[0]] = ManagedMessage(
+			message=summary, metadata=MessageMetadata(tokens=count_tokens(summary), message_type='summary')
+		)
+		self._remove(history, set(indices[1:]))
+		report.summarized_messages += len(indices)
+
+	def cancel(self) -> None:
+		"""Cancel a still running background summarization"""
+		if self._summary_task is not None:
+			self._summary_task.cancel()
+			self._summary_task = None
+			self._summarized = []
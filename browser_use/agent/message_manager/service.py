@@ -11,13 +11,15 @@ from langchain_core.messages import (
 	SystemMessage,
 	ToolMessage,
 )
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
-from browser_use.agent.message_manager.views import MessageMetadata
+from browser_use.agent.message_manager.compaction import HistoryCompactionPolicy
+from browser_use.agent.message_manager.tokenizer import CharacterRatioTokenizer, Tokenizer
+from browser_use.agent.message_manager.views import CompactionReport, MessageMetadata
 from browser_use.agent.prompts import AgentMessagePrompt
 from browser_use.agent.views import ActionResult, AgentOutput, AgentStepInfo, MessageManagerState
 from browser_use.browser.views import BrowserStateSummary
-from browser_use.utils import time_execution_sync
+from browser_use.utils import SensitiveDataMatcher, time_execution_sync
 
 logger = logging.getLogger(__name__)
 
@@ -189,6 +191,14 @@ class MessageManagerSettings(BaseModel):
 	# Support both old format {key: value} and new format {domain: {key: value}}
 	sensitive_data: dict[str, str | dict[str, str]] | None = None
 	available_file_paths: list[str] | None = None
+	# mark the end of the stable message prefix with cache_control breakpoints (providers with explicit prompt caching)
+	cache_breakpoints: bool = False
+	# counts text tokens, defaults to estimated_characters_per_token calibrated against the LLM's reported usage
+	tokenizer: Tokenizer | None = None
+	# evicts / collapses old history messages so long runs stay inside max_input_tokens (None: history grows unbounded)
+	compaction_policy: HistoryCompactionPolicy | None = None
+
+	model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
 class MessageManager:
@@ -196,13 +206,16 @@ class MessageManager:
 		self,
 		task: str,
 		system_message: SystemMessage,
-		settings: MessageManagerSettings = MessageManagerSettings(),
-		state: MessageManagerState = MessageManagerState(),
+		settings: MessageManagerSettings | None = None,
+		state: MessageManagerState | None = None,
 	):
 		self.task = task
-		self.settings = settings
-		self.state = state
+		# fresh defaults per instance: the state's history is mutated in place (and the settings by Agent._handle_step_error)
+		self.settings = settings if settings is not None else MessageManagerSettings()
+		self.state = state if state is not None else MessageManagerState()
 		self.system_prompt = system_message
+		self.tokenizer = self.settings.tokenizer or CharacterRatioTokenizer(self.settings.estimated_characters_per_token)
+		self.compaction_totals = CompactionReport()
 
 		# Only initialize messages if state is empty
 		if len(self.state.history.messages) == 0:
@@ -276,7 +289,7 @@ class MessageManager:
 	def add_new_task(self, new_task: str) -> None:
 		content = f'Your new ultimate task is: """{new_task}""". Take the previous context into account and finish your new ultimate task. '
 		msg = HumanMessage(content=content)
-		self._add_message_with_tokens(msg)
+		self._add_message_with_tokens(msg, message_type='task')
 		self.task = new_task
 
 	@time_execution_sync('--add_state_message')
@@ -286,8 +299,9 @@ class MessageManager:
 		result: list[ActionResult] | None = None,
 		step_info: AgentStepInfo | None = None,
 		use_vision=True,
+		page_actions: str | None = None,
 	) -> None:
-		"""Add browser state as human message"""
+		"""Add browser state as human message (page_actions: page-specific action descriptions for this step only)"""
 
 		# if keep in memory, add to directly to history and add state without result
 		if result:
@@ -295,7 +309,7 @@ class MessageManager:
 				if r.include_in_memory:
 					if r.extracted_content:
 						msg = HumanMessage(content='Action result: ' + str(r.extracted_content))
-						self._add_message_with_tokens(msg)
+						self._add_message_with_tokens(msg, message_type='action_result')
 					if r.error:
 						# if endswith \n, remove it
 						if r.error.endswith('\n'):
@@ -303,7 +317,7 @@ class MessageManager:
 						# get only last line of error
 						last_line = r.error.split('\n')[-1]
 						msg = HumanMessage(content='Action error: ' + last_line)
-						self._add_message_with_tokens(msg)
+						self._add_message_with_tokens(msg, message_type='action_result')
 					result = None  # if result in history, we dont want to add it again
 
 		# otherwise add state message and result to next message (which will not stay in memory)
@@ -313,8 +327,9 @@ class MessageManager:
 			result=result,
 			include_attributes=self.settings.include_attributes,
 			step_info=step_info,
+			page_actions=page_actions,
 		).get_user_message(use_vision)
-		self._add_message_with_tokens(state_message)
+		self._add_message_with_tokens(state_message, message_type='state')
 
 	def add_model_output(self, model_output: AgentOutput) -> None:
 		"""Add model output as AI message"""
@@ -332,14 +347,14 @@ class MessageManager:
 			tool_calls=tool_calls,
 		)
 
-		self._add_message_with_tokens(msg)
+		self._add_message_with_tokens(msg, message_type='model_output')
 		# empty tool response
-		self.add_tool_message(content='')
+		self.add_tool_message(content='', message_type='model_output')
 
 	def add_plan(self, plan: str | None, position: int | None = None) -> None:
 		if plan:
 			msg = AIMessage(content=plan)
-			self._add_message_with_tokens(msg, position)
+			self._add_message_with_tokens(msg, position, message_type='plan')
 
 	def _log_history_lines(self) -> str:
 		"""Generate a formatted log string of message history for debugging / printing to terminal"""
@@ -379,11 +394,42 @@ class MessageManager:
 		"""Get current message list, potentially trimmed to max tokens"""
 		msg = [m.message for m in self.state.history.messages]
 
-		# Log message history for debugging
-		logger.debug(self._log_history_lines())
+		# Log message history for debugging (formatting the whole history is only worth it when it is printed)
+		if logger.isEnabledFor(logging.DEBUG):
+			logger.debug(self._log_history_lines())
 
+		if self.settings.cache_breakpoints:
+			msg = self._add_cache_breakpoints(msg)
 		return msg
 
+	@staticmethod
+	def _add_cache_breakpoints(messages: list[BaseMessage]) -> list[BaseMessage]:
+		"""
+		Return a copy of the messages with cache_control breakpoints after the system prompt and after the last history
+		message before the current state message, so each step reads the whole previous prefix from the provider's cache
+		"""
+		breakpoints = [0] if messages and isinstance(messages[0], SystemMessage) else []
+		for i in range(len(messages) - 2, 0, -1):
+			if isinstance(messages[i], (HumanMessage, SystemMessage)) and messages[i].content:
+				breakpoints.append(i)
+				break
+
+		messages = list(messages)
+		for i in breakpoints:
+			message = messages[i]
+			if isinstance(message.content, str):
+				content = [{'type': 'text', 'text': message.content}]
+			else:
+				content = [
+					dict(block) if isinstance(block, dict) else {'type': 'text', 'text': block} for block in message.content
+				]
+			for block in reversed(content):
+				if block.get('type') == 'text':
+					block['cache_control'] = {'type': 'ephemeral'}
+					break
+			messages[i] = message.model_copy(update={'content': content})
+		return messages
+
 	def _add_message_with_tokens(
 		self, message: BaseMessage, position: int | None = None, message_type: str | None = None
 	) -> None:
@@ -407,30 +453,16 @@ class MessageManager:
 			if not self.settings.sensitive_data:
 				return value
 
-			# Collect all sensitive values, immediately converting old format to new format
-			sensitive_values: dict[str, str] = {}
-
-			# Process all sensitive data entries
-			for key_or_domain, content in self.settings.sensitive_data.items():
-				if isinstance(content, dict):
-					# Already in new format: {domain: {key: value}}
-					for key, val in content.items():
-						if val:  # Skip empty values
-							sensitive_values[key] = val
-				elif content:  # Old format: {key: value} - convert to new format internally
-					# We treat this as if it was {'http*://*': {key_or_domain: content}}
-					sensitive_values[key_or_domain] = content
+			# compiled once per sensitive_data (and again only when it changes), shared with the controller registry
+			matcher = SensitiveDataMatcher.for_sensitive_data(self.settings.sensitive_data)
 
 			# If there are no valid sensitive data entries, just return the original value
-			if not sensitive_values:
+			if not matcher.placeholders:
 				logger.warning('No valid entries found in sensitive_data dictionary')
 				return value
 
-			# Replace all valid sensitive data values with their placeholder tags
-			for key, val in sensitive_values.items():
-				value = value.replace(val, f'<secret>{key}</secret>')
-
-			return value
+			# Replace all valid sensitive data values with their placeholder tags in a single pass
+			return matcher.redact(value)
 
 		if isinstance(message.content, str):
 			message.content = replace_sensitive(message.content)
@@ -459,8 +491,55 @@ class MessageManager:
 
 	def _count_text_tokens(self, text: str) -> int:
 		"""Count tokens in a text string"""
-		tokens = len(text) // self.settings.estimated_characters_per_token  # Rough estimate if no tokenizer available
-		return tokens
+		return self.tokenizer.count_tokens(text)
+
+	def reconcile_token_usage(self, input_messages: list[BaseMessage], input_tokens: int) -> None:
+		"""
+		Calibrate the tokenizer with the input tokens the LLM reported for input_messages (response usage_metadata) and
+		recount the history with it, so cut_messages trims based on real token counts instead of the initial guess
+		"""
+		text_characters = 0
+		images = 0
+		for message in input_messages:
+			if isinstance(message.content, list):
+				for item in message.content:
+					if 'image_url' in item:
+						images += 1
+					elif isinstance(item, dict) and 'text' in item:
+						text_characters += len(item['text'])
+			else:
+				text_characters += len(message.content) + len(str(getattr(message, 'tool_calls', '')))
+
+		estimated_tokens = self.state.history.current_tokens
+		# the flat image estimate is kept, tool schemas + message overhead are attributed to the text
+		self.tokenizer.calibrate(text_characters, input_tokens - images * self.settings.image_tokens)
+
+		self.state.history.current_tokens = 0
+		for m in self.state.history.messages:
+			m.metadata.tokens = self._count_tokens(m.message)
+			self.state.history.current_tokens += m.metadata.tokens
+		logger.debug(
+			f'🔢 LLM counted {input_tokens} input tokens, estimated {estimated_tokens} '
+			f'(now {self.state.history.current_tokens} after recounting the history)'
+		)
+
+	@time_execution_sync('--compact_history')
+	def compact_history(self) -> CompactionReport | None:
+		"""Apply the compaction policy, so the history plus the current state message fit into max_input_tokens"""
+		policy = self.settings.compaction_policy
+		if policy is None:
+			return None
+
+		report = policy.compact(self.state.history, self.settings.max_input_tokens, self._count_tokens)
+		if report.compacted:
+			for field in ('evicted_action_results', 'collapsed_steps', 'summarized_messages', 'evicted_messages'):
+				setattr(self.compaction_totals, field, getattr(self.compaction_totals, field) + getattr(report, field))
+			logger.info(
+				f'🗜️ Compacted history from {report.tokens_before} to {report.tokens_after} tokens: '
+				f'evicted {report.evicted_action_results} stale action results and {report.evicted_messages} old messages, '
+				f'collapsed {report.collapsed_steps} steps, summarized {report.summarized_messages} messages'
+			)
+		return report
 
 	def cut_messages(self):
 		"""Get current message list, potentially trimmed to max tokens"""
@@ -511,7 +590,7 @@ class MessageManager:
 
 		# new message with updated content
 		msg = HumanMessage(content=content)
-		self._add_message_with_tokens(msg)
+		self._add_message_with_tokens(msg, message_type='state')
 
 		last_msg = self.state.history.messages[-1]
 
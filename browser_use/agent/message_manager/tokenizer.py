@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import base64
+import functools
+import logging
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# pre-tokenization pattern of the cl100k_base / gpt-4 family vocabularies
+CL100K_PATTERN = (
+	r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}+|\p{N}{1,3}| ?[^\s\p{L}\p{N}]++[\r\n]*|\s*[\r\n]|\s+(?!\S)|\s+"""
+)
+
+
+class Tokenizer(ABC):
+	"""Counts the tokens of the text parts of LLM messages, used by the MessageManager to budget the context window"""
+
+	@abstractmethod
+	def count_tokens(self, text: str) -> int: ...
+
+	def calibrate(self, text_characters: int, text_tokens: int) -> None:
+		"""Reconcile with the number of tokens the provider actually counted for text_characters characters of text"""
+
+
+class CharacterRatioTokenizer(Tokenizer):
+	"""
+	Estimates tokens as characters / characters_per_token, where the ratio is calibrated against the token counts the
+	provider reports each step. Each agent calibrates its own instance: the reported counts include the agent's tool
+	schemas and images, so ratios learned by agents with other actions or vision settings don't carry over.
+	"""
+
+	SMOOTHING = 0.5  # weight of the newest observation
+	MIN_CHARACTERS_PER_TOKEN = 1.0
+	MAX_CHARACTERS_PER_TOKEN = 8.0
+
+	def __init__(self, characters_per_token: float = 3.0):
+		self.characters_per_token = characters_per_token
+		self.calibrations = 0
+
+	def count_tokens(self, text: str) -> int:
+		return int(len(text) / self.characters_per_token)
+
+	def calibrate(self, text_characters: int, text_tokens: int) -> None:
+		if text_characters <= 0 or text_tokens <= 0:
+			return
+		observed = min(max(text_characters / text_tokens, self.MIN_CHARACTERS_PER_TOKEN), self.MAX_CHARACTERS_PER_TOKEN)
+		# the first observation replaces the default guess, later ones are smoothed
+		weight = 1.0 if self.calibrations == 0 else self.SMOOTHING
+		self.characters_per_token += weight * (observed - self.characters_per_token)
+		self.calibrations += 1
+		logger.debug(f'🔢 Calibrated token estimate to {self.characters_per_token:.2f} characters/token')
+
+
+class BPETokenizer(Tokenizer):
+	"""
+	Offline byte-pair-encoding tokenizer for tiktoken-format vocab files (one "<base64 token> <rank>" per line, e.g.
+	cl100k_base.tiktoken), so token counts don't depend on network access or the provider's tokenizer library.
+	"""
+
+	def __init__(self, mergeable_ranks: dict[bytes, int], pattern: str = CL100K_PATTERN, cache_size: int = 65536):
+		import regex  # not a direct dependency (comes with tiktoken), only needed for the \p{L} classes of the BPE patterns
+
+		self.mergeable_ranks = mergeable_ranks
+		self.pattern = regex.compile(pattern)
+		self._encode_piece = functools.lru_cache(maxsize=cache_size)(self._bpe)
+
+	@classmethod
+	def from_file(cls, vocab_file: str | Path, pattern: str = CL100K_PATTERN) -> BPETokenizer:
+		mergeable_ranks = {}
+		for line in Path(vocab_file).read_bytes().splitlines():
+			if line:
+				token, rank = line.split()
+				mergeable_ranks[base64.b64decode(token)] = int(rank)
+		return cls(mergeable_ranks, pattern)
+
+	def _bpe(self, piece: bytes) -> tuple[int, ...]:
+		"""Merge the lowest-ranked adjacent pair until no pair is in the vocab (same merge order as tiktoken)"""
+		if piece in self.mergeable_ranks:
+			return (self.mergeable_ranks[piece],)
+		parts = [piece[i : i + 1] for i in range(len(piece))]
+		while len(parts) > 1:
+			best_rank, best_index = None, -1
+			for i in range(len(parts) - 1):
+				rank = self.mergeable_ranks.get(parts[i] + parts[i + 1])
+				if rank is not None and (best_rank is None or rank < best_rank):
+					best_rank, best_index = rank, i
+			if best_rank is None:
+				break
+			parts[best_index : best_index + 2] = [parts[best_index] + parts[best_index + 1]]
+		# bytes missing from a partial vocab still count as one token each
+		return tuple(self.mergeable_ranks.get(part, -1) for part in parts)
+
+	def encode(self, text: str) -> list[int]:
+		tokens: list[int] = []
+		for piece in self.pattern.findall(text):
+			tokens.extend(self._encode_piece(piece.encode('utf-8')))
+		return tokens
+
+	def count_tokens(self, text: str) -> int:
+		return len(self.encode(text))
@@ -51,6 +51,75 @@ def extract_json_from_model_output(content: str) -> dict:
 		raise ValueError('Could not parse response.')
 
 
+class StreamingActionParser:
+	"""
+	Incrementally scans a streamed AgentOutput JSON response and returns each element of its top-level "action" list
+	as soon as the element's closing brace arrives, e.g. to start the first action while the model is still writing.
+	Text before the JSON object (code fences, reasoning) and a wrapping [...] list are skipped.
+	"""
+
+	def __init__(self):
+		self.buffer = ''
+		self.actions: list[dict] = []
+		self._pos = 0
+		self._depth = 0
+		self._in_string = False
+		self._escape = False
+		self._expect_key = False
+		self._key_start = -1
+		self._last_key: str | None = None
+		self._in_action_list = False
+		self._element_start = -1
+
+	def feed(self, text: str) -> list[dict]:
+		"""Add the next chunk of streamed text, returns the actions that were completed by it"""
+		self.buffer += text
+		completed: list[dict] = []
+		buffer = self.buffer
+		for pos in range(self._pos, len(buffer)):
+			char = buffer[pos]
+			if self._in_string:
+				if self._escape:
+					self._escape = False
+				elif char == '\\':
+					self._escape = True
+				elif char == '"':
+					self._in_string = False
+					if self._key_start >= 0:
+						self._last_key = buffer[self._key_start : pos]
+						self._key_start = -1
+			elif self._depth == 0:
+				if char == '{':  # start of the top-level object, anything before it is ignored
+					self._depth = 1
+					self._expect_key = True
+			elif char == '"':
+				self._in_string = True
+				self._key_start = pos + 1 if self._depth == 1 and self._expect_key else -1
+			elif char in '{[':
+				self._depth += 1
+				if char == '[' and self._depth == 2 and self._last_key == 'action':
+					self._in_action_list = True
+				elif char == '{' and self._depth == 3 and self._in_action_list:
+					self._element_start = pos
+			elif char in '}]':
+				if char == '}' and self._depth == 3 and self._element_start >= 0:
+					try:
+						action = json.loads(buffer[self._element_start : pos + 1])
+					except json.JSONDecodeError:
+						action = None
+					if isinstance(action, dict):
+						self.actions.append(action)
+						completed.append(action)
+					self._element_start = -1
+				self._depth -= 1
+				if self._depth == 1:
+					self._in_action_list = False
+			elif self._depth == 1 and char in ',:':
+				self._expect_key = char == ','
+		self._pos = len(buffer)
+		return completed
+
+
 def convert_input_messages(input_messages: list[BaseMessage], model_name: str | None) -> list[BaseMessage]:
 	"""Convert input messages to a format that is compatible with the planner model"""
 	if model_name is None:
@@ -126,6 +126,21 @@ class MessageHistory(BaseModel):
 			self.messages.pop()
 
 
+class CompactionReport(BaseModel):
+	"""What a history compaction dropped"""
+
+	tokens_before: int = 0
+	tokens_after: int = 0
+	evicted_action_results: int = 0
+	collapsed_steps: int = 0
+	summarized_messages: int = 0
+	evicted_messages: int = 0
+
+	@property
+	def compacted(self) -> bool:
+		return bool(self.evicted_action_results or self.collapsed_steps or self.summarized_messages or self.evicted_messages)
+
+
 class MessageManagerState(BaseModel):
 	"""Holds the state for MessageManager"""
 
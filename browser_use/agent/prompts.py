@@ -66,11 +66,13 @@ class AgentMessagePrompt:
 		result: list['ActionResult'] | None = None,
 		include_attributes: list[str] | None = None,
 		step_info: Optional['AgentStepInfo'] = None,
+		page_actions: str | None = None,
 	):
 		self.state: 'BrowserStateSummary' = browser_state_summary
 		self.result = result
 		self.include_attributes = include_attributes or []
 		self.step_info = step_info
+		self.page_actions = page_actions
 		assert self.state
 
 	def get_user_message(self, use_vision: bool = True) -> HumanMessage:
@@ -113,6 +115,8 @@ Interactive elements from top layer of the current page inside the viewport:
 {elements_text}
 {step_info_description}
 """
+		if self.page_actions:
+			state_description += f'For this page, these additional actions are available:\n{self.page_actions}\n'
 
 		if self.result:
 			for i, result in enumerate(self.result):
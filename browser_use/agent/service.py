@@ -10,7 +10,7 @@ import sys
 import time
 from collections.abc import Awaitable, Callable
 from pathlib import Path
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, TypeVar, get_args
 
 from dotenv import load_dotenv
 
@@ -21,16 +21,22 @@ load_dotenv()
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import (
 	BaseMessage,
+	BaseMessageChunk,
 	HumanMessage,
 	SystemMessage,
 )
+from langchain_core.runnables import Runnable, RunnableParallel, RunnableSequence
 from playwright.async_api import Browser, BrowserContext, Page
+from playwright.async_api import Error as PlaywrightError
 from pydantic import BaseModel, ValidationError
 
 from browser_use.agent.gif import create_history_gif
 from browser_use.agent.memory import Memory, MemoryConfig
+from browser_use.agent.message_manager.compaction import HistoryCompactionPolicy
 from browser_use.agent.message_manager.service import MessageManager, MessageManagerSettings
+from browser_use.agent.message_manager.tokenizer import Tokenizer
 from browser_use.agent.message_manager.utils import (
+	StreamingActionParser,
 	convert_input_messages,
 	extract_json_from_model_output,
 	is_model_without_tool_support,
@@ -53,7 +59,7 @@ from browser_use.agent.views import (
 from browser_use.browser import BrowserProfile, BrowserSession
 
 # from lmnr.sdk.decorators import observe
-from browser_use.browser.views import BrowserStateSummary
+from browser_use.browser.views import BrowserError, BrowserStateSummary
 from browser_use.controller.registry.views import ActionModel
 from browser_use.controller.service import Controller
 from browser_use.dom.history_tree_processor.service import (
@@ -71,6 +77,9 @@ logger = logging.getLogger(__name__)
 
 SKIP_LLM_API_KEY_VERIFICATION = os.environ.get('SKIP_LLM_API_KEY_VERIFICATION', 'false').lower()[0] in 'ty1'
 
+# chat models that accept explicit cache_control breakpoints in message content (others cache prefixes automatically)
+CACHE_BREAKPOINT_CHAT_MODELS = {'ChatAnthropic'}
+
 
 def log_response(response: AgentOutput, registry=None) -> None:
 	"""Utility function to log the model's response."""
@@ -87,6 +96,18 @@ def log_response(response: AgentOutput, registry=None) -> None:
 	logger.info(f'🎯 Next goal: {response.current_state.next_goal}')
 
 
+def is_browser_error(error: BaseException) -> bool:
+	"""Whether the error, or one it was raised from (e.g. by Registry.execute_action), comes from the browser"""
+	seen: set[int] = set()
+	current: BaseException | None = error
+	while current is not None and id(current) not in seen:
+		if isinstance(current, (PlaywrightError, BrowserError)):  # incl. playwright's TargetClosedError
+			return True
+		seen.add(id(current))
+		current = current.__cause__ or current.__context__
+	return False
+
+
 Context = TypeVar('Context')
 
 AgentHookFunc = Callable[['Agent'], Awaitable[None]]
@@ -147,6 +168,10 @@ class Agent(Generic[Context]):
 			'data-date-format',
 		],
 		max_actions_per_step: int = 10,
+		stream_actions: bool = False,
+		prompt_caching: bool = False,
+		tokenizer: Tokenizer | None = None,
+		compaction_policy: HistoryCompactionPolicy | None = None,
 		tool_calling_method: ToolCallingMethod | None = 'auto',
 		page_extraction_llm: BaseChatModel | None = None,
 		planner_llm: BaseChatModel | None = None,
@@ -185,6 +210,8 @@ class Agent(Generic[Context]):
 			available_file_paths=available_file_paths,
 			include_attributes=include_attributes,
 			max_actions_per_step=max_actions_per_step,
+			stream_actions=stream_actions,
+			prompt_caching=prompt_caching,
 			tool_calling_method=tool_calling_method,
 			page_extraction_llm=page_extraction_llm,
 			planner_llm=planner_llm,
@@ -205,6 +232,10 @@ class Agent(Generic[Context]):
 		self._setup_action_models()
 		self._set_browser_use_version_and_source(source)
 		self.initial_actions = self._convert_initial_actions(initial_actions) if initial_actions else None
+		# first action of the current step, started while the LLM response is still streaming (stream_actions=True)
+		self._early_action: tuple[ActionModel, asyncio.Task[ActionResult]] | None = None
+		# (cached, uncached) input tokens of the last LLM call, as reported in the response usage metadata
+		self._prompt_cache_usage: tuple[int, int] | None = None
 
 		# Model setup
 		self._set_model_names()
@@ -263,6 +294,9 @@ class Agent(Generic[Context]):
 				message_context=self.settings.message_context,
 				sensitive_data=sensitive_data,
 				available_file_paths=self.settings.available_file_paths,
+				cache_breakpoints=self.settings.prompt_caching and self.chat_model_library in CACHE_BREAKPOINT_CHAT_MODELS,
+				tokenizer=tokenizer,
+				compaction_policy=compaction_policy,
 			),
 			state=self.state.message_manager_state,
 		)
@@ -293,7 +327,10 @@ class Agent(Generic[Context]):
 		# assert not (browser_session and browser_context), 'Cannot provide both browser_session and browser_context'
 		browser_profile = browser_profile or DEFAULT_BROWSER_PROFILE
 
-		if browser_session:
+		if browser_session and browser_session.browser_profile.isolate_agent_tabs:
+			# each agent gets its own tabs + state caches on top of the shared browser
+			self.browser_session = browser_session.tab_view()
+		elif browser_session:
 			# always copy sessions that are passed in to avoid conflicting with other agents sharing the same session
 			self.browser_session = browser_session.model_copy(
 				update={
@@ -749,6 +786,7 @@ class Agent(Generic[Context]):
 		result: list[ActionResult] = []
 		step_start_time = time.time()
 		tokens = 0
+		self._prompt_cache_usage = None
 
 		try:
 			browser_state_summary = await self.browser_session.get_state_summary(cache_clickable_elements_hashes=True)
@@ -769,12 +807,15 @@ class Agent(Generic[Context]):
 			page_filtered_actions = self.controller.registry.get_prompt_description(current_page)
 
 			# If there are page-specific actions, add them as a special message for this step only
-			if page_filtered_actions:
+			# (with prompt_caching they go into the state message instead, so the history stays append-only)
+			if page_filtered_actions and not self.settings.prompt_caching:
 				page_action_message = f'For this page, these additional actions are available:\n{page_filtered_actions}'
-				self._message_manager._add_message_with_tokens(HumanMessage(content=page_action_message))
+				self._message_manager._add_message_with_tokens(
+					HumanMessage(content=page_action_message), message_type='page_actions'
+				)
 
 			# If using raw tool calling method, we need to update the message context with new actions
-			if self.tool_calling_method == 'raw':
+			if self.tool_calling_method == 'raw' and not self.settings.prompt_caching:
 				# For raw tool calling, get all non-filtered actions plus the page-filtered ones
 				all_unfiltered_actions = self.controller.registry.get_prompt_description()
 				all_actions = all_unfiltered_actions
@@ -795,6 +836,7 @@ class Agent(Generic[Context]):
 				result=self.state.last_result,
 				step_info=step_info,
 				use_vision=self.settings.use_vision,
+				page_actions=page_filtered_actions if self.settings.prompt_caching else None,
 			)
 
 			# Run planner at specified intervals if planner is configured
@@ -813,6 +855,7 @@ class Agent(Generic[Context]):
 				self._message_manager._add_message_with_tokens(HumanMessage(content=msg))
 				self.AgentOutput = self.DoneAgentOutput
 
+			self._message_manager.compact_history()
 			input_messages = self._message_manager.get_messages()
 			tokens = self._message_manager.state.history.current_tokens
 
@@ -842,6 +885,8 @@ class Agent(Generic[Context]):
 						)
 						model_output.action = [action_instance]
 
+				self._reconcile_early_action(model_output)
+
 				# Check again for paused/stopped state after getting model output
 				await self._raise_if_stopped_or_paused()
 
@@ -903,6 +948,8 @@ class Agent(Generic[Context]):
 
 		finally:
 			step_end_time = time.time()
+			if self._early_action is not None:
+				await self._discard_early_action()
 			if not result:
 				return
 
@@ -912,6 +959,8 @@ class Agent(Generic[Context]):
 					step_start_time=step_start_time,
 					step_end_time=step_end_time,
 					input_tokens=tokens,
+					cached_input_tokens=self._prompt_cache_usage[0] if self._prompt_cache_usage else None,
+					uncached_input_tokens=self._prompt_cache_usage[1] if self._prompt_cache_usage else None,
 				)
 				self._make_history_item(model_output, browser_state_summary, result, metadata)
 
@@ -923,6 +972,18 @@ class Agent(Generic[Context]):
 		"""Handle all types of errors that can occur during a step"""
 		include_trace = logger.isEnabledFor(logging.DEBUG)
 		error_msg = AgentError.format_error(error, include_trace=include_trace)
+
+		# only browser errors are worth the liveness probe, LLM/parsing errors don't pay for its round-trip
+		if self.browser_session.can_recover and is_browser_error(error) and await self.browser_session.detect_crash():
+			# the browser + its tabs are restored at the start of the next step, so a crash doesn't count towards max_failures
+			logger.warning(f'💥 Browser crashed mid-step, resuming from the last completed step after recovery: {error_msg}')
+			return [
+				ActionResult(
+					error='The browser crashed mid-step and was restored to its last state - the last action might need to be repeated',
+					include_in_memory=True,
+				)
+			]
+
 		prefix = f'❌ Result failed {self.state.consecutive_failures + 1}/{self.settings.max_failures} times:\n '
 		self.state.consecutive_failures += 1
 
@@ -1012,38 +1073,11 @@ class Agent(Generic[Context]):
 		"""Get next action from LLM based on current state"""
 		input_messages = self._convert_input_messages(input_messages)
 
-		if self.tool_calling_method == 'raw':
-			self._log_llm_call_info(input_messages, self.tool_calling_method)
-			try:
-				output = self.llm.invoke(input_messages)
-				response = {'raw': output, 'parsed': None}
-			except Exception as e:
-				logger.error(f'Failed to invoke model: {str(e)}')
-				raise LLMException(401, 'LLM API call failed') from e
-			# TODO: currently invoke does not return reasoning_content, we should override invoke
-			output.content = self._remove_think_tags(str(output.content))
-			try:
-				parsed_json = extract_json_from_model_output(output.content)
-				parsed = self.AgentOutput(**parsed_json)
-				response['parsed'] = parsed
-			except (ValueError, ValidationError) as e:
-				logger.warning(f'Failed to parse model output: {output} {str(e)}')
-				raise ValueError('Could not parse response.')
+		response = await self._stream_next_action(input_messages) if self.settings.stream_actions else None
+		if response is None:
+			response = await self._invoke_next_action(input_messages)
 
-		elif self.tool_calling_method is None:
-			structured_llm = self.llm.with_structured_output(self.AgentOutput, include_raw=True)
-			try:
-				response: dict[str, Any] = await structured_llm.ainvoke(input_messages)  # type: ignore
-				parsed: AgentOutput | None = response['parsed']
-
-			except Exception as e:
-				logger.error(f'Failed to invoke model: {str(e)}')
-				raise LLMException(401, 'LLM API call failed') from e
-
-		else:
-			self._log_llm_call_info(input_messages, self.tool_calling_method)
-			structured_llm = self.llm.with_structured_output(self.AgentOutput, include_raw=True, method=self.tool_calling_method)
-			response: dict[str, Any] = await structured_llm.ainvoke(input_messages)  # type: ignore
+		self._record_token_usage(response.get('raw'), input_messages)
 
 		# Handle tool call responses
 		if response.get('parsing_error') and 'raw' in response:
@@ -1091,6 +1125,162 @@ class Agent(Generic[Context]):
 		self._log_next_action_summary(parsed)
 		return parsed
 
+	async def _invoke_next_action(self, input_messages: list[BaseMessage]) -> dict[str, Any]:
+		"""Call the LLM without streaming, returns its {'raw': ..., 'parsed': ...} response"""
+		if self.tool_calling_method == 'raw':
+			self._log_llm_call_info(input_messages, self.tool_calling_method)
+			try:
+				output = self.llm.invoke(input_messages)
+				response = {'raw': output, 'parsed': None}
+			except Exception as e:
+				logger.error(f'Failed to invoke model: {str(e)}')
+				raise LLMException(401, 'LLM API call failed') from e
+			# TODO: currently invoke does not return reasoning_content, we should override invoke
+			output.content = self._remove_think_tags(str(output.content))
+			try:
+				parsed_json = extract_json_from_model_output(output.content)
+				parsed = self.AgentOutput(**parsed_json)
+				response['parsed'] = parsed
+			except (ValueError, ValidationError) as e:
+				logger.warning(f'Failed to parse model output: {output} {str(e)}')
+				raise ValueError('Could not parse response.')
+
+		elif self.tool_calling_method is None:
+			structured_llm = self.llm.with_structured_output(self.AgentOutput, include_raw=True)
+			try:
+				response: dict[str, Any] = await structured_llm.ainvoke(input_messages)  # type: ignore
+			except Exception as e:
+				logger.error(f'Failed to invoke model: {str(e)}')
+				raise LLMException(401, 'LLM API call failed') from e
+
+		else:
+			self._log_llm_call_info(input_messages, self.tool_calling_method)
+			structured_llm = self.llm.with_structured_output(self.AgentOutput, include_raw=True, method=self.tool_calling_method)
+			response: dict[str, Any] = await structured_llm.ainvoke(input_messages)  # type: ignore
+
+		return response
+
+	def _record_token_usage(self, raw_message: Any, input_messages: list[BaseMessage]) -> None:
+		"""
+		Use the input tokens reported in the LLM response usage metadata to calibrate the message manager's token counts
+		and keep the cached vs uncached split for the step metadata
+		"""
+		usage = getattr(raw_message, 'usage_metadata', None)
+		if not usage:
+			return
+		self._message_manager.reconcile_token_usage(input_messages, usage['input_tokens'])
+		cached_tokens = (usage.get('input_token_details') or {}).get('cache_read') or 0
+		self._prompt_cache_usage = (cached_tokens, usage['input_tokens'] - cached_tokens)
+
+	async def _stream_next_action(self, input_messages: list[BaseMessage]) -> dict[str, Any] | None:
+		"""
+		Stream the LLM response and start executing the first action as soon as its JSON is complete,
+		returns the same {'raw': ..., 'parsed': ...} response as _invoke_next_action().
+		Returns None if the LLM's structured output can't be streamed, the caller then uses _invoke_next_action().
+		"""
+		if self.tool_calling_method == 'raw':
+			llm, output_parser = self.llm, None
+		else:
+			if self.tool_calling_method is None:
+				structured_llm = self.llm.with_structured_output(self.AgentOutput, include_raw=True)
+			else:
+				structured_llm = self.llm.with_structured_output(
+					self.AgentOutput, include_raw=True, method=self.tool_calling_method
+				)
+			# the langchain chat models return RunnableMap(raw=llm) | parser, stream the llm part ourselves.
+			# providers that build their structured output differently can't be streamed
+			raw_step = structured_llm.first if isinstance(structured_llm, RunnableSequence) else None
+			llm = raw_step.steps__.get('raw') if isinstance(raw_step, RunnableParallel) else None
+			if not isinstance(llm, Runnable):
+				logger.debug(
+					f'stream_actions: {type(self.llm).__name__}.with_structured_output() has an unknown shape, not streaming'
+				)
+				return None
+			output_parser = structured_llm.last  # type: ignore
+		if self.tool_calling_method is not None:
+			self._log_llm_call_info(input_messages, self.tool_calling_method)
+
+		stream_parser = StreamingActionParser()
+		message: BaseMessageChunk | None = None
+		try:
+			async for chunk in llm.astream(input_messages):
+				message = chunk if message is None else message + chunk
+				if not stream_parser.actions:
+					for action_json in stream_parser.feed(self._get_stream_chunk_text(chunk, message))[:1]:
+						self._dispatch_early_action(action_json)
+		except Exception as e:
+			logger.error(f'Failed to invoke model: {str(e)}')
+			raise LLMException(401, 'LLM API call failed') from e
+		if message is None:
+			raise LLMException(401, 'LLM API call returned no response')
+
+		if output_parser is None:
+			message.content = self._remove_think_tags(str(message.content))
+			return {'raw': message, 'parsed': None}
+		return await output_parser.ainvoke({'raw': message})
+
+	@staticmethod
+	def _get_stream_chunk_text(chunk: BaseMessageChunk, message: BaseMessageChunk) -> str:
+		"""Get the streamed JSON text of a chunk, either the first tool call's arguments or the message content"""
+		if tool_call_chunks := getattr(chunk, 'tool_call_chunks', None):
+			# message is the merged stream so far, its first tool call chunk tells us the index of the first tool call
+			first_index = message.tool_call_chunks[0].get('index')  # type: ignore
+			return ''.join(tc.get('args') or '' for tc in tool_call_chunks if tc.get('index') == first_index)
+		if isinstance(chunk.content, str):
+			return chunk.content
+		return ''.join(block.get('text', '') for block in chunk.content if isinstance(block, dict))
+
+	def _dispatch_early_action(self, action_json: dict) -> None:
+		"""Validate the first streamed action and start executing it while the rest of the response is still streaming"""
+		action_model = get_args(self.AgentOutput.model_fields['action'].annotation)[0]
+		try:
+			action = action_model.model_validate(action_json)
+		except ValidationError as e:
+			logger.debug(f'Streamed first action is not valid, waiting for the full response: {e}')
+			return
+		action_data = action.model_dump(exclude_unset=True)
+		if not action_data:
+			return
+
+		async def execute_early_action() -> ActionResult:
+			await self._raise_if_stopped_or_paused()
+			await self.browser_session.remove_highlights()
+			return await self._act(action)
+
+		logger.debug(f'⚡ Starting {next(iter(action_data))} while the LLM is still responding')
+		self._early_action = (action, asyncio.create_task(execute_early_action()))
+
+	def _reconcile_early_action(self, model_output: AgentOutput) -> None:
+		"""Make sure the history records the streamed first action that was actually executed"""
+		if self._early_action is None:
+			return
+		action = self._early_action[0]
+		final_first_action = model_output.action[0].model_dump(exclude_unset=True) if model_output.action else None
+		if final_first_action != action.model_dump(exclude_unset=True):
+			logger.warning('⚠️ Final LLM output does not start with the already executed streamed action, keeping it first')
+			model_output.action = [action, *model_output.action[1:]]
+
+	async def _discard_early_action(self) -> None:
+		"""Wait for a streamed action whose step failed before multi_act, so the next step starts from a settled page"""
+		action, task = self._early_action  # type: ignore
+		self._early_action = None
+		try:
+			await task
+		except Exception as e:
+			logger.debug(f'Streamed action {action.model_dump(exclude_unset=True)} failed: {type(e).__name__}: {e}')
+		else:
+			logger.warning(f'⚠️ Streamed action {action.model_dump(exclude_unset=True)} was executed but its step failed')
+
+	async def _act(self, action: ActionModel) -> ActionResult:
+		return await self.controller.act(
+			action=action,
+			browser_session=self.browser_session,
+			page_extraction_llm=self.settings.page_extraction_llm,
+			sensitive_data=self.sensitive_data,
+			available_file_paths=self.settings.available_file_paths,
+			context=self.context,
+		)
+
 	def _log_agent_run(self) -> None:
 		"""Log the agent run"""
 		logger.info(f'🚀 Starting task: {self.task}')
@@ -1165,7 +1355,12 @@ class Agent(Generic[Context]):
 		status_parts = [part for part in [success_indicator, failure_indicator] if part]
 		status_str = ' | '.join(status_parts) if status_parts else '✅ 0'
 
-		logger.info(f'📍 Step {self.state.n_steps}: Ran {action_count} actions in {step_duration:.2f}s: {status_str}')
+		cache_str = ''
+		if self._prompt_cache_usage:
+			cached_tokens, uncached_tokens = self._prompt_cache_usage
+			cache_str = f' | 💾 {cached_tokens} cached + {uncached_tokens} uncached input tokens'
+
+		logger.info(f'📍 Step {self.state.n_steps}: Ran {action_count} actions in {step_duration:.2f}s: {status_str}{cache_str}')
 
 	def _log_llm_call_info(self, input_messages: list[BaseMessage], method: str) -> None:
 		"""Log comprehensive information about the LLM call being made"""
@@ -1297,6 +1492,7 @@ class Agent(Generic[Context]):
 			exit_on_second_int=True,
 		)
 		signal_handler.register()
+		settle_saved_before = self.browser_session.settle_stats.saved_seconds
 
 		try:
 			self._log_agent_run()
@@ -1392,6 +1588,10 @@ class Agent(Generic[Context]):
 				# ADDED: Info message when custom telemetry for SIGINT was already logged
 				logger.info('Telemetry for force exit (SIGINT) was logged by custom exit callback.')
 
+			settle_saved = self.browser_session.settle_stats.saved_seconds - settle_saved_before
+			if settle_saved >= 0.05:
+				logger.info(f'⏱️ Settle detection saved {settle_saved:.1f}s of waiting between actions this run')
+
 			if self.settings.save_playwright_script_path:
 				logger.info(
 					f'Agent run finished. Attempting to save Playwright script to: {self.settings.save_playwright_script_path}'
@@ -1434,7 +1634,8 @@ class Agent(Generic[Context]):
 		await self.browser_session.remove_highlights()
 
 		for i, action in enumerate(actions):
-			if action.get_index() is not None and i != 0:
+			# a full state capture is only needed when the cheap in-page change signal says the page changed
+			if action.get_index() is not None and i != 0 and await self.browser_session.page_changed_since_state_summary():
 				new_browser_state_summary = await self.browser_session.get_state_summary(cache_clickable_elements_hashes=False)
 				new_selector_map = new_browser_state_summary.selector_map
 
@@ -1458,16 +1659,13 @@ class Agent(Generic[Context]):
 					break
 
 			try:
-				await self._raise_if_stopped_or_paused()
-
-				result = await self.controller.act(
-					action=action,
-					browser_session=self.browser_session,
-					page_extraction_llm=self.settings.page_extraction_llm,
-					sensitive_data=self.sensitive_data,
-					available_file_paths=self.settings.available_file_paths,
-					context=self.context,
-				)
+				if i == 0 and self._early_action is not None:
+					# already started while the LLM response was streaming (stream_actions=True)
+					result = await self._early_action[1]
+					self._early_action = None
+				else:
+					await self._raise_if_stopped_or_paused()
+					result = await self._act(action)
 
 				results.append(result)
 
@@ -1478,8 +1676,8 @@ class Agent(Generic[Context]):
 				if results[-1].is_done or results[-1].error or i == len(actions) - 1:
 					break
 
-				await asyncio.sleep(self.browser_profile.wait_between_actions)
-				# hash all elements. if it is a subset of cached_state its fine - else break (new elements on page)
+				# returns as soon as the page is settled, wait_between_actions is the maximum
+				await self.browser_session.wait_for_page_settle()
 
 			except asyncio.CancelledError:
 				# Gracefully handle task cancellation
@@ -1827,6 +2025,9 @@ class Agent(Generic[Context]):
 	async def close(self):
 		"""Close all resources"""
 		try:
+			if self._message_manager.settings.compaction_policy is not None:
+				self._message_manager.settings.compaction_policy.cancel()
+
 			# First close browser resources
 			await self.browser_session.stop()
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import traceback
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
@@ -63,6 +64,8 @@ class AgentSettings(BaseModel):
 		'aria-expanded',
 	]
 	max_actions_per_step: int = 10
+	stream_actions: bool = False  # stream the LLM response and start the first action as soon as it is complete
+	prompt_caching: bool = False  # keep the message prefix byte-stable between steps + add provider cache breakpoints
 
 	tool_calling_method: ToolCallingMethod | None = 'auto'
 	page_extraction_llm: BaseChatModel | None = None
@@ -120,6 +123,9 @@ class StepMetadata(BaseModel):
 	step_end_time: float
 	input_tokens: int  # Approximate tokens from message manager for this step
 	step_number: int
+	# input tokens served from / not served from the provider's prompt cache, from the LLM response usage metadata
+	cached_input_tokens: int | None = None
+	uncached_input_tokens: int | None = None
 
 	@property
 	def duration_seconds(self) -> float:
@@ -162,8 +168,9 @@ class AgentOutput(BaseModel):
 	)
 
 	@staticmethod
+	@lru_cache(maxsize=128)  # bounded, ActionModels of other registries/controllers in the process aren't kept forever
 	def type_with_custom_actions(custom_actions: type[ActionModel]) -> type[AgentOutput]:
-		"""Extend actions with custom actions"""
+		"""Extend actions with custom actions (cached per ActionModel, the registry reuses ActionModels per action set)"""
 		model_ = create_model(
 			'AgentOutput',
 			__base__=AgentOutput,
@@ -248,6 +255,12 @@ class AgentHistoryList(BaseModel):
 		"""Get token usage for each step"""
 		return [h.metadata.input_tokens for h in self.history if h.metadata]
 
+	def prompt_cache_usage(self) -> tuple[int, int]:
+		"""Get the (cached, uncached) input tokens across all steps, as reported by the LLM provider"""
+		cached = sum(h.metadata.cached_input_tokens or 0 for h in self.history if h.metadata)
+		uncached = sum(h.metadata.uncached_input_tokens or 0 for h in self.history if h.metadata)
+		return cached, uncached
+
 	def __str__(self) -> str:
 		"""Representation of the AgentHistoryList object"""
 		return f'AgentHistoryList(all_results={self.action_results()}, all_model_outputs={self.model_actions()})'
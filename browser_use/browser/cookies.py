@@ -0,0 +1,111 @@
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from browser_use.browser.views import CookiePersistenceStats
+
+if sys.platform == 'win32':
+	import msvcrt
+else:
+	import fcntl
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def _exclusive_file_lock(lock_path: Path) -> Iterator[None]:
+	"""Hold an exclusive lock on lock_path, shared between processes (e.g. several agents saving to the same cookies_file)"""
+	with open(lock_path, 'a+') as lock_file:
+		if sys.platform == 'win32':
+			msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+		else:
+			fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+		try:
+			yield
+		finally:
+			if sys.platform == 'win32':
+				lock_file.seek(0)
+				msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+			else:
+				fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def write_cookies_file(path: Path, cookies: list[dict[str, Any]]) -> None:
+	"""Atomically replace path with the given cookies, readers never see a half-written file"""
+	path.parent.mkdir(parents=True, exist_ok=True)
+	with _exclusive_file_lock(path.with_name(f'{path.name}.lock')):
+		fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+		try:
+			with os.fdopen(fd, 'w') as tmp_file:
+				json.dump(cookies, tmp_file, indent=4)
+				tmp_file.flush()
+				os.fsync(tmp_file.fileno())
+			os.replace(tmp_path, path)
+		except BaseException:
+			Path(tmp_path).unlink(missing_ok=True)
+			raise
+
+
+class CookiePersistence:
+	"""
+	Persists a BrowserContext's cookies to BrowserProfile(cookies_file=...) without rewriting the file every step:
+		- save requests within debounce_seconds of each other are coalesced into one write
+		- the cookies are compared to the last written set and the write is skipped if nothing changed
+		- the file is replaced atomically (temp file + rename) under a cross-process lock
+	"""
+
+	def __init__(
+		self,
+		path: Path,
+		get_cookies: Callable[[], Awaitable[list[dict[str, Any]]]],
+		debounce_seconds: float = 2.0,
+	):
+		self.path = path
+		self.get_cookies = get_cookies
+		self.debounce_seconds = debounce_seconds
+		self.stats = CookiePersistenceStats()
+
+		self._last_written: str | None = None
+		self._flush_task: asyncio.Task | None = None
+		self._write_lock = asyncio.Lock()
+
+	def schedule_save(self) -> None:
+		"""Request a save, the cookies are only read + written once the debounce window has passed"""
+		self.stats.save_requests += 1
+		if self._flush_task and not self._flush_task.done():
+			self.stats.coalesced += 1
+			return
+		self._flush_task = asyncio.create_task(self._flush_after_debounce())
+
+	async def _flush_after_debounce(self) -> None:
+		await asyncio.sleep(self.debounce_seconds)
+		try:
+			await self.flush()
+		except Exception as e:
+			logger.warning(f'⚠️ Failed to save cookies to {self.path}: {type(e).__name__}: {e}')
+
+	async def flush(self) -> None:
+		"""Write the current cookies now if they changed since the last write (call before the BrowserContext closes)"""
+		if self._flush_task and not self._flush_task.done() and self._flush_task is not asyncio.current_task():
+			self._flush_task.cancel()  # this flush supersedes the pending debounced one
+
+		async with self._write_lock:
+			cookies = await self.get_cookies()
+			# canonical form so that cookie order changes alone don't count as a change
+			serialized = json.dumps(
+				sorted(cookies, key=lambda c: (c.get('domain', ''), c.get('path', ''), c.get('name', ''))), sort_keys=True
+			)
+			if serialized == self._last_written:
+				self.stats.unchanged += 1
+				return
+			await asyncio.to_thread(write_cookies_file, self.path, cookies)
+			self._last_written = serialized
+			self.stats.writes += 1
+			logger.debug(f'🍪 Saved {len(cookies)} cookies to {self.path}')
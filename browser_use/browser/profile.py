@@ -117,6 +117,14 @@ CHROME_DETERMINISTIC_RENDERING_ARGS = [
 	'--force-color-profile=srgb',
 ]
 
+CHROME_BACKGROUND_TAB_ARGS = [
+	# already part of CHROME_DEFAULT_ARGS, disable_background_throttling=True also drops them from ignore_default_args
+	# (playwright filters ignore_default_args out of the final args, including the ones passed explicitly in args)
+	'--disable-background-timer-throttling',
+	'--disable-backgrounding-occluded-windows',
+	'--disable-renderer-backgrounding',
+]
+
 CHROME_DEFAULT_ARGS = [
 	# provided by playwright by default: https://github.com/microsoft/playwright/blob/41008eeddd020e2dee1c540f7c0cdfa337e99637/packages/playwright-core/src/server/chromium/chromiumSwitches.ts#L76
 	# we don't need to include them twice in our own config, but it's harmless
@@ -296,6 +304,28 @@ class RecordHarMode(str, Enum):
 	MINIMAL = 'minimal'
 
 
+class ResourceClass(str, Enum):
+	"""Classes of subresource requests that BrowserProfile(blocked_resource_classes=[...]) can block or stub out"""
+
+	ADS = 'ads'
+	ANALYTICS = 'analytics'
+	FONTS = 'fonts'
+	MEDIA = 'media'  # video + audio
+	IMAGES = 'images'
+
+
+class InputTextStrategy(str, Enum):
+	"""How BrowserSession enters text into editable elements for the input_text action"""
+
+	AUTO = 'auto'  # try the fastest strategies first and remember which one worked per domain (opt-in, see below)
+	FILL = 'fill'  # native playwright fill(), sets the value in one call
+	INSERT_TEXT = 'insert_text'  # CDP Input.insertText, like pasting/IME commit, fires input events but no key events
+	TYPE = 'type'  # per-character key events, slow but needed by sites that listen for keydown/keyup
+
+	# AUTO accepts a strategy once the text reads back from the element, it can't tell if the page also needed the key
+	# events (autocomplete, key-driven widgets), so TYPE stays the default
+
+
 class BrowserChannel(str, Enum):
 	CHROMIUM = 'chromium'
 	CHROME = 'chrome'
@@ -553,11 +583,19 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 	# custom options we provide that aren't native playwright kwargs
 	disable_security: bool = Field(default=False, description='Disable browser security features.')
 	deterministic_rendering: bool = Field(default=False, description='Enable deterministic rendering flags.')
+	disable_background_throttling: bool = Field(
+		default=False,
+		description='Keep background tabs running at full speed (launch flags, even if listed in ignore_default_args, + CDP focus emulation on every tab), for agents working in several tabs at once.',
+	)
 	allowed_domains: list[str] | None = Field(
 		default=None,
 		description='List of allowed domains for navigation e.g. ["*.google.com", "https://example.com", "chrome-extension://*"]',
 	)
 	keep_alive: bool | None = Field(default=None, description='Keep browser alive after agent run.')
+	isolate_agent_tabs: bool = Field(
+		default=False,
+		description='Give each Agent sharing this browser session its own tabs + state caches, instead of all agents driving the same foreground tab.',
+	)
 	window_size: ViewportSize | None = Field(
 		default=None,
 		description='Window size to use for the browser when headless=False.',
@@ -576,17 +614,92 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 	wait_for_network_idle_page_load_time: float = Field(default=0.5, description='Time to wait for network idle.')
 	maximum_wait_page_load_time: float = Field(default=5.0, description='Maximum time to wait for page load.')
 	wait_between_actions: float = Field(default=0.5, description='Time to wait between actions.')
+	adaptive_wait_between_actions: bool = Field(
+		default=True,
+		description='End the wait between actions early once the page is settled (no DOM mutations, pending requests, running animations or layout shifts), wait_between_actions is then only the maximum.',
+	)
+	settle_quiet_time: float = Field(
+		default=0.1, description='How long the page has to stay quiet after an action to count as settled.'
+	)
 
 	# --- UI/viewport/DOM ---
 	include_dynamic_attributes: bool = Field(default=True, description='Include dynamic attributes in selectors.')
 	highlight_elements: bool = Field(default=True, description='Highlight interactive elements on the page.')
 	viewport_expansion: int = Field(default=500, description='Viewport expansion in pixels for LLM context.')
+	input_text_strategy: InputTextStrategy = Field(
+		default=InputTextStrategy.TYPE,
+		description='How input_text enters text: "type" (per-character key events), "fill", "insert_text" (CDP), or "auto" to learn the fastest one whose text lands in the element per domain (faster, but sites that need key events may ignore the text).',
+	)
+	cdp_element_actions: bool = Field(
+		default=False,
+		description='Click/type into elements via their CDP backend node id instead of re-resolving css selectors (falls back to selectors on failure).',
+	)
+	report_scroll_containers: bool = Field(
+		default=False,
+		description='Give inner scroll containers (feeds, chat panes, side panels) a highlight index + their scroll extents, so scroll_down/scroll_up can scroll them by index.',
+	)
+
+	# --- Crash recovery ---
+	crash_recovery: bool = Field(
+		default=True,
+		description='Relaunch/reconnect the browser if it crashes or disconnects, and restore its cookies, open tabs, and the current tab.',
+	)
+	max_crash_recoveries: int = Field(default=3, description='Stop recovering after this many browser crashes in one session.')
+	heartbeat_interval: float = Field(
+		default=10.0,
+		description='Seconds between background browser liveness checks (which also snapshot cookies for crash recovery), 0 to disable.',
+	)
+
+	# --- Tab reaping ---
+	tab_reaper_interval: float = Field(
+		default=0,
+		description='Seconds between sampling the memory/CPU use of every tab (shown on TabInfo) and reaping background tabs over the limits below, 0 to disable.',
+	)
+	max_idle_tab_seconds: float | None = Field(
+		default=None, description='Reap background tabs with no navigation or agent activity for this many seconds.'
+	)
+	max_tab_memory_mb: float | None = Field(
+		default=None, description='Reap background tabs whose JS heap grows beyond this size.'
+	)
+	max_background_tabs: int | None = Field(
+		default=None, description='Reap the least recently used background tabs beyond this many (discarded tabs do not count).'
+	)
+	tab_reaper_action: Literal['close', 'discard'] = Field(
+		default='discard',
+		description='"close" reaped tabs, or "discard" them: unload the page but keep the tab + its url, so switching back to it reloads it.',
+	)
+
+	# --- Resource blocking ---
+	blocked_resource_classes: list[ResourceClass] = Field(
+		default_factory=list,
+		description='Block/stub these classes of subresources to save bandwidth + page load time e.g. ["ads", "analytics", "fonts", "media", "images"] (note: request routing disables the browser http cache).',
+	)
+	blocked_url_patterns: list[str] = Field(
+		default_factory=list,
+		description='Extra URL glob patterns to block e.g. ["*://*.somecdn.com/*.js"], applied on top of blocked_resource_classes.',
+	)
+	resource_policy_overrides: dict[str, list[ResourceClass]] = Field(
+		default_factory=dict,
+		description='Per-domain replacement for blocked_resource_classes, keyed by domain pattern of the page making the request e.g. {"*.google.com": ["ads"], "*.figma.com": []}.',
+	)
 
 	profile_directory: str = 'Default'  # e.g. 'Profile 1', 'Profile 2', 'Custom Profile', etc.
 
 	save_recording_path: str | None = Field(default=None, description='Directory for video recordings.')
 	save_downloads_path: str | None = Field(default=None, description='Directory for saving downloads.')
 	save_har_path: str | None = Field(default=None, description='Directory for saving HAR files.')
+	replay_har_path: str | None = Field(
+		default=None,
+		description='HAR file (e.g. recorded with record_har_path=...) to serve matching requests from instead of the network.',
+	)
+	replay_har_not_found: Literal['abort', 'fallback'] = Field(
+		default='abort',
+		description='Requests missing from replay_har_path are either aborted (fully offline runs) or fall back to the network.',
+	)
+	replay_har_url_filter: str | Pattern | None = Field(
+		default=None,
+		description='Only serve requests whose URL matches this glob/regex from replay_har_path, others always go to the network.',
+	)
 	trace_path: str | None = Field(default=None, description='Directory for saving trace files.')
 
 	cookies_file: str | None = Field(default=None, description='File to save cookies to.')
@@ -622,12 +735,19 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 			self.window_size['height'] = (self.window_size or {}).get('height') or self.window_height or 1100
 		return self
 
+	def get_ignore_default_args(self) -> list[str] | Literal[True]:
+		"""Return ignore_default_args, minus the background throttling flags when disable_background_throttling=True."""
+		if self.disable_background_throttling and isinstance(self.ignore_default_args, list):
+			return [arg for arg in self.ignore_default_args if arg not in CHROME_BACKGROUND_TAB_ARGS]
+		return self.ignore_default_args
+
 	def get_args(self) -> list[str]:
-		if isinstance(self.ignore_default_args, list):
-			default_args = set(CHROME_DEFAULT_ARGS) - set(self.ignore_default_args)
-		elif self.ignore_default_args is True:
+		ignore_default_args = self.get_ignore_default_args()
+		if isinstance(ignore_default_args, list):
+			default_args = set(CHROME_DEFAULT_ARGS) - set(ignore_default_args)
+		elif ignore_default_args is True:
 			default_args = []
-		elif not self.ignore_default_args:
+		elif not ignore_default_args:
 			default_args = CHROME_DEFAULT_ARGS
 
 		return BrowserLaunchArgs.args_as_list(  # convert back to ['--arg=value', '--arg', '--arg=value', ...]
@@ -640,6 +760,7 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 					*(CHROME_HEADLESS_ARGS if self.headless else []),
 					*(CHROME_DISABLE_SECURITY_ARGS if self.disable_security else []),
 					*(CHROME_DETERMINISTIC_RENDERING_ARGS if self.deterministic_rendering else []),
+					*(CHROME_BACKGROUND_TAB_ARGS if self.disable_background_throttling else []),
 					*(
 						[f'--window-size={self.window_size["height"]},{self.window_size["width"]}']
 						if self.window_size
@@ -656,7 +777,11 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 
 	def kwargs_for_launch_persistent_context(self) -> BrowserLaunchPersistentContextArgs:
 		"""Return the kwargs for BrowserType.launch()."""
-		return BrowserLaunchPersistentContextArgs(**self.model_dump(exclude={'args'}), args=self.get_args())
+		return BrowserLaunchPersistentContextArgs(
+			**self.model_dump(exclude={'args', 'ignore_default_args'}),
+			args=self.get_args(),
+			ignore_default_args=self.get_ignore_default_args(),
+		)
 
 	def kwargs_for_new_context(self) -> BrowserNewContextArgs:
 		"""Return the kwargs for BrowserContext.new_context()."""
@@ -668,7 +793,11 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 
 	def kwargs_for_launch(self) -> BrowserLaunchArgs:
 		"""Return the kwargs for BrowserType.connect_over_cdp()."""
-		return BrowserLaunchArgs(**self.model_dump(exclude={'args'}), args=self.get_args())
+		return BrowserLaunchArgs(
+			**self.model_dump(exclude={'args', 'ignore_default_args'}),
+			args=self.get_args(),
+			ignore_default_args=self.get_ignore_default_args(),
+		)
 
 	def prepare_user_data_dir(self) -> None:
 		"""Create and unlock the user data dir for first-run initialization."""
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import base64
-import json
 import logging
 import os
 import re
 import time
-from dataclasses import dataclass
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
 from functools import wraps
 from pathlib import Path
 from typing import Any, Self
@@ -17,19 +18,38 @@ import psutil
 from patchright.async_api import Playwright as PatchrightPlaywright
 from playwright.async_api import Browser as PlaywrightBrowser
 from playwright.async_api import BrowserContext as PlaywrightBrowserContext
-from playwright.async_api import ElementHandle, FrameLocator, Page, Playwright, async_playwright
+from playwright.async_api import (
+	CDPSession,
+	Download,
+	ElementHandle,
+	FrameLocator,
+	Page,
+	Playwright,
+	Request,
+	Route,
+	async_playwright,
+)
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field, InstanceOf, PrivateAttr, model_validator
 
-from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.cookies import CookiePersistence, write_cookies_file
+from browser_use.browser.profile import BrowserProfile, InputTextStrategy, ResourceClass
 from browser_use.browser.views import (
 	BrowserError,
+	BrowserHealthStats,
 	BrowserStateSummary,
+	ChangeDetectionStats,
+	CookiePersistenceStats,
+	ElementHandleCacheStats,
+	PageChangeSignal,
+	ResourceBlockingStats,
+	SettleStats,
 	TabInfo,
+	TabReaperStats,
 	URLNotAllowedError,
 )
 from browser_use.dom.clickable_element_processor.service import ClickableElementProcessor
-from browser_use.dom.service import DomService
-from browser_use.dom.views import DOMElementNode, SelectorMap
+from browser_use.dom.service import PAGE_PROBE_JS, DomService
+from browser_use.dom.views import DOMElementNode, PageProbe, SelectorMap
 from browser_use.utils import match_url_with_domain_pattern, time_execution_async, time_execution_sync
 
 # Check if running in Docker
@@ -66,6 +86,261 @@ def _log_pretty_path(path: Path) -> str:
 	return str(path or '').replace(str(Path.home()), '~').replace(str(Path.cwd().resolve()), '.')
 
 
+# well-known ad + analytics providers, matched against the request hostname and each of its parent domains
+RESOURCE_CLASS_HOSTNAMES: dict[ResourceClass, frozenset[str]] = {
+	ResourceClass.ADS: frozenset(
+		{
+			'doubleclick.net',
+			'googlesyndication.com',
+			'googleadservices.com',
+			'adservice.google.com',
+			'amazon-adsystem.com',
+			'adnxs.com',
+			'adsrvr.org',
+			'criteo.com',
+			'criteo.net',
+			'pubmatic.com',
+			'rubiconproject.com',
+			'openx.net',
+			'taboola.com',
+			'outbrain.com',
+			'moatads.com',
+			'adform.net',
+			'casalemedia.com',
+			'media.net',
+		}
+	),
+	ResourceClass.ANALYTICS: frozenset(
+		{
+			'google-analytics.com',
+			'googletagmanager.com',
+			'analytics.google.com',
+			'segment.io',
+			'segment.com',
+			'mixpanel.com',
+			'amplitude.com',
+			'heapanalytics.com',
+			'hotjar.com',
+			'fullstory.com',
+			'clarity.ms',
+			'scorecardresearch.com',
+			'quantserve.com',
+			'chartbeat.com',
+			'nr-data.net',
+			'connect.facebook.net',
+			'bat.bing.com',
+		}
+	),
+}
+RESOURCE_CLASS_PLAYWRIGHT_TYPES: dict[ResourceClass, str] = {
+	ResourceClass.FONTS: 'font',
+	ResourceClass.MEDIA: 'media',
+	ResourceClass.IMAGES: 'image',
+}
+RESOURCE_CLASS_EXTENSIONS: dict[ResourceClass, tuple[str, ...]] = {
+	ResourceClass.FONTS: ('.woff', '.woff2', '.ttf', '.otf', '.eot'),
+	ResourceClass.MEDIA: ('.mp4', '.webm', '.m3u8', '.mpd', '.mp3', '.ogg', '.mov'),
+}
+# rough median transfer sizes, only used to estimate the bandwidth saved (a blocked response is never downloaded so its real size is unknown)
+RESOURCE_CLASS_TYPICAL_BYTES: dict[ResourceClass | None, int] = {
+	ResourceClass.ADS: 40_000,
+	ResourceClass.ANALYTICS: 30_000,
+	ResourceClass.FONTS: 30_000,
+	ResourceClass.MEDIA: 1_000_000,
+	ResourceClass.IMAGES: 50_000,
+	None: 20_000,
+}
+# stub responses for blocked images/scripts, so that onload/onerror handlers on the page don't break or retry forever
+STUB_IMAGE_GIF = base64.b64decode('R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7')
+
+
+# checks that a cached ElementHandle is still attached at the same xpath it was extracted from (same algorithm as buildDomTree.js)
+ELEMENT_HANDLE_XPATH_CHECK_JS = """
+	(element, expectedXpath) => {
+		if (!element.isConnected) return false;
+		const segments = [];
+		let current = element;
+		while (current && current.nodeType === Node.ELEMENT_NODE) {
+			if (current.parentNode instanceof ShadowRoot || current.parentNode instanceof HTMLIFrameElement) break;
+			const tagName = current.nodeName.toLowerCase();
+			const siblings = current.parentElement
+				? Array.from(current.parentElement.children).filter((sib) => sib.nodeName.toLowerCase() === tagName)
+				: [current];
+			segments.unshift(siblings.length > 1 ? `${tagName}[${siblings.indexOf(current) + 1}]` : tagName);
+			current = current.parentNode;
+		}
+		return segments.join('/') === expectedXpath;
+	}
+"""
+
+
+# everything _input_text_element_node needs to know about an element, fetched in one round-trip
+ELEMENT_INPUT_PROPERTIES_JS = """
+	(el) => ({
+		tagName: el.tagName.toLowerCase(),
+		isContentEditable: el.isContentEditable,
+		readOnly: !!el.readOnly,
+		disabled: !!el.disabled,
+	})
+"""
+ELEMENT_INPUT_VALUE_JS = '(el) => (el.isContentEditable ? el.innerText : el.value) ?? ""'
+ELEMENT_INPUT_CLEAR_JS = 'el => {el.textContent = ""; el.value = "";}'
+
+# Find the best match for a piece of text in one pass over all text nodes (incl. shadow roots + same-origin iframes),
+# ranked by visibility then by how exactly the containing element's text matches, and scroll it into view
+SCROLL_TO_TEXT_JS = """(needle) => {
+	const normalize = (s) => s.replace(/\\s+/g, ' ').trim().toLowerCase();
+	const query = normalize(needle);
+	if (!query) return null;
+	const SKIPPED_TAGS = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE', 'HEAD']);
+	const checked = new Set();
+	let best = null;
+
+	const consider = (element, frameDepth) => {
+		checked.add(element);
+		const text = normalize(element.textContent || '');
+		if (!text.includes(query)) return false;
+		const rect = element.getBoundingClientRect();
+		const visible = rect.width > 0 && rect.height > 0 && (element.checkVisibility?.({ visibilityProperty: true }) ?? true);
+		const score = (visible ? 2 : 0) + query.length / text.length;  // visible first, then the tightest match
+		if (!best || score > best.score) best = { element, score, visible, frameDepth };
+		return true;
+	};
+
+	// text split across inline siblings (<b>Total</b> <i>price</i>) only matches the textContent of a common ancestor,
+	// so climb until an element matches (ancestors that were already checked were climbed past before)
+	const considerWithAncestors = (element, frameDepth) => {
+		for (let el = element; el && !checked.has(el); el = el.parentElement) {
+			if (consider(el, frameDepth)) return;
+		}
+	};
+
+	const search = (root, frameDepth) => {
+		const walker = (root.ownerDocument || root).createTreeWalker(root, NodeFilter.SHOW_ELEMENT | NodeFilter.SHOW_TEXT, {
+			acceptNode: (node) => (SKIPPED_TAGS.has(node.nodeName) ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT),
+		});
+		for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+			if (node.nodeType === Node.TEXT_NODE) {
+				if (node.parentElement && node.nodeValue.trim()) considerWithAncestors(node.parentElement, frameDepth);
+				continue;
+			}
+			if (node.shadowRoot) search(node.shadowRoot, frameDepth);
+			if (node.nodeName === 'IFRAME' || node.nodeName === 'FRAME') {
+				try {
+					if (node.contentDocument?.body) search(node.contentDocument.body, frameDepth + 1);
+				} catch (e) {}  // cross-origin frame
+			}
+		}
+	};
+	search(document.body || document.documentElement, 0);
+
+	if (!best || !best.visible) return null;
+	best.element.scrollIntoView({ block: 'center', inline: 'nearest', behavior: 'instant' });
+	const rect = best.element.getBoundingClientRect();
+	return {
+		tag: best.element.tagName.toLowerCase(),
+		text: normalize(best.element.textContent).slice(0, 100),
+		x: Math.round(rect.x),
+		y: Math.round(rect.y),
+		frameDepth: best.frameDepth,
+	};
+}"""
+
+# Cheap change signal for the interactive elements of a page: a MutationObserver and a scroll/resize listener bump a
+# counter, and the digest of the interactive elements is only recomputed when the counter moved since the last call.
+# Text changes and attribute-only changes (e.g. our own highlight ids, class toggles) don't change the digest.
+PAGE_CHANGE_SIGNAL_JS = """() => {
+	let state = window.__browserUseChangeSignal;
+	if (!state) {
+		state = window.__browserUseChangeSignal = {
+			documentId: Math.random().toString(36).slice(2),
+			counter: 0,
+			digestCounter: -1,
+			digest: 0,
+			opaque: false,
+			lastActivity: performance.now(),  // last DOM mutation, scroll, resize or layout shift, see PAGE_SETTLE_PROBE_JS
+		};
+		const bump = () => { state.counter++; state.lastActivity = performance.now(); };
+		state.observer = new MutationObserver(bump);
+		state.observer.observe(document, { subtree: true, childList: true, attributes: true });
+		window.addEventListener('scroll', bump, { capture: true, passive: true });
+		window.addEventListener('resize', bump, { passive: true });
+		state.textObserver = new MutationObserver(() => { state.lastActivity = performance.now(); });
+		state.textObserver.observe(document, { subtree: true, characterData: true });
+		try {
+			new PerformanceObserver((list) => {
+				if (list.getEntries().some((entry) => !entry.hadRecentInput)) state.lastActivity = performance.now();
+			}).observe({ type: 'layout-shift' });
+		} catch (e) {}
+	}
+	if (state.observer.takeRecords().length) bump();
+
+	if (state.digestCounter !== state.counter) {
+		const INTERACTIVE = 'a[href], button, input, select, textarea, summary, details, label, [onclick], [contenteditable], '
+			+ '[tabindex]:not([tabindex="-1"]), [role=button], [role=link], [role=checkbox], [role=radio], [role=tab], '
+			+ '[role=menuitem], [role=option], [role=combobox], [role=switch], [role=textbox]';
+		let hash = 2166136261;
+		const add = (text) => {
+			for (let i = 0; i < text.length; i++) hash = Math.imul(hash ^ text.charCodeAt(i), 16777619);
+		};
+		let opaque = false;
+		const elements = document.getElementsByTagName('*');
+		for (const el of elements) {
+			if (el.shadowRoot || ((el.tagName === 'IFRAME' || el.tagName === 'FRAME') && el.contentDocument)) opaque = true;
+			if (!el.matches(INTERACTIVE)) continue;
+			const rect = el.getBoundingClientRect();
+			const visible = rect.width > 0 && rect.height > 0;
+			const inViewport = rect.bottom > 0 && rect.top < innerHeight && rect.right > 0 && rect.left < innerWidth;
+			add(`${el.tagName}|${el.id}|${el.getAttribute('name')}|${el.getAttribute('type')}|${el.getAttribute('role')}|`
+				+ `${el.disabled}|${visible}|${inViewport};`);
+		}
+		// the highlight overlay added by the DOM extraction doesn't count
+		const highlights = document.getElementById('playwright-highlight-container');
+		add(String(elements.length - (highlights ? highlights.getElementsByTagName('*').length + 1 : 0)));
+		state.digest = hash >>> 0;
+		state.opaque = opaque;
+		state.digestCounter = state.counter;
+	}
+	return { documentId: state.documentId, digest: state.digest, opaque: state.opaque };
+}"""
+
+# reads the activity timestamps kept by PAGE_CHANGE_SIGNAL_JS, null until the change signal was taken on this document
+PAGE_SETTLE_PROBE_JS = """() => {
+	const state = window.__browserUseChangeSignal;
+	if (!state) return null;
+	if (state.observer.takeRecords().length) { state.counter++; state.lastActivity = performance.now(); }
+	if (state.textObserver.takeRecords().length) state.lastActivity = performance.now();
+	// infinite animations (spinners, carousels) never finish, only finite running ones count as unsettled
+	const animations = document.getAnimations ? document.getAnimations().filter((animation) => {
+		if (animation.playState !== 'running' || !animation.effect) return false;
+		return Number.isFinite(animation.effect.getComputedTiming().endTime);
+	}).length : 0;
+	return { quietFor: (performance.now() - state.lastActivity) / 1000, animations };
+}"""
+
+# requests a page may still be waiting on to render the result of an action (not images, media, beacons, websockets...)
+SETTLE_RESOURCE_TYPES = {'document', 'fetch', 'xhr', 'script', 'stylesheet'}
+
+HEARTBEAT_TIMEOUT = 5  # seconds a liveness check may take before the browser counts as unresponsive
+
+
+def _classify_request(url: str, resource_type: str) -> set[ResourceClass]:
+	"""Return every ResourceClass a subresource request falls into, e.g. an image from an ad host is both ads and images"""
+	resource_classes = set()
+	hostname = (urlparse(url).hostname or '').lower()
+	parts = hostname.split('.')
+	parent_domains = {'.'.join(parts[i:]) for i in range(len(parts) - 1)}
+	for resource_class, hostnames in RESOURCE_CLASS_HOSTNAMES.items():
+		if not parent_domains.isdisjoint(hostnames):
+			resource_classes.add(resource_class)
+
+	path = urlparse(url).path.lower()
+	for resource_class, playwright_type in RESOURCE_CLASS_PLAYWRIGHT_TYPES.items():
+		if resource_type == playwright_type or path.endswith(RESOURCE_CLASS_EXTENSIONS.get(resource_class, ())):
+			resource_classes.add(resource_class)
+	return resource_classes
+
+
 def require_initialization(func):
 	"""decorator for BrowserSession methods to require the BrowserSession be already active"""
 
@@ -74,7 +349,8 @@ def require_initialization(func):
 		if not self.initialized:
 			raise RuntimeError('BrowserSession(...).start() must be called first to launch or connect to the browser')
 		if not self.agent_current_page or self.agent_current_page.is_closed():
-			self.agent_current_page = self.browser_context.pages[0] if self.browser_context.pages else None
+			pages = self._visible_pages()
+			self.agent_current_page = pages[0] if pages else None
 
 		if not self.agent_current_page or self.agent_current_page.is_closed():
 			self.create_new_tab()
@@ -90,6 +366,18 @@ def require_initialization(func):
 
 DEFAULT_BROWSER_PROFILE = BrowserProfile()
 
+# private attrs that every BrowserSession.tab_view() keeps for itself, all others are shared with the root session
+TAB_VIEW_PRIVATE_ATTRS = (
+	'_cached_browser_state_summary',
+	'_cached_clickable_element_hashes',
+	'_root_session',
+	'_owned_pages',
+	'_recovery_snapshot',
+	'_tab_reaper_task',
+	'_tab_reaper_last_run',
+	'_state_change_signal',
+)
+
 
 @dataclass
 class CachedClickableElementHashes:
@@ -101,6 +389,68 @@ class CachedClickableElementHashes:
 	hashes: set[str]
 
 
+@dataclass
+class TabRecord:
+	"""
+	Last known url/title of a tab, kept up-to-date from playwright page events + CDP target events
+	so that get_tabs_info() never has to round-trip to the browser
+	"""
+
+	url: str
+	title: str = ''
+	target_id: str | None = None  # CDP targetId, used to match Target.targetInfoChanged events to this tab
+	opener: Page | None = None  # page that opened this tab as a popup
+	title_stale: bool = True  # url changed since the title was last read
+	title_refreshing: bool = False  # a background page.title() is already in flight
+	unresponsive: bool = False  # page crashed or the last page.title() timed out
+	crashed: bool = False  # renderer process of the tab crashed, the page can only be replaced
+	last_active: float = field(default_factory=time.monotonic)  # last navigation or agent step on this tab
+	js_heap_bytes: int | None = None  # resource usage at the last tab reaper sample
+	cpu_seconds: float | None = None
+	metrics_enabled: bool = False  # CDP Performance domain is enabled for this tab
+	discarded_url: str | None = None  # set while the tab is unloaded by the tab reaper, reloaded when switched back to
+	discarded_title: str = ''
+
+
+@dataclass
+class RecoverySnapshot:
+	"""
+	Tabs a BrowserSession had open after its last successful step, used to put them back after a browser crash
+	"""
+
+	tab_urls: list[str]
+	current_tab_index: int = 0
+
+
+class TabLock:
+	"""
+	asyncio.Lock that the task holding it can acquire again, so an action running under the tab lock can still call
+	get_state_summary() (which takes the same lock) without deadlocking. Other tasks/agents wait as with a plain Lock.
+	"""
+
+	def __init__(self):
+		self._lock = asyncio.Lock()
+		self._owner: asyncio.Task | None = None
+		self._depth = 0
+
+	def locked(self) -> bool:
+		return self._lock.locked()
+
+	async def __aenter__(self) -> TabLock:
+		task = asyncio.current_task()
+		if task is None or self._owner is not task:
+			await self._lock.acquire()
+			self._owner = task
+		self._depth += 1
+		return self
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+		self._depth -= 1
+		if self._depth == 0:
+			self._owner = None
+			self._lock.release()
+
+
 class BrowserSession(BaseModel):
 	"""
 	Represents an active browser session with a running browser process somewhere.
@@ -181,6 +531,36 @@ class BrowserSession(BaseModel):
 
 	_cached_browser_state_summary: BrowserStateSummary | None = PrivateAttr(default=None)
 	_cached_clickable_element_hashes: CachedClickableElementHashes | None = PrivateAttr(default=None)
+	_tab_records: dict[Page, TabRecord] = PrivateAttr(default_factory=dict)
+	_tab_registry_context: PlaywrightBrowserContext | None = PrivateAttr(default=None)
+	_resource_policy_context: PlaywrightBrowserContext | None = PrivateAttr(default=None)
+	_har_replay_context: PlaywrightBrowserContext | None = PrivateAttr(default=None)
+	_element_handle_cache: dict[Page, dict[tuple[str, ...], ElementHandle]] = PrivateAttr(default_factory=dict)
+	_element_handle_cache_stats: ElementHandleCacheStats = PrivateAttr(default_factory=ElementHandleCacheStats)
+	_cdp_sessions: dict[Page, CDPSession] = PrivateAttr(default_factory=dict)
+	_input_text_strategy_by_domain: dict[str, InputTextStrategy] = PrivateAttr(default_factory=dict)
+	_downloads_in_progress: dict[asyncio.Task, str] = PrivateAttr(default_factory=dict)  # save task -> reserved filename
+	_finished_downloads: dict[Page, list[str]] = PrivateAttr(default_factory=dict)  # page that started the download -> paths
+	_cookie_persistence: CookiePersistence | None = PrivateAttr(default=None)
+	_resource_blocking_stats: ResourceBlockingStats = PrivateAttr(default_factory=ResourceBlockingStats)
+	_page_locks: dict[Page | None, TabLock] = PrivateAttr(default_factory=dict)
+	_start_lock: asyncio.Lock = PrivateAttr(default_factory=asyncio.Lock)
+	_root_session: BrowserSession | None = PrivateAttr(default=None)  # set on tab views created by .tab_view()
+	_owned_pages: list[Page] | None = PrivateAttr(default=None)  # tabs a tab view can see, None = every tab in the context
+	_launched_browser: bool = PrivateAttr(default=False)  # True if we launched the browser ourselves (so we can relaunch it)
+	_crash_reason: str | None = PrivateAttr(default=None)  # set when a crash/disconnect is detected, cleared by .recover()
+	_health_context: PlaywrightBrowserContext | None = PrivateAttr(default=None)
+	_heartbeat_task: asyncio.Task | None = PrivateAttr(default=None)
+	_recovery_cookies: list[dict[str, Any]] = PrivateAttr(default_factory=list)
+	_recovery_snapshot: RecoverySnapshot | None = PrivateAttr(default=None)
+	_health_stats: BrowserHealthStats = PrivateAttr(default_factory=BrowserHealthStats)
+	_tab_reaper_task: asyncio.Task | None = PrivateAttr(default=None)
+	_tab_reaper_last_run: float = PrivateAttr(default=0)
+	_tab_reaper_stats: TabReaperStats = PrivateAttr(default_factory=TabReaperStats)
+	_state_change_signal: tuple[Page, PageChangeSignal] | None = PrivateAttr(default=None)  # taken with the last state summary
+	_change_detection_stats: ChangeDetectionStats = PrivateAttr(default_factory=ChangeDetectionStats)
+	_pending_requests: dict[Page, dict[Request, float]] = PrivateAttr(default_factory=dict)  # in-flight requests per tab
+	_settle_stats: SettleStats = PrivateAttr(default_factory=SettleStats)
 
 	@model_validator(mode='after')
 	def apply_session_overrides_to_profile(self) -> Self:
@@ -225,6 +605,9 @@ class BrowserSession(BaseModel):
 			7. playwright=Playwright object, will use its chromium instance to launch a new browser
 		"""
 
+		if self._root_session:
+			return await self._start_tab_view()
+
 		# apply last-minute runtime-computed options to the the browser_profile, validate profile, set up folders on disk
 		assert isinstance(self.browser_profile, BrowserProfile)
 		self.browser_profile.prepare_user_data_dir()  # create/unlock the <user_data_dir>/SingletonLock
@@ -239,10 +622,14 @@ class BrowserSession(BaseModel):
 		await self.setup_browser_via_cdp_url()
 		await self.setup_new_browser_context()  # creates a new context in existing browser or launches a new persistent context
 		assert self.browser_context, f'Failed to connect to or create a new BrowserContext for browser={self.browser}'
+		await self._setup_har_replay()  # must come before the resource policy so blocked requests are never served from the HAR
+		await self._setup_resource_policy()
 
 		# resize the existing pages and set up foreground tab detection
 		await self._setup_viewports()
 		await self._setup_current_page_change_listeners()
+		await self._setup_tab_registry()
+		self._setup_health_monitor()
 
 		self.initialized = True
 
@@ -253,6 +640,47 @@ class BrowserSession(BaseModel):
 
 		self.initialized = False
 
+		if self._root_session:
+			# tab views only close their own tabs, the shared browser is shut down by the session they were created from
+			if not self.browser_profile.keep_alive:
+				for page in self._visible_pages():
+					try:
+						await page.close()
+					except Exception as e:
+						logger.debug(f'❌ Error closing tab of shared BrowserSession: {type(e).__name__}: {e}')
+			self.agent_current_page = self.human_current_page = None
+			return
+
+		if self._heartbeat_task:
+			self._heartbeat_task.cancel()
+			self._heartbeat_task = None
+
+		if self.cookie_persistence and self.browser_context:
+			# write any cookie changes still waiting on the debounce timer while the context is still open to read them
+			try:
+				await self.cookie_persistence.flush()
+			except Exception as e:
+				logger.warning(f'⚠️ Failed to save cookies on stop: {type(e).__name__}: {e}')
+
+		if self._downloads_in_progress:
+			# don't cut off downloads that are still streaming to disk when the browser closes
+			logger.info(f'⬇️  Waiting for {len(self._downloads_in_progress)} downloads to finish saving...')
+			await asyncio.wait(list(self._downloads_in_progress), timeout=30)
+
+		stats = self._resource_blocking_stats
+		if stats.total_blocked_requests:
+			logger.info(
+				f'🚫 Blocked {stats.total_blocked_requests} requests this session '
+				f'(~{stats.estimated_bytes_saved / 1_000_000:.1f}MB saved): {stats.blocked_requests}'
+			)
+
+		settle_stats = self._settle_stats
+		if settle_stats.early_returns:
+			logger.info(
+				f'⏱️ Settle detection saved {settle_stats.saved_seconds:.1f}s of the {settle_stats.ceiling_seconds:.1f}s '
+				f'wait_between_actions ceiling ({settle_stats.early_returns}/{settle_stats.waits} waits ended early)'
+			)
+
 		if self.browser_profile.keep_alive:
 			return  # nothing to do if keep_alive=True, leave the browser running
 
@@ -277,6 +705,58 @@ class BrowserSession(BaseModel):
 				if 'NoSuchProcess' not in type(e).__name__:
 					logger.debug(f'❌ Error terminating subprocess with browser_pid={self.browser_pid}: {type(e).__name__}: {e}')
 
+	def tab_view(self) -> Self:
+		"""
+		Get a copy of this session for one of several agents sharing the same browser.
+
+		The browser, BrowserContext, tab registry, and cookie/download/element caches stay shared, but the view
+		only sees (and switches between) the tabs it opened itself plus any popups they opened, gets its own
+		state caches, and its .stop() only closes its own tabs.
+		"""
+		root = self._root_session or self
+		view = root.model_copy(update={'agent_current_page': None, 'human_current_page': None})
+		view._root_session = root
+		view._owned_pages = []
+		view._cached_browser_state_summary = None
+		view._cached_clickable_element_hashes = None
+		return view
+
+	async def _start_tab_view(self) -> Self:
+		"""Start (or wait for) the shared root session, then pick up the browser objects + shared state it set up"""
+		root = self._root_session
+		assert root is not None, 'Only tab views created by .tab_view() share a root session'
+		async with root._start_lock:  # several agents may start at the same time, only launch the browser once
+			if not root.initialized:
+				await root.start()
+
+		for field_name in ('playwright', 'browser', 'browser_context', 'browser_pid', 'cdp_url', 'wss_url'):
+			setattr(self, field_name, getattr(root, field_name))
+		for attr_name, value in root.__pydantic_private__.items():
+			if attr_name not in TAB_VIEW_PRIVATE_ATTRS:
+				setattr(self, attr_name, value)
+
+		self.initialized = True
+		return self
+
+	def _visible_pages(self) -> list[Page]:
+		"""Tabs this session can see + switch between: every tab in the context, or only its own tabs for a tab view"""
+		if not self.browser_context:
+			return []
+		if self._owned_pages is None:
+			return list(self.browser_context.pages)
+		for page in self.browser_context.pages:
+			record = self._tab_records.get(page)
+			if record and record.opener in self._owned_pages and page not in self._owned_pages:
+				self._owned_pages.append(page)  # popups opened from one of our tabs are ours too
+		return [page for page in self._owned_pages if not page.is_closed()]
+
+	def tab_lock(self, page: Page | None = None) -> TabLock:
+		"""Lock that serializes state extraction + actions on a tab (defaults to the agent's current tab) between agents"""
+		page = page or self.agent_current_page
+		if page not in self._page_locks:
+			self._page_locks[page] = TabLock()
+		return self._page_locks[page]
+
 	async def close(self) -> None:
 		"""Deprecated: Provides backwards-compatibility with old class method Browser().close()"""
 		await self.stop()
@@ -396,6 +876,7 @@ class BrowserSession(BaseModel):
 
 		# if we still have no browser_context by now, launch a new local one using launch_persistent_context()
 		if not self.browser_context:
+			self._launched_browser = True
 			logger.info(
 				f'🌎 Launching local browser '
 				f'driver={str(type(self.playwright).__module__).split(".")[0]} channel={self.browser_profile.channel.name.lower()} '
@@ -597,6 +1078,520 @@ class BrowserSession(BaseModel):
 					f'⚠️ Failed to add visibility listener to existing tab, is it crashed or ignoring CDP commands?: [{page_idx}]{page.url}: {type(e).__name__}: {e}'
 				)
 
+	@property
+	def resource_blocking_stats(self) -> ResourceBlockingStats:
+		"""Requests blocked by the resource policy so far, and a rough estimate of the bytes saved"""
+		return self._resource_blocking_stats
+
+	@property
+	def element_handle_cache_stats(self) -> ElementHandleCacheStats:
+		"""Hit/miss counters for the ElementHandle cache used by get_locate_element()"""
+		return self._element_handle_cache_stats
+
+	async def _setup_har_replay(self) -> None:
+		"""Serve requests from a previously recorded HAR file instead of the network, for deterministic offline runs"""
+		assert self.browser_context is not None, 'BrowserContext object is not set'
+		profile = self.browser_profile
+		if not profile.replay_har_path or self._har_replay_context is self.browser_context:
+			return
+		self._har_replay_context = self.browser_context
+
+		await self.browser_context.route_from_har(  # raises FileNotFoundError if the HAR file is missing
+			profile.replay_har_path,
+			url=profile.replay_har_url_filter,
+			not_found=profile.replay_har_not_found,
+		)
+		logger.info(
+			f'📼 Replaying network responses from {_log_pretty_path(profile.replay_har_path)} '
+			f'(missing entries: {"aborted" if profile.replay_har_not_found == "abort" else "fetched from the network"})'
+		)
+
+	async def _setup_resource_policy(self) -> None:
+		"""Route subresource requests through the profile's resource blocking policy (only when one is configured)"""
+		assert self.browser_context is not None, 'BrowserContext object is not set'
+		profile = self.browser_profile
+		if not (profile.blocked_resource_classes or profile.blocked_url_patterns or profile.resource_policy_overrides):
+			return  # routing adds an IPC hop to every request and disables the http cache, so don't pay for it unless asked
+		if self._resource_policy_context is self.browser_context:
+			return  # route is already registered on this context
+		self._resource_policy_context = self.browser_context
+
+		await self.browser_context.route('**/*', self._route_resource_policy)
+		logger.debug(
+			f'🚫 Blocking resource_classes={[c.value for c in profile.blocked_resource_classes]} '
+			f'url_patterns={profile.blocked_url_patterns} overrides={list(profile.resource_policy_overrides)}'
+		)
+
+	def _blocked_resource_classes_for(self, request: Request) -> list[ResourceClass]:
+		"""Get the resource classes to block for a request, taking per-domain overrides for the requesting page into account"""
+		overrides = self.browser_profile.resource_policy_overrides
+		if overrides:
+			try:
+				page_url = request.frame.page.url
+			except Exception:
+				page_url = ''  # service worker requests have no frame
+			for domain_pattern, resource_classes in overrides.items():
+				if page_url and match_url_with_domain_pattern(page_url, domain_pattern):
+					return resource_classes
+		return self.browser_profile.blocked_resource_classes
+
+	async def _route_resource_policy(self, route: Route, request: Request) -> None:
+		"""Block or stub a request if it's covered by the resource policy, otherwise pass it on to the next route handler"""
+		if request.resource_type == 'document' or request.url.startswith(('data:', 'blob:')):
+			await route.fallback()  # never block navigations, only the subresources they load
+			return
+
+		# blocked if any of its classes is blocked, counted under the first of them (in ResourceClass order)
+		blocked_classes = _classify_request(request.url, request.resource_type)
+		blocked_classes.intersection_update(self._blocked_resource_classes_for(request))
+		resource_class = next((c for c in ResourceClass if c in blocked_classes), None)
+		if resource_class:
+			reason = resource_class.value
+		elif any(fnmatch(request.url, pattern) for pattern in self.browser_profile.blocked_url_patterns):
+			reason = 'url_pattern'
+		else:
+			await route.fallback()
+			return
+
+		stats = self._resource_blocking_stats
+		stats.blocked_requests[reason] = stats.blocked_requests.get(reason, 0) + 1
+		stats.estimated_bytes_saved += RESOURCE_CLASS_TYPICAL_BYTES[resource_class]
+
+		try:
+			if request.resource_type == 'image':
+				await route.fulfill(status=200, content_type='image/gif', body=STUB_IMAGE_GIF)
+			elif request.resource_type == 'script':
+				await route.fulfill(status=200, content_type='application/javascript', body='')
+			else:
+				await route.abort('blockedbyclient')
+		except Exception as e:
+			# page/context closed while the request was in flight
+			logger.debug(f'⚠️ Failed to block request {_log_pretty_url(request.url, 60)}: {type(e).__name__}: {e}')
+
+	async def _setup_tab_registry(self) -> None:
+		"""Track the url/title of every tab from page events, so get_tabs_info() is a pure in-memory read every step"""
+		assert self.browser_context is not None, 'BrowserContext object is not set'
+		if self._tab_registry_context is self.browser_context:
+			return  # listeners are already attached to this context
+		self._tab_registry_context = self.browser_context
+		self._tab_records = {}
+
+		self.browser_context.on('page', self._register_tab)
+		for page in self.browser_context.pages:
+			self._register_tab(page)
+
+		# CDP pushes title/url changes for every tab (e.g. title set by JS after load) without us polling for them
+		try:
+			if self.browser:
+				cdp_session = await self.browser.new_browser_cdp_session()
+			else:
+				cdp_session = await self.browser_context.new_cdp_session(self.browser_context.pages[0])
+			cdp_session.on('Target.targetInfoChanged', self._on_target_info_changed)
+			await cdp_session.send('Target.setDiscoverTargets', {'discover': True})
+		except Exception as e:
+			# not a chromium browser, or the page we attached to is gone, page events alone still keep the registry correct
+			logger.debug(
+				f'⚠️ Failed to subscribe to CDP target events, tab titles will only update on page load: {type(e).__name__}: {e}'
+			)
+
+	def _register_tab(self, page: Page, opener: Page | None = None) -> TabRecord:
+		"""Start tracking a tab, called from the BrowserContext 'page' event or lazily for tabs we haven't seen yet"""
+		if page in self._tab_records:
+			record = self._tab_records[page]
+			record.opener = record.opener or opener
+			return record
+
+		record = self._tab_records[page] = TabRecord(url=page.url, opener=opener)
+		if page.is_closed():
+			return record
+
+		def on_framenavigated(frame) -> None:
+			if frame != page.main_frame:
+				return
+			# every ElementHandle on the old document is dead after a navigation
+			if self._element_handle_cache.pop(page, None):
+				self._element_handle_cache_stats.invalidations += 1
+			record.last_active = time.monotonic()
+			if frame.url != record.url:
+				record.url = frame.url
+				record.title_stale = True
+
+		def on_close(_) -> None:
+			self._tab_records.pop(page, None)
+			self._element_handle_cache.pop(page, None)
+			self._cdp_sessions.pop(page, None)
+			self._page_locks.pop(page, None)
+
+		page.on('framenavigated', on_framenavigated)
+		page.on('domcontentloaded', lambda _: self._schedule_tab_title_refresh(page))
+		page.on('load', lambda _: self._schedule_tab_title_refresh(page))
+		page.on('popup', lambda popup: self._register_tab(popup, opener=page))
+		page.on('crash', lambda _: self._on_tab_crashed(page, record))
+		page.on('close', on_close)
+		if self.browser_profile.save_downloads_path:
+			page.on('download', self._on_download)
+		if self.browser_profile.disable_background_throttling:
+			asyncio.create_task(self._disable_background_throttling(page))
+
+		self._schedule_tab_title_refresh(page)
+		asyncio.create_task(self._resolve_tab_target_id(page, record))
+		return record
+
+	def _on_download(self, download: Download) -> None:
+		"""Stream a download to save_downloads_path in the background, so the click that triggered it never waits on it"""
+		task = asyncio.create_task(self._save_download(download))
+		self._downloads_in_progress[task] = download.suggested_filename
+		task.add_done_callback(lambda _: self._downloads_in_progress.pop(task, None))
+
+	async def _save_download(self, download: Download) -> None:
+		assert self.browser_profile.save_downloads_path, 'save_downloads_path is not set'
+		directory = self.browser_profile.save_downloads_path
+		current_task = asyncio.current_task()
+		reserved = [name for task, name in self._downloads_in_progress.items() if task is not current_task]
+		unique_filename = await self._get_unique_filename(directory, download.suggested_filename, reserved=reserved)
+		if current_task in self._downloads_in_progress:
+			self._downloads_in_progress[current_task] = unique_filename
+		download_path = os.path.join(directory, unique_filename)
+		try:
+			await download.save_as(download_path)
+		except Exception as e:
+			logger.warning(f'⚠️ Failed to save download {download.url} to {download_path}: {type(e).__name__}: {e}')
+			return
+		self._finished_downloads.setdefault(download.page, []).append(download_path)
+		logger.debug(f'⬇️  Download finished. Saved file to: {download_path}')
+
+	def pop_finished_downloads(self) -> list[str]:
+		"""Get the paths of downloads that finished saving since the last call (only ones started from our own tabs for a tab view)"""
+		finished_downloads = self._finished_downloads
+		if not finished_downloads:  # nothing to report after most actions
+			return []
+		pages = list(finished_downloads) if self._owned_pages is None else self._owned_pages
+		return [path for page in pages for path in finished_downloads.pop(page, [])]
+
+	def _schedule_tab_title_refresh(self, page: Page) -> None:
+		"""Re-read a tab's title in the background, never blocks the caller"""
+		record = self._tab_records.get(page)
+		if record is None or record.title_refreshing or page.is_closed():
+			return
+		record.title_refreshing = True
+		asyncio.create_task(self._refresh_tab_title(page, record))
+
+	async def _refresh_tab_title(self, page: Page, record: TabRecord) -> None:
+		try:
+			record.title = await asyncio.wait_for(page.title(), timeout=1)
+			record.url = page.url
+			record.title_stale = False
+			record.unresponsive = False
+		except TimeoutError:
+			# page.title() can hang forever on tabs that are crashed/disappeared/about:blank
+			# we dont want to try automating those tabs because they will hang the whole script
+			logger.debug(f'⚠  Tab stopped responding to page.title(), marking it as unresponsive: {page.url}')
+			record.unresponsive = True
+		except Exception:
+			pass  # page closed or navigated mid-call, the next load event will retry
+		finally:
+			record.title_refreshing = False
+
+	async def _disable_background_throttling(self, page: Page) -> None:
+		"""Make a tab behave as if it were focused + in the foreground, so it loads/settles at full speed behind other tabs"""
+		try:
+			cdp_session = await self.get_cdp_session(page)
+			await cdp_session.send('Emulation.setFocusEmulationEnabled', {'enabled': True})
+			await cdp_session.send('Page.setWebLifecycleState', {'state': 'active'})  # never freeze the tab
+		except Exception as e:
+			# not a chromium browser or the tab closed already, the launch flags still apply
+			logger.debug(
+				f'⚠️ Failed to disable background throttling for tab {_log_pretty_url(page.url)}: {type(e).__name__}: {e}'
+			)
+
+	def _on_tab_crashed(self, page: Page, record: TabRecord) -> None:
+		record.unresponsive = record.crashed = True
+		logger.warning(f'💥 Tab crashed: {_log_pretty_url(record.url)}')
+
+	# --- Crash detection + recovery ---
+	def _setup_health_monitor(self) -> None:
+		"""Notice browser crashes + dropped connections from browser/context events, and from a periodic heartbeat"""
+		assert self.browser_context is not None, 'BrowserContext object is not set'
+		if self._health_context is self.browser_context:
+			return  # listeners are already attached to this context
+		self._health_context = self.browser_context
+		self._crash_reason = None
+
+		if self.browser:
+			self.browser.on('disconnected', lambda browser: self._on_browser_crashed('browser disconnected', browser))
+		self.browser_context.on('close', lambda context: self._on_browser_crashed('browser context closed', context))
+
+		if self.browser_profile.heartbeat_interval and (self._heartbeat_task is None or self._heartbeat_task.done()):
+			self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+	def _on_browser_crashed(self, reason: str, source: object = None) -> None:
+		if not self.initialized or self._crash_reason:
+			return  # closed by .stop(), or already reported
+		if source is not None and source is not self.browser and source is not self.browser_context:
+			return  # late event from a browser we already replaced
+		self._crash_reason = reason
+		self._health_stats.crashes += 1
+		logger.warning(f'💥 Browser crash detected: {reason}')
+
+	async def _is_browser_alive(self) -> bool:
+		"""Round-trip to the browser process itself (not to any page, a single hung tab shouldn't count as a crash)"""
+		if not self.browser_context or (self.browser and not self.browser.is_connected()):
+			return False
+		try:
+			self._recovery_cookies = await asyncio.wait_for(self.browser_context.cookies(), timeout=HEARTBEAT_TIMEOUT)
+			return True
+		except Exception:
+			return False
+
+	async def _heartbeat_loop(self) -> None:
+		"""Check the browser still responds every heartbeat_interval, snapshotting its cookies for .recover() as we go"""
+		missed_heartbeats = 0
+		while True:
+			await asyncio.sleep(self.browser_profile.heartbeat_interval)
+			if not self.initialized or self._crash_reason:
+				continue
+			if await self._is_browser_alive():
+				missed_heartbeats = 0
+				continue
+			missed_heartbeats += 1
+			self._health_stats.heartbeat_failures += 1
+			if missed_heartbeats >= 2:  # one slow response under heavy load is not a crash
+				self._on_browser_crashed(f'no response to {missed_heartbeats} heartbeats')
+
+	@property
+	def crash_reason(self) -> str | None:
+		"""Why the (shared) browser is considered crashed, None while it is healthy"""
+		return (self._root_session or self)._crash_reason
+
+	@property
+	def can_recover(self) -> bool:
+		"""Whether .recover() is allowed to relaunch/reconnect the browser (again)"""
+		root = self._root_session or self
+		stats = root._health_stats
+		return (
+			self.browser_profile.crash_recovery
+			and (
+				root._launched_browser or bool(root.cdp_url or root.wss_url)
+			)  # user-provided playwright objects can't be relaunched
+			and stats.recoveries + stats.failed_recoveries < self.browser_profile.max_crash_recoveries
+		)
+
+	@property
+	def health_stats(self) -> BrowserHealthStats:
+		"""Crashes detected + recovered from over the lifetime of the (shared) browser"""
+		return (self._root_session or self)._health_stats
+
+	async def detect_crash(self) -> bool:
+		"""Check whether the browser or the agent's current tab has crashed, without waiting for the next heartbeat"""
+		root = self._root_session or self
+		if root._crash_reason or (self.initialized and self.browser_context is not root.browser_context):
+			return True
+		if root.initialized and not await root._is_browser_alive():
+			root._on_browser_crashed('browser stopped responding')
+			return True
+		record = self.agent_current_page and self._tab_records.get(self.agent_current_page)
+		return bool(record and record.crashed)
+
+	async def recover(self) -> None:
+		"""
+		Bring the session back after a crash: relaunch/reconnect the browser if it died (once for all tab views
+		sharing it), restore cookies + the tabs open at the last step + the current tab, and replace a crashed current tab.
+		"""
+		root = self._root_session or self
+		async with root._start_lock:
+			if root._crash_reason:
+				await root._relaunch_after_crash()
+
+		if self.browser_context is not root.browser_context:
+			# a tab view of a relaunched browser: pick up the new browser objects and reopen our own tabs
+			await self._start_tab_view()
+			self._owned_pages = []
+			self.agent_current_page = self.human_current_page = None
+			await self._restore_tabs()
+
+		page = self.agent_current_page
+		record = page and self._tab_records.get(page)
+		if page and record and record.crashed:
+			logger.warning(f'♻️ Reopening crashed tab in a new tab: {_log_pretty_url(record.url)}')
+			await self.create_new_tab(None if record.url == 'about:blank' else record.url)
+			await page.close()
+
+	async def _relaunch_after_crash(self) -> None:
+		reason = self._crash_reason
+		if not self.can_recover:
+			raise BrowserError(f'Browser closed: crashed ({reason}) and crash recovery is disabled or exhausted')
+
+		logger.warning(f'♻️ Browser crashed ({reason}), relaunching + restoring its tabs...')
+		if self._launched_browser and self.browser_pid:
+			try:
+				psutil.Process(pid=self.browser_pid).kill()  # make sure a hung browser frees up its user_data_dir
+			except Exception:
+				pass
+			self.browser_pid = None
+
+		# forget every object that belonged to the dead browser so that start() launches/reconnects from scratch
+		self.initialized = False
+		self.browser = self.browser_context = None
+		self.agent_current_page = self.human_current_page = None
+		self._cached_browser_state_summary = None
+		self._cached_clickable_element_hashes = None
+		self._element_handle_cache.clear()
+		self._cdp_sessions.clear()
+		self._page_locks.clear()
+		try:
+			await self.start()
+			if self._recovery_cookies:
+				await self.browser_context.add_cookies(self._recovery_cookies)
+			await self._restore_tabs()
+		except Exception as e:
+			self._health_stats.failed_recoveries += 1
+			raise BrowserError(f'Browser closed: failed to relaunch after a crash ({reason}): {type(e).__name__}: {e}') from e
+		self._health_stats.recoveries += 1
+		logger.info(f'✅ Recovered from browser crash ({reason}) with {len(self._recovery_cookies)} cookies restored')
+
+	async def _restore_tabs(self) -> None:
+		"""Reopen the tabs from the last recovery snapshot and focus the one the agent was on"""
+		snapshot = self._recovery_snapshot
+		if not snapshot:
+			return
+		for url in snapshot.tab_urls:
+			try:
+				await self.create_new_tab(None if url == 'about:blank' else url)
+				self.health_stats.tabs_restored += 1
+			except Exception as e:
+				logger.warning(f'⚠️ Failed to restore tab {_log_pretty_url(url)} after crash: {type(e).__name__}: {e}')
+		if snapshot.current_tab_index < len(self._visible_pages()):
+			await self.switch_to_tab(snapshot.current_tab_index)
+
+	def _update_recovery_snapshot(self, page: Page) -> None:
+		pages = self._visible_pages()
+		self._recovery_snapshot = RecoverySnapshot(
+			tab_urls=[self._tab_url(tab) for tab in pages],
+			current_tab_index=pages.index(page) if page in pages else 0,
+		)
+
+	def _tab_url(self, page: Page) -> str:
+		"""Url of a tab, including tabs that are currently discarded by the tab reaper"""
+		record = self._tab_records.get(page)
+		return (record and record.discarded_url) or page.url
+
+	# --- Tab resource sampling + reaping ---
+	@property
+	def tab_reaper_stats(self) -> TabReaperStats:
+		"""Tabs sampled + closed/discarded by the tab reaper over the lifetime of the (shared) browser"""
+		return (self._root_session or self)._tab_reaper_stats
+
+	def _schedule_tab_reaper(self) -> None:
+		"""Sample + reap our tabs in the background at most once per tab_reaper_interval, never blocks the step"""
+		interval = self.browser_profile.tab_reaper_interval
+		if not interval or time.monotonic() - self._tab_reaper_last_run < interval:
+			return
+		if self._tab_reaper_task and not self._tab_reaper_task.done():
+			return
+		self._tab_reaper_last_run = time.monotonic()
+		self._tab_reaper_task = asyncio.create_task(self._sample_and_reap_tabs())
+
+	async def _sample_and_reap_tabs(self) -> None:
+		pages = self._visible_pages()
+		await asyncio.gather(*(self._sample_tab(page) for page in pages))
+		try:
+			await self._reap_tabs(pages)
+		except Exception as e:
+			logger.debug(f'⚠️ Tab reaper failed: {type(e).__name__}: {e}')
+
+	async def _sample_tab(self, page: Page) -> None:
+		"""Read the JS heap size + main thread CPU time of a tab from CDP Performance.getMetrics"""
+		record = self._tab_records.get(page)
+		if record is None or record.discarded_url or page.is_closed():
+			return
+		try:
+			cdp_session = await self.get_cdp_session(page)
+			if not record.metrics_enabled:
+				await cdp_session.send('Performance.enable')
+				record.metrics_enabled = True
+			response = await asyncio.wait_for(cdp_session.send('Performance.getMetrics'), timeout=2)
+		except Exception as e:
+			# not a chromium browser, or the tab is busy/closing, keep the last sample
+			logger.debug(f'⚠️ Failed to sample tab resource usage {_log_pretty_url(page.url)}: {type(e).__name__}: {e}')
+			return
+		metrics = {metric['name']: metric['value'] for metric in response['metrics']}
+		record.js_heap_bytes = int(metrics.get('JSHeapUsedSize', 0))
+		record.cpu_seconds = metrics.get('TaskDuration')
+		self.tab_reaper_stats.samples += 1
+
+	async def _reap_tabs(self, pages: list[Page]) -> None:
+		"""Close/discard background tabs that are idle, too big, or beyond max_background_tabs (never the current tabs)"""
+		profile = self.browser_profile
+		now = time.monotonic()
+		background_tabs = [
+			(page, record)
+			for page in pages
+			if page not in (self.agent_current_page, self.human_current_page)
+			and not page.is_closed()
+			and (record := self._tab_records.get(page))
+			and not record.discarded_url
+		]
+		background_tabs.sort(key=lambda tab: tab[1].last_active)  # least recently used first
+		over_limit = len(background_tabs) - profile.max_background_tabs if profile.max_background_tabs is not None else 0
+
+		for i, (page, record) in enumerate(background_tabs):
+			if i < over_limit:
+				reason = f'more than {profile.max_background_tabs} background tabs'
+			elif profile.max_idle_tab_seconds is not None and now - record.last_active > profile.max_idle_tab_seconds:
+				reason = f'idle for {now - record.last_active:.0f}s'
+			elif profile.max_tab_memory_mb is not None and (record.js_heap_bytes or 0) > profile.max_tab_memory_mb * 1_000_000:
+				reason = f'using {(record.js_heap_bytes or 0) / 1_000_000:.0f}MB of JS heap'
+			else:
+				continue
+			await self._reap_tab(page, record, reason)
+
+	async def _reap_tab(self, page: Page, record: TabRecord, reason: str) -> None:
+		async with self.tab_lock(page):
+			if page in (self.agent_current_page, self.human_current_page) or page.is_closed():
+				return  # the agent switched to this tab while we were waiting for it
+			stats = self.tab_reaper_stats
+			stats.reclaimed_js_heap_bytes += record.js_heap_bytes or 0
+			url, record.js_heap_bytes, record.cpu_seconds = page.url, None, None
+			if self.browser_profile.tab_reaper_action == 'discard':
+				record.discarded_url, record.discarded_title = url, record.title
+				await page.goto('about:blank')
+				stats.tabs_discarded += 1
+			else:
+				await page.close()
+				stats.tabs_closed += 1
+		logger.info(f'🧹 Reaped background tab {_log_pretty_url(url)} ({self.browser_profile.tab_reaper_action}, {reason})')
+
+	async def _restore_discarded_tab(self, page: Page) -> None:
+		"""Reload a tab that was discarded by the tab reaper, called when the agent switches back to it"""
+		record = self._tab_records.get(page)
+		if not record or not record.discarded_url:
+			return
+		url, record.discarded_url = record.discarded_url, None
+		await page.goto(url, wait_until='domcontentloaded')
+		self.tab_reaper_stats.tabs_restored += 1
+
+	async def _resolve_tab_target_id(self, page: Page, record: TabRecord) -> None:
+		"""Look up the CDP targetId of a tab so that Target.targetInfoChanged events can be matched to it"""
+		try:
+			cdp_session = await page.context.new_cdp_session(page)
+			target_info = await cdp_session.send('Target.getTargetInfo')
+			record.target_id = target_info['targetInfo']['targetId']
+			await cdp_session.detach()
+		except Exception:
+			pass  # non-chromium browser or page already closed
+
+	def _on_target_info_changed(self, event: dict[str, Any]) -> None:
+		target_info = event.get('targetInfo') or {}
+		if target_info.get('type') != 'page':
+			return
+		for record in self._tab_records.values():
+			if record.target_id and record.target_id == target_info.get('targetId'):
+				record.url = target_info.get('url', record.url)
+				record.title = target_info.get('title', record.title)
+				record.title_stale = False
+				record.unresponsive = False
+				return
+
 	async def _setup_viewports(self) -> None:
 		"""Resize any existing page viewports to match the configured size"""
 
@@ -736,12 +1731,14 @@ class BrowserSession(BaseModel):
 		self.agent_current_page = self.agent_current_page or self.human_current_page or None
 		self.human_current_page = self.human_current_page or self.agent_current_page or None
 
-		# if both are still None, fallback to using the first open tab we can find
+		# if both are still None, fallback to using the first open tab we can find (tab views never borrow another agent's tab)
 		if self.agent_current_page is None:
-			if self.browser_context.pages:
-				first_available_tab = self.browser_context.pages[0]
+			pages = self._visible_pages()
+			if pages:
+				first_available_tab = pages[0]
 				self.agent_current_page = first_available_tab
 				self.human_current_page = first_available_tab
+				await self._restore_discarded_tab(first_available_tab)
 			else:
 				# if all tabs are closed, open a new one
 				new_tab = await self.create_new_tab()
@@ -755,9 +1752,7 @@ class BrowserSession(BaseModel):
 
 	@property
 	def tabs(self) -> list[Page]:
-		if not self.browser_context:
-			return []
-		return list(self.browser_context.pages)
+		return self._visible_pages()
 
 	@require_initialization
 	async def new_tab(self, url: str | None = None) -> Page:
@@ -765,11 +1760,12 @@ class BrowserSession(BaseModel):
 
 	@require_initialization
 	async def switch_tab(self, tab_index: int) -> Page:
-		pages = self.browser_context.pages
+		pages = self._visible_pages()
 		if not pages or tab_index >= len(pages):
 			raise IndexError('Tab index out of range')
 		page = pages[tab_index]
 		self.agent_current_page = page
+		await self._restore_discarded_tab(page)
 
 		return page
 
@@ -817,7 +1813,7 @@ class BrowserSession(BaseModel):
 		return selector_map.get(index)
 
 	@time_execution_async('--click_element_node')
-	async def _click_element_node(self, element_node: DOMElementNode) -> str | None:
+	async def _click_element_node(self, element_node: DOMElementNode) -> None:
 		"""
 		Optimized method to click an element using xpath.
 		"""
@@ -827,39 +1823,28 @@ class BrowserSession(BaseModel):
 			# if element_node.highlight_index is not None:
 			# 	await self._update_state(focus_element=element_node.highlight_index)
 
-			element_handle = await self.get_locate_element(element_node)
-
-			if element_handle is None:
-				raise Exception(f'Element: {repr(element_node)} not found')
-
 			async def perform_click(click_func):
-				"""Performs the actual click, handling both download
-				and navigation scenarios."""
-				if self.browser_profile.save_downloads_path:
-					try:
-						# Try short-timeout expect_download to detect a file download has been been triggered
-						async with page.expect_download(timeout=5000) as download_info:
-							await click_func()
-						download = await download_info.value
-						# Determine file path
-						suggested_filename = download.suggested_filename
-						unique_filename = await self._get_unique_filename(
-							self.browser_profile.save_downloads_path, suggested_filename
-						)
-						download_path = os.path.join(self.browser_profile.save_downloads_path, unique_filename)
-						await download.save_as(download_path)
-						logger.debug(f'⬇️  Download triggered. Saved file to: {download_path}')
-						return download_path
-					except TimeoutError:
-						# If no download is triggered, treat as normal click
-						logger.debug('No download triggered within timeout. Checking navigation...')
-						await page.wait_for_load_state()
-						await self._check_and_handle_navigation(page)
+				"""Performs the actual click and waits for any navigation it triggered to settle.
+				Downloads are saved in the background by the page 'download' listener (see _on_download)."""
+				await click_func()
+				await page.wait_for_load_state()
+				await self._check_and_handle_navigation(page)
+
+			if self.browser_profile.cdp_element_actions and element_node.backend_node_id is not None:
+				try:
+					await self._click_backend_node(page, element_node.backend_node_id)
+				except Exception as e:
+					logger.debug(f'⚠️ CDP click on backend node failed, falling back to css selector: {type(e).__name__}: {e}')
 				else:
-					# Standard click logic if no download is expected
-					await click_func()
+					# the click went through, a failing load wait/navigation check must not click the element again
 					await page.wait_for_load_state()
 					await self._check_and_handle_navigation(page)
+					return
+
+			element_handle = await self.get_locate_element(element_node)
+
+			if element_handle is None:
+				raise Exception(f'Element: {repr(element_node)} not found')
 
 			try:
 				return await perform_click(lambda: element_handle.click(timeout=1500))
@@ -878,26 +1863,84 @@ class BrowserSession(BaseModel):
 		except Exception as e:
 			raise Exception(f'Failed to click element: {repr(element_node)}. Error: {str(e)}')
 
+	async def get_cdp_session(self, page: Page | None = None) -> CDPSession:
+		"""Get a CDP session attached to a page (defaults to the agent's current page), reused until the page closes"""
+		page = page or await self.get_current_page()
+		if page not in self._cdp_sessions:
+			self._cdp_sessions[page] = await page.context.new_cdp_session(page)
+		return self._cdp_sessions[page]
+
+	@time_execution_async('--click_backend_node')
+	async def _click_backend_node(self, page: Page, backend_node_id: int) -> None:
+		"""Click the center of an element's box model with raw CDP input events, skipping selector resolution entirely"""
+		cdp_session = await self.get_cdp_session(page)
+		await cdp_session.send('DOM.scrollIntoViewIfNeeded', {'backendNodeId': backend_node_id})
+		content_quad = (await cdp_session.send('DOM.getBoxModel', {'backendNodeId': backend_node_id}))['model']['content']
+		x, y = sum(content_quad[0::2]) / 4, sum(content_quad[1::2]) / 4
+		for event_type in ('mouseMoved', 'mousePressed', 'mouseReleased'):
+			await cdp_session.send(
+				'Input.dispatchMouseEvent', {'type': event_type, 'x': x, 'y': y, 'button': 'left', 'clickCount': 1}
+			)
+
+	@time_execution_async('--input_text_backend_node')
+	async def _input_text_backend_node(self, page: Page, backend_node_id: int, text: str) -> None:
+		"""Focus an element, clear it and insert text with CDP, skipping selector resolution and per-key typing"""
+		cdp_session = await self.get_cdp_session(page)
+		await cdp_session.send('DOM.focus', {'backendNodeId': backend_node_id})
+		remote_object = await cdp_session.send('DOM.resolveNode', {'backendNodeId': backend_node_id})
+		cleared = await cdp_session.send(
+			'Runtime.callFunctionOn',
+			{
+				'objectId': remote_object['object']['objectId'],
+				'functionDeclaration': """function() {
+					if (this.readOnly || this.disabled) return false;
+					if (this.isContentEditable) { this.textContent = ''; return true; }
+					const TEXT_INPUT_TYPES = ['text', 'search', 'email', 'url', 'tel', 'password', 'number'];
+					if (this.tagName === 'TEXTAREA' || (this.tagName === 'INPUT' && TEXT_INPUT_TYPES.includes(this.type))) {
+						this.value = '';
+						return true;
+					}
+					return false;
+				}""",
+				'returnByValue': True,
+			},
+		)
+		if not cleared['result'].get('value'):
+			raise BrowserError('Element is not an editable, enabled text field')
+		await cdp_session.send('Input.insertText', {'text': text})
+
 	@time_execution_async('--get_tabs_info')
 	async def get_tabs_info(self) -> list[TabInfo]:
-		"""Get information about all tabs"""
+		"""Get information about all tabs (read from the in-memory tab registry, does not wait on any of the pages)"""
 
+		pages = self._visible_pages()
 		tabs_info = []
-		for page_id, page in enumerate(self.browser_context.pages):
-			try:
-				tab_info = TabInfo(page_id=page_id, url=page.url, title=await asyncio.wait_for(page.title(), timeout=1))
-			except TimeoutError:
-				# page.title() can hang forever on tabs that are crashed/disappeared/about:blank
-				# we dont want to try automating those tabs because they will hang the whole script
-				logger.debug('⚠  Failed to get tab info for tab #%s: %s (ignoring)', page_id, page.url)
-				tab_info = TabInfo(page_id=page_id, url='about:blank', title='ignore this tab and do not use it')
-			tabs_info.append(tab_info)
+		for page_id, page in enumerate(pages):
+			record = self._tab_records.get(page) or self._register_tab(page)
+			if record.unresponsive:
+				# hung/crashed tabs are flagged by the background title refresh instead of blocking the step here
+				logger.debug('⚠  Tab #%s is not responding: %s (ignoring)', page_id, record.url)
+				tabs_info.append(TabInfo(page_id=page_id, url='about:blank', title='ignore this tab and do not use it'))
+				continue
+			if record.title_stale:
+				self._schedule_tab_title_refresh(page)
+			parent_page_id = pages.index(record.opener) if record.opener in pages else None
+			tabs_info.append(
+				TabInfo(
+					page_id=page_id,
+					url=record.discarded_url or page.url,
+					title=record.discarded_title if record.discarded_url else record.title,
+					parent_page_id=parent_page_id,
+					js_heap_bytes=record.js_heap_bytes,
+					cpu_seconds=record.cpu_seconds,
+				)
+			)
 
 		return tabs_info
 
 	@require_initialization
 	async def close_tab(self, tab_index: int | None = None) -> None:
-		pages = self.browser_context.pages
+		pages = self._visible_pages()
 		if not pages:
 			return
 
@@ -938,20 +1981,41 @@ class BrowserSession(BaseModel):
 			return await self.browser_context.cookies()
 		return []
 
+	def _resolve_cookies_path(self, path: str | Path) -> Path:
+		"""If path is not absolute, resolve it relative to downloads_dir"""
+		path = Path(path)
+		if not path.is_absolute():
+			path = Path(self.browser_profile.downloads_dir) / path
+		return path
+
+	@property
+	def cookie_persistence(self) -> CookiePersistence | None:
+		"""Debounced, change-aware writer for cookies_file (None if no cookies_file is configured)"""
+		if self._root_session:
+			return self._root_session.cookie_persistence  # one writer for all agents sharing the browser
+		if self.browser_profile.cookies_file and self._cookie_persistence is None:
+			self._cookie_persistence = CookiePersistence(
+				path=self._resolve_cookies_path(self.browser_profile.cookies_file),
+				get_cookies=self.get_cookies,
+			)
+		return self._cookie_persistence
+
+	@property
+	def cookie_persistence_stats(self) -> CookiePersistenceStats | None:
+		"""Requested vs performed cookies_file writes (None if no cookies_file is configured)"""
+		return self.cookie_persistence and self.cookie_persistence.stats
+
 	async def save_cookies(self, path: Path | None = None) -> None:
 		"""
 		Save cookies to the specified path or the default cookies_file in the downloads_dir.
 		"""
-		if self.browser_context:
+		if not self.browser_context:
+			return
+		if path is None and self.cookie_persistence:
+			await self.cookie_persistence.flush()  # skips the write if nothing changed since the last save
+		elif path:
 			cookies = await self.browser_context.cookies()
-			out_path = path or self.browser_profile.cookies_file
-			if out_path:
-				# If out_path is not absolute, resolve relative to downloads_dir
-				out_path = Path(out_path)
-				if not out_path.is_absolute():
-					out_path = Path(self.browser_profile.downloads_dir) / out_path
-				out_path.parent.mkdir(parents=True, exist_ok=True)
-				out_path.write_text(json.dumps(cookies, indent=4))  # TODO: replace with anyio asyncio or anyio write
+			await asyncio.to_thread(write_cookies_file, self._resolve_cookies_path(path), cookies)
 
 	# @property
 	# def browser_extension_pages(self) -> list[Page]:
@@ -1169,18 +2233,7 @@ class BrowserSession(BaseModel):
 
 		# just for logging, calculate how much data was downloaded
 		try:
-			bytes_used = await page.evaluate("""
-				() => {
-					let total = 0;
-					for (const entry of performance.getEntriesByType('resource')) {
-						total += entry.transferSize || 0;
-					}
-					for (const nav of performance.getEntriesByType('navigation')) {
-						total += nav.transferSize || 0;
-					}
-					return total;
-				}
-			""")
+			bytes_used = (await self.get_page_probe(page)).transfer_size
 		except Exception:
 			bytes_used = None
 
@@ -1306,7 +2359,7 @@ class BrowserSession(BaseModel):
 			self.human_current_page = None
 
 		# Switch to the first available tab if any exist
-		if self.browser_context.pages:
+		if self._visible_pages():
 			await self.switch_to_tab(0)
 			# switch_to_tab already updates both tab references
 
@@ -1388,6 +2441,11 @@ class BrowserSession(BaseModel):
 		structure = await page.evaluate(debug_script)
 		return structure
 
+	async def _get_updated_state_of_current_tab(self) -> BrowserStateSummary:
+		async with self.tab_lock(await self.get_current_page()):
+			await self._wait_for_page_and_frames_load()
+			return await self._get_updated_state()
+
 	@time_execution_sync('--get_state_summary')  # This decorator might need to be updated to handle async
 	async def get_state_summary(self, cache_clickable_elements_hashes: bool) -> BrowserStateSummary:
 		"""Get a summary of the current browser state
@@ -1402,8 +2460,25 @@ class BrowserSession(BaseModel):
 			This is used to calculate which elements are new to the LLM since the last message,
 			which helps reduce token usage.
 		"""
-		await self._wait_for_page_and_frames_load()
-		updated_state = await self._get_updated_state()
+		if self.crash_reason and self.can_recover:
+			await self.recover()
+
+		# taken before the extraction, so that anything changing from here on is noticed by page_changed_since_state_summary()
+		self._state_change_signal = None
+		if self.agent_current_page and not self.agent_current_page.is_closed():
+			self._watch_pending_requests(self.agent_current_page)  # so the settle detection sees requests started by actions
+			signal = await self.get_page_change_signal(self.agent_current_page)
+			if signal is not None:
+				self._state_change_signal = (self.agent_current_page, signal)
+
+		try:
+			updated_state = await self._get_updated_state_of_current_tab()
+		except BrowserError:
+			# the crash may not have been reported by an event or heartbeat yet, check before failing the step
+			if not (self.can_recover and await self.detect_crash()):
+				raise
+			await self.recover()
+			updated_state = await self._get_updated_state_of_current_tab()
 
 		# Find out which elements are new
 		# Do this only if url has not changed
@@ -1426,13 +2501,124 @@ class BrowserSession(BaseModel):
 
 		assert updated_state
 		self._cached_browser_state_summary = updated_state
+		self._update_recovery_snapshot(await self.get_current_page())
+		self._schedule_tab_reaper()
 
-		# Save cookies if a file is specified
-		if self.browser_profile.cookies_file:
-			asyncio.create_task(self.save_cookies())
+		# Save cookies if a file is specified (debounced, so back-to-back steps only cause one write)
+		if self.cookie_persistence:
+			self.cookie_persistence.schedule_save()
 
 		return self._cached_browser_state_summary
 
+	async def get_page_change_signal(self, page: Page | None = None) -> PageChangeSignal | None:
+		"""Cheap in-page fingerprint of the interactive elements (no DOM extraction), None if the page can't be evaluated"""
+		page = page or await self.get_current_page()
+		try:
+			signal = await page.evaluate(PAGE_CHANGE_SIGNAL_JS)
+		except Exception as e:
+			logger.debug(f'Failed to get the page change signal: {type(e).__name__}: {e}')
+			return None
+		return PageChangeSignal(url=page.url, document_id=signal['documentId'], digest=signal['digest'], opaque=signal['opaque'])
+
+	async def page_changed_since_state_summary(self) -> bool:
+		"""
+		Whether the interactive elements of the current tab may have changed since the last get_state_summary(), checked
+		with the page change signal instead of a new DOM extraction (True whenever the signal can't tell)
+		"""
+		self._change_detection_stats.checks += 1
+		if self._state_change_signal is None:
+			return True
+		page, baseline = self._state_change_signal
+		if page is not self.agent_current_page or page.is_closed():
+			return True
+		signal = await self.get_page_change_signal(page)
+		if signal is None or signal.opaque or signal != baseline:
+			return True
+		self._change_detection_stats.skipped_captures += 1
+		return False
+
+	@property
+	def change_detection_stats(self) -> ChangeDetectionStats:
+		"""Full state captures multi_act needed between actions vs the ones the page change signal made unnecessary"""
+		return self._change_detection_stats
+
+	def _watch_pending_requests(self, page: Page) -> dict[Request, float]:
+		"""In-flight requests of a tab (request -> start time) that may still change the page, tracked from the first call on"""
+		pending = self._pending_requests.get(page)
+		if pending is not None:
+			return pending
+		pending = self._pending_requests[page] = {}
+
+		def on_request(request: Request) -> None:
+			if request.resource_type in SETTLE_RESOURCE_TYPES:
+				pending[request] = time.monotonic()
+
+		def on_request_done(request: Request) -> None:
+			pending.pop(request, None)
+
+		page.on('request', on_request)
+		page.on('requestfinished', on_request_done)
+		page.on('requestfailed', on_request_done)
+		page.on('close', lambda page: self._pending_requests.pop(page, None))
+		return pending
+
+	@time_execution_async('--wait_for_page_settle')
+	async def wait_for_page_settle(self, timeout: float | None = None) -> float:
+		"""
+		Wait after an action until the current tab is settled, at most timeout seconds (default: wait_between_actions).
+		Settled means quiet for settle_quiet_time (no DOM mutations, scrolling or layout shifts), no running finite
+		animations and no pending document/fetch/xhr/script/stylesheet requests. The quiet time is also counted from the
+		start of the wait, so reactions the page schedules with a timeout/debounce get the chance to render, and an
+		action without side effects waits just settle_quiet_time. Always sleeps the full timeout with
+		adaptive_wait_between_actions=False.
+		Returns the seconds waited, the time saved is added up in settle_stats.
+		"""
+		timeout = self.browser_profile.wait_between_actions if timeout is None else timeout
+		start = time.monotonic()
+		if self.browser_profile.adaptive_wait_between_actions:
+			await self._wait_until_settled(start, start + timeout)
+		else:
+			await asyncio.sleep(timeout)
+		waited = min(time.monotonic() - start, timeout)
+
+		stats = self._settle_stats
+		stats.waits += 1
+		stats.waited_seconds += waited
+		stats.ceiling_seconds += timeout
+		if waited < timeout:
+			stats.early_returns += 1
+		return waited
+
+	async def _wait_until_settled(self, start: float, deadline: float) -> None:
+		page = await self.get_current_page()
+		pending = self._watch_pending_requests(page)
+		quiet_time = self.browser_profile.settle_quiet_time
+		while (remaining := deadline - time.monotonic()) > 0:
+			try:
+				probe = await page.evaluate(PAGE_SETTLE_PROBE_JS)
+			except Exception as e:
+				logger.debug(f'Failed to check if the page is settled: {type(e).__name__}: {e}')
+				probe = None
+			if probe is None:
+				# navigated to a new document (or the page can't be evaluated), nothing to tell when it is settled
+				await asyncio.sleep(remaining)
+				return
+
+			# requests pending for longer than a page load are long polling/streaming, not a result of the action
+			now = time.monotonic()
+			max_age = self.browser_profile.maximum_wait_page_load_time
+			requests_pending = any(now - started < max_age for started in pending.values())
+			# quiet since the last activity on the page *and* since the action, an idle page may not have reacted yet
+			quiet_for = min(probe['quietFor'], now - start)
+			if not requests_pending and not probe['animations'] and quiet_for >= quiet_time:
+				return
+			await asyncio.sleep(min(max(quiet_time - quiet_for, 0.05), remaining))
+
+	@property
+	def settle_stats(self) -> SettleStats:
+		"""Time spent waiting between actions vs what sleeping the full wait_between_actions every time would have taken"""
+		return self._settle_stats
+
 	async def _get_updated_state(self, focus_element: int = -1) -> BrowserStateSummary:
 		"""Update and return state."""
 
@@ -1440,19 +2626,33 @@ class BrowserSession(BaseModel):
 
 		# Check if current page is still valid, if not switch to another available page
 		try:
-			# Test if page is still accessible
-			await page.evaluate('1')
+			# Test if page is still accessible, the same probe also gives us the title + scroll info for the summary below
+			page_probe = await self.get_page_probe(page)
 		except Exception as e:
 			logger.debug(f'👋  Current page is no longer accessible: {type(e).__name__}: {e}')
 			raise BrowserError('Browser closed: no valid pages available')
 
+		# the probe already read the title of the current tab, keep the tab registry in sync for free
+		record = self._tab_records.get(page)
+		if record is not None:
+			record.url, record.title, record.title_stale, record.unresponsive = page_probe.url, page_probe.title, False, False
+			record.last_active = time.monotonic()
+
 		try:
 			await self.remove_highlights()
-			dom_service = DomService(page)
+			dom_service = DomService(page, page_probe=page_probe)
+			cdp_session = None
+			if self.browser_profile.cdp_element_actions:
+				try:
+					cdp_session = await self.get_cdp_session(page)
+				except Exception as e:
+					logger.debug(f'⚠️ Failed to open CDP session, actions will use css selectors: {type(e).__name__}: {e}')
 			content = await dom_service.get_clickable_elements(
 				focus_element=focus_element,
 				viewport_expansion=self.browser_profile.viewport_expansion,
 				highlight_elements=self.browser_profile.highlight_elements,
+				cdp_session=cdp_session,
+				report_scroll_containers=self.browser_profile.report_scroll_containers,
 			)
 
 			tabs_info = await self.get_tabs_info()
@@ -1479,17 +2679,16 @@ class BrowserSession(BaseModel):
 			# 	)
 
 			screenshot_b64 = await self.take_screenshot()
-			pixels_above, pixels_below = await self.get_scroll_info(page)
 
 			self.browser_state_summary = BrowserStateSummary(
 				element_tree=content.element_tree,
 				selector_map=content.selector_map,
 				url=page.url,
-				title=await page.title(),
+				title=page_probe.title,
 				tabs=tabs_info,
 				screenshot=screenshot_b64,
-				pixels_above=pixels_above,
-				pixels_below=pixels_below,
+				pixels_above=page_probe.pixels_above,
+				pixels_below=page_probe.pixels_below,
 			)
 
 			return self.browser_state_summary
@@ -1530,12 +2729,12 @@ class BrowserSession(BaseModel):
 	# region - User Actions
 
 	@staticmethod
-	async def _get_unique_filename(directory: str, filename: str) -> str:
-		"""Generate a unique filename for downloads by appending (1), (2), etc., if a file already exists."""
+	async def _get_unique_filename(directory: str, filename: str, reserved: Collection[str] = ()) -> str:
+		"""Generate a unique filename for downloads by appending (1), (2), etc., if a file already exists (or is reserved)."""
 		base, ext = os.path.splitext(filename)
 		counter = 1
 		new_filename = filename
-		while os.path.exists(os.path.join(directory, new_filename)):
+		while os.path.exists(os.path.join(directory, new_filename)) or new_filename in reserved:
 			new_filename = f'{base} ({counter}){ext}'
 			counter += 1
 		return new_filename
@@ -1742,6 +2941,22 @@ class BrowserSession(BaseModel):
 
 		# Process all iframe parents in sequence
 		iframes = [item for item in parents if item.tag_name == 'iframe']
+
+		# Reuse the handle from a previous action on the same element if it's still attached at the same position in the DOM
+		page_handle_cache = self._element_handle_cache.setdefault(page, {})
+		cache_key = (*(iframe.xpath for iframe in iframes), element.xpath)
+		cached_handle = page_handle_cache.pop(cache_key, None)
+		if cached_handle is not None:
+			try:
+				if await cached_handle.evaluate(ELEMENT_HANDLE_XPATH_CHECK_JS, element.xpath):
+					page_handle_cache[cache_key] = cached_handle
+					self._element_handle_cache_stats.hits += 1
+					return cached_handle
+			except Exception:
+				pass  # handle was disposed or its frame detached
+			self._element_handle_cache_stats.invalidations += 1
+		self._element_handle_cache_stats.misses += 1
+
 		for parent in iframes:
 			css_selector = self._enhanced_css_selector_for_element(
 				parent,
@@ -1756,7 +2971,6 @@ class BrowserSession(BaseModel):
 		try:
 			if isinstance(current_frame, FrameLocator):
 				element_handle = await current_frame.locator(css_selector).element_handle()
-				return element_handle
 			else:
 				# Try to scroll into view if hidden
 				element_handle = await current_frame.query_selector(css_selector)
@@ -1764,8 +2978,9 @@ class BrowserSession(BaseModel):
 					is_visible = await self._is_visible(element_handle)
 					if is_visible:
 						await element_handle.scroll_into_view_if_needed()
-					return element_handle
-				return None
+			if element_handle:
+				page_handle_cache[cache_key] = element_handle
+			return element_handle
 		except Exception as e:
 			logger.error(f'❌  Failed to locate element: {str(e)}')
 			return None
@@ -1863,6 +3078,16 @@ class BrowserSession(BaseModel):
 			# if element_node.highlight_index is not None:
 			# 	await self._update_state(focus_element=element_node.highlight_index)
 
+			if self.browser_profile.cdp_element_actions and element_node.backend_node_id is not None:
+				try:
+					page = await self.get_current_page()
+					await self._input_text_backend_node(page, element_node.backend_node_id, text)
+					return
+				except Exception as e:
+					logger.debug(
+						f'⚠️ CDP text input on backend node failed, falling back to css selector: {type(e).__name__}: {e}'
+					)
+
 			element_handle = await self.get_locate_element(element_node)
 
 			if element_handle is None:
@@ -1878,41 +3103,80 @@ class BrowserSession(BaseModel):
 				pass
 
 			# Get element properties to determine input method
-			tag_handle = await element_handle.get_property('tagName')
-			tag_name = (await tag_handle.json_value()).lower()
-			is_contenteditable = await element_handle.get_property('isContentEditable')
-			readonly_handle = await element_handle.get_property('readOnly')
-			disabled_handle = await element_handle.get_property('disabled')
-
-			readonly = await readonly_handle.json_value() if readonly_handle else False
-			disabled = await disabled_handle.json_value() if disabled_handle else False
+			properties = await element_handle.evaluate(ELEMENT_INPUT_PROPERTIES_JS)
+			is_editable = (properties['isContentEditable'] or properties['tagName'] in ('input', 'textarea')) and not (
+				properties['readOnly'] or properties['disabled']
+			)
 
 			# always click the element first to make sure it's in the focus
 			await element_handle.click()
-			await asyncio.sleep(0.1)
 
-			try:
-				if (await is_contenteditable.json_value() or tag_name == 'input') and not (readonly or disabled):
-					await element_handle.evaluate('el => {el.textContent = ""; el.value = "";}')
-					await element_handle.type(text, delay=5)
-				else:
-					await element_handle.fill(text)
-			except Exception:
+			page = await self.get_current_page()
+			if not is_editable:
+				strategies = [InputTextStrategy.FILL]
+			else:
+				strategies = self._input_text_strategies_for(page.url)
+
+			applied = False
+			for strategy in strategies:
+				try:
+					await self._apply_input_text_strategy(page, element_handle, strategy, text)
+				except Exception as e:
+					logger.debug(f'⚠️ input_text strategy {strategy.value} failed: {type(e).__name__}: {e}')
+					continue
+				applied = True
+
+				# with more than one candidate strategy, only accept one once we see the text actually landed in the element
+				if len(strategies) == 1:
+					return
+				entered_text = await element_handle.evaluate(ELEMENT_INPUT_VALUE_JS)
+				if entered_text.strip() == text.strip():
+					self._input_text_strategy_by_domain[urlparse(page.url).hostname or ''] = strategy
+					return
+				logger.debug(f'⚠️ input_text strategy {strategy.value} did not update the element value, trying the next one')
+
+			if not applied:
 				# last resort fallback, assume it's already focused after we clicked on it,
 				# just simulate keypresses on the entire page
-				page = await self.get_current_page()
 				await page.keyboard.type(text)
 
 		except Exception as e:
 			logger.debug(f'❌  Failed to input text into element: {repr(element_node)}. Error: {str(e)}')
 			raise BrowserError(f'Failed to input text into index {element_node.highlight_index}')
 
+	def _input_text_strategies_for(self, url: str) -> list[InputTextStrategy]:
+		"""Get the input_text strategies to try in order, the one that last worked on this domain goes first"""
+		configured = self.browser_profile.input_text_strategy
+		if configured != InputTextStrategy.AUTO:
+			return [configured]
+		strategies = [InputTextStrategy.FILL, InputTextStrategy.INSERT_TEXT, InputTextStrategy.TYPE]  # fastest first
+		learned = self._input_text_strategy_by_domain.get(urlparse(url).hostname or '')
+		if learned:
+			strategies.remove(learned)
+			strategies.insert(0, learned)
+		return strategies
+
+	async def _apply_input_text_strategy(
+		self, page: Page, element_handle: ElementHandle, strategy: InputTextStrategy, text: str
+	) -> None:
+		"""Replace the contents of an (already focused) editable element with text using the given strategy"""
+		if strategy == InputTextStrategy.FILL:
+			await element_handle.fill(text)
+		elif strategy == InputTextStrategy.INSERT_TEXT:
+			await element_handle.evaluate(ELEMENT_INPUT_CLEAR_JS)
+			cdp_session = await self.get_cdp_session(page)
+			await cdp_session.send('Input.insertText', {'text': text})
+		else:
+			await element_handle.evaluate(ELEMENT_INPUT_CLEAR_JS)
+			await asyncio.sleep(0.1)  # give focus handlers a moment to run before the first key event
+			await element_handle.type(text, delay=5)
+
 	@require_initialization
 	@time_execution_async('--switch_to_tab')
 	async def switch_to_tab(self, page_id: int) -> Page:
 		"""Switch to a specific tab by its page_id (aka tab index exposed to LLM)"""
 		assert self.browser_context is not None, 'Browser context is not set'
-		pages = self.browser_context.pages
+		pages = self._visible_pages()
 
 		if page_id >= len(pages):
 			raise BrowserError(f'No tab found with page_id: {page_id}')
@@ -1927,8 +3191,11 @@ class BrowserSession(BaseModel):
 		self.agent_current_page = page
 		self.human_current_page = page
 
-		# Bring tab to front and wait for it to load
-		await page.bring_to_front()
+		# Bring tab to front and wait for it to load (background tabs run at full speed already when throttling is disabled,
+		# no need to steal the foreground from other agents in headless mode where no human is watching)
+		if not (self.browser_profile.disable_background_throttling and self.browser_profile.headless):
+			await page.bring_to_front()
+		await self._restore_discarded_tab(page)
 		await page.wait_for_load_state()
 
 		# Set the viewport size for the tab
@@ -1945,6 +3212,8 @@ class BrowserSession(BaseModel):
 			raise BrowserError(f'Cannot create new tab with non-allowed URL: {url}')
 
 		new_page = await self.browser_context.new_page()
+		if self._owned_pages is not None:
+			self._owned_pages.append(new_page)
 
 		# Update agent tab reference
 		self.agent_current_page = new_page
@@ -1971,8 +3240,8 @@ class BrowserSession(BaseModel):
 		# 	assert self.agent_current_page.url == 'about:blank'
 
 		# if there are any unused about:blank tabs after we open a new tab, close them to clean up unused tabs
-		for page in self.browser_context.pages:
-			if page.url == 'about:blank' and page != self.agent_current_page:
+		for page in self._visible_pages():
+			if self._tab_url(page) == 'about:blank' and page != self.agent_current_page:
 				await page.close()
 				self.human_current_page = (  # in case we just closed the human's tab, fix the refs
 					self.human_current_page if not self.human_current_page.is_closed() else self.agent_current_page
@@ -2085,21 +3354,42 @@ class BrowserSession(BaseModel):
 			logger.debug(f'Error in find_file_upload_element_by_index: {e}')
 			return None
 
+	@require_initialization
+	@time_execution_async('--get_page_probe')
+	async def get_page_probe(self, page: Page | None = None) -> PageProbe:
+		"""Get liveness, title, scroll position and bytes loaded for a page (defaults to the agent's current page) in one round-trip"""
+		page = page or await self.get_current_page()
+		return PageProbe(**await page.evaluate(PAGE_PROBE_JS))
+
 	@require_initialization
 	async def get_scroll_info(self, page: Page) -> tuple[int, int]:
 		"""Get scroll position information for the current page."""
-		scroll_y = await page.evaluate('window.scrollY')
-		viewport_height = await page.evaluate('window.innerHeight')
-		total_height = await page.evaluate('document.documentElement.scrollHeight')
-		pixels_above = scroll_y
-		pixels_below = total_height - (scroll_y + viewport_height)
-		return pixels_above, pixels_below
+		page_probe = await self.get_page_probe(page)
+		return page_probe.pixels_above, page_probe.pixels_below
+
+	@require_initialization
+	@time_execution_async('--scroll_to_text')
+	async def scroll_to_text(self, text: str) -> dict[str, Any] | None:
+		"""Scroll the best visible match for text into view, returns its tag/text/position (within its frame) or None if not found"""
+		page = await self.get_current_page()
+		return await page.evaluate(SCROLL_TO_TEXT_JS, text)
 
 	@require_initialization
-	async def _scroll_container(self, pixels: int) -> None:
-		"""Scroll the element that truly owns vertical scroll.Starts at the focused node ➜ climbs to the first big, scroll-enabled ancestor otherwise picks the first scrollable element or the root, then calls `element.scrollBy` (or `window.scrollBy` for the root) by the supplied pixel value."""
+	async def _scroll_container(self, pixels: int, element_node: DOMElementNode | None = None) -> None:
+		"""Scroll the element that truly owns vertical scroll.Starts at the focused node ➜ climbs to the first big, scroll-enabled ancestor otherwise picks the first scrollable element or the root, then calls `element.scrollBy` (or `window.scrollBy` for the root) by the supplied pixel value.
+
+		Pass element_node to scroll a specific inner scroll container (reported by the DOM extractor) instead."""
+
+		if element_node is not None:
+			element_handle = await self.get_locate_element(element_node)
+			if element_handle is None:
+				raise BrowserError(f'Scroll container with index {element_node.highlight_index} does not exist')
+			await element_handle.evaluate("(el, dy) => el.scrollBy({ top: dy, behavior: 'auto' })", pixels)
+			return
 
 		# An element can *really* scroll if: overflow-y is auto|scroll|overlay, it has more content than fits, its own viewport is not a postage stamp (more than 50 % of window).
+		# Finding the page's main scroll container means checking the computed style of every element, so the result is cached
+		# in the page until the DOM changes (navigations start with a fresh window, so they invalidate it too).
 		SMART_SCROLL_JS = """(dy) => {
 			const bigEnough = el => el.clientHeight >= window.innerHeight * 0.5;
 			const canScroll = el =>
@@ -2111,13 +3401,29 @@ class BrowserSession(BaseModel):
 			let el = document.activeElement;
 			while (el && !canScroll(el) && el !== document.body) el = el.parentElement;
 
-			el = canScroll(el)
-					? el
-					: [...document.querySelectorAll('*')].find(canScroll)
-					|| document.scrollingElement
-					|| document.documentElement;
+			if (!canScroll(el)) {
+				let cache = window._browserUseScrollContainerCache;
+				if (!cache || !cache.valid) {
+					// containers reported by the last DOM extraction are checked first, before scanning the whole document
+					const known = window._browserUseScrollContainers || [];
+					const found = known.find(c => c.isConnected && canScroll(c)) || [...document.querySelectorAll('*')].find(canScroll);
+					cache = window._browserUseScrollContainerCache = { el: found || null, valid: true };
+					const observer = new MutationObserver(() => {
+						cache.valid = false;
+						observer.disconnect();
+					});
+					observer.observe(document.documentElement, {
+						childList: true,
+						subtree: true,
+						attributes: true,
+						attributeFilter: ['style', 'class'],
+					});
+				}
+				el = cache.el && cache.el.isConnected && canScroll(cache.el) ? cache.el : null;
+			}
 
-			if (el === document.scrollingElement ||
+			if (!el ||
+				el === document.scrollingElement ||
 				el === document.documentElement ||
 				el === document.body) {
 				window.scrollBy(0, dy);
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from browser_use.dom.history_tree_processor.service import DOMHistoryElement
 from browser_use.dom.views import DOMState
@@ -15,6 +15,9 @@ class TabInfo(BaseModel):
 	url: str
 	title: str
 	parent_page_id: int | None = None  # parent page that contains this popup or cross-origin iframe
+	# last resource usage sampled when BrowserProfile(tab_reaper_interval=...) is set, not shown to the LLM
+	js_heap_bytes: int | None = Field(default=None, exclude=True, repr=False)
+	cpu_seconds: float | None = Field(default=None, exclude=True, repr=False)  # total main thread task time
 
 
 @dataclass
@@ -54,6 +57,101 @@ class BrowserStateHistory:
 		return data
 
 
+@dataclass
+class ResourceBlockingStats:
+	"""Requests blocked by BrowserProfile.blocked_resource_classes/blocked_url_patterns over the lifetime of a BrowserSession"""
+
+	blocked_requests: dict[str, int] = field(
+		default_factory=dict
+	)  # resource class (or 'url_pattern') -> number of requests blocked
+	estimated_bytes_saved: int = 0  # based on typical transfer sizes, the real size of a blocked response is never known
+
+	@property
+	def total_blocked_requests(self) -> int:
+		return sum(self.blocked_requests.values())
+
+
+@dataclass
+class ElementHandleCacheStats:
+	"""How often BrowserSession.get_locate_element() could reuse an ElementHandle instead of re-resolving its selector"""
+
+	hits: int = 0
+	misses: int = 0
+	invalidations: int = 0  # cached handle was detached/moved in the DOM, or the page navigated away
+
+
+@dataclass
+class CookiePersistenceStats:
+	"""How many cookies_file writes were requested vs actually performed over the lifetime of a BrowserSession"""
+
+	save_requests: int = 0
+	writes: int = 0
+	coalesced: int = 0  # requests folded into an already pending debounced write
+	unchanged: int = 0  # flushes skipped because the cookies were identical to the last written set
+
+	@property
+	def avoided_writes(self) -> int:
+		return self.save_requests - self.writes
+
+
+@dataclass
+class BrowserHealthStats:
+	"""Browser crashes/disconnects detected by a BrowserSession and how many of them it recovered from"""
+
+	crashes: int = 0
+	recoveries: int = 0
+	failed_recoveries: int = 0
+	heartbeat_failures: int = 0  # liveness checks that timed out or errored
+	tabs_restored: int = 0
+
+
+@dataclass
+class TabReaperStats:
+	"""Background tabs sampled + closed/discarded by BrowserProfile(tab_reaper_interval=...) over the lifetime of a BrowserSession"""
+
+	samples: int = 0  # per-tab resource usage samples taken
+	tabs_closed: int = 0
+	tabs_discarded: int = 0  # unloaded to about:blank, url kept so switching back reloads it
+	tabs_restored: int = 0  # discarded tabs reloaded because the agent switched back to them
+	reclaimed_js_heap_bytes: int = 0  # JS heap in use by reaped tabs at their last sample
+
+
+@dataclass
+class PageChangeSignal:
+	"""Cheap in-page fingerprint of a tab's interactive elements, see BrowserSession.page_changed_since_state_summary()"""
+
+	url: str
+	document_id: str  # random id of the document the change observer lives in, differs after a navigation/reload
+	digest: int  # hash of the interactive elements (+ their visibility) and of the number of elements on the page
+	opaque: bool  # same-origin iframes / open shadow roots the observer can't see into, so it can't rule out a change
+
+
+@dataclass
+class ChangeDetectionStats:
+	"""How often Agent.multi_act could skip a full state capture between actions because the page had not changed"""
+
+	checks: int = 0
+	skipped_captures: int = 0
+
+	@property
+	def full_captures(self) -> int:
+		return self.checks - self.skipped_captures
+
+
+@dataclass
+class SettleStats:
+	"""Waits after actions in Agent.multi_act ended early by the settle detection, vs sleeping wait_between_actions every time"""
+
+	waits: int = 0
+	early_returns: int = 0  # waits that ended before the wait_between_actions ceiling
+	waited_seconds: float = 0.0
+	ceiling_seconds: float = 0.0  # what the fixed wait_between_actions sleeps would have taken
+
+	@property
+	def saved_seconds(self) -> float:
+		return max(self.ceiling_seconds - self.waited_seconds, 0.0)
+
+
 class BrowserError(Exception):
 	"""Base class for all browser errors"""
 
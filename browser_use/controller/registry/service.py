@@ -15,6 +15,7 @@ from browser_use.browser import BrowserSession
 from browser_use.controller.registry.views import (
 	ActionModel,
 	ActionRegistry,
+	PageActions,
 	RegisteredAction,
 	SpecialActionParameters,
 )
@@ -23,12 +24,14 @@ from browser_use.telemetry.views import (
 	ControllerRegisteredFunctionsTelemetryEvent,
 	RegisteredFunction,
 )
-from browser_use.utils import match_url_with_domain_pattern, time_execution_async
+from browser_use.utils import SECRET_PLACEHOLDER_PATTERN, SensitiveDataMatcher, time_execution_async
 
 Context = TypeVar('Context')
 
 logger = logging.getLogger(__name__)
 
+PAGE_ACTIONS_CACHE_SIZE = 256  # number of URLs whose filtered actions are memoized
+
 
 class Registry(Generic[Context]):
 	"""Service for registering and managing actions"""
@@ -37,6 +40,11 @@ class Registry(Generic[Context]):
 		self.registry = ActionRegistry()
 		self.telemetry = ProductTelemetry()
 		self.exclude_actions = exclude_actions if exclude_actions is not None else []
+		# ActionModels are rebuilt for every page/step but the set of available actions rarely changes,
+		# so reuse the model (and skip the schema telemetry) per set of action names until an action is (re-)registered
+		self._action_model_cache: dict[frozenset[str], type[ActionModel]] = {}
+		# domains globs + page_filters are evaluated once per URL, not once per call (several calls per step)
+		self._page_actions_cache: dict[str | None, PageActions] = {}
 
 	def _get_special_param_types(self) -> dict[str, type]:
 		"""Get the expected types for special parameters from SpecialActionParameters"""
@@ -60,13 +68,14 @@ class Registry(Generic[Context]):
 		func: Callable,
 		description: str,
 		param_model: type[BaseModel] | None = None,
-	) -> tuple[Callable, type[BaseModel]]:
+	) -> tuple[Callable, type[BaseModel], frozenset[str]]:
 		"""
 		Normalize action function to accept only kwargs.
 
 		Returns:
 			- Normalized function that accepts (*_, params: ParamModel, **special_params)
 			- The param model to use for registration
+			- The names of the special params the function takes
 		"""
 		sig = signature(func)
 		parameters = list(sig.parameters.values())
@@ -148,6 +157,22 @@ class Registry(Generic[Context]):
 				)
 
 		# Step 4: Create normalized wrapper function
+		# how each parameter of the original function gets its value is decided here once, not on every call
+		is_type1 = param_model_provided and bool(parameters) and parameters[0].name not in special_param_names
+		call_plan = [
+			('model' if is_type1 and i == 0 else 'special' if param.name in special_param_names else 'param', param)
+			for i, param in enumerate(parameters)
+		]
+		needs_params_dict = any(kind == 'param' for kind, _ in call_plan)
+		is_async = iscoroutinefunction(func)
+
+		def missing_special_param(name: str) -> ValueError:
+			if name == 'browser_session':
+				return ValueError(f'Action {func.__name__} requires browser_session but none provided.')
+			elif name == 'page_extraction_llm':
+				return ValueError(f'Action {func.__name__} requires page_extraction_llm but none provided.')
+			return ValueError(f"{func.__name__}() missing required special parameter '{name}'")
+
 		@functools.wraps(func)
 		async def normalized_wrapper(*args, params: BaseModel | None = None, **kwargs):
 			"""Normalized action that only accepts kwargs"""
@@ -155,70 +180,48 @@ class Registry(Generic[Context]):
 			if args:
 				raise TypeError(f'{func.__name__}() does not accept positional arguments, only keyword arguments are allowed')
 
-			# Prepare arguments for original function
-			call_args = []
-			call_kwargs = {}
-
 			# Handle Type 1 pattern (first arg is the param model)
-			if param_model_provided and parameters and parameters[0].name not in special_param_names:
+			if is_type1:
 				if params is None:
 					raise ValueError(f"{func.__name__}() missing required 'params' argument")
-				# For Type 1, we'll use the params object as first argument
-				pass
-			else:
-				# Type 2 pattern - need to unpack params
-				# If params is None, try to create it from kwargs
-				if params is None and action_params:
-					# Extract action params from kwargs
-					action_kwargs = {}
-					for param in action_params:
-						if param.name in kwargs:
-							action_kwargs[param.name] = kwargs[param.name]
-					if action_kwargs:
-						# Use the param_model which has the correct types defined
-						params = param_model(**action_kwargs)
+			# Type 2 pattern - need to unpack params
+			# If params is None, try to create it from kwargs
+			elif params is None and action_params:
+				# Extract action params from kwargs
+				action_kwargs = {param.name: kwargs[param.name] for param in action_params if param.name in kwargs}
+				if action_kwargs:
+					# Use the param_model which has the correct types defined
+					params = param_model(**action_kwargs)
 
-			# Build call_args by iterating through original function parameters in order
-			params_dict = params.model_dump() if params is not None else {}
+			params_dict = params.model_dump() if params is not None and needs_params_dict else {}
 
-			for i, param in enumerate(parameters):
-				# Skip first param for Type 1 pattern (it's the model itself)
-				if param_model_provided and i == 0 and param.name not in special_param_names:
+			# Build call_args by iterating through original function parameters in order
+			call_args = []
+			for kind, param in call_plan:
+				if kind == 'model':
+					# Type 1: the param model itself is the first argument
 					call_args.append(params)
-				elif param.name in special_param_names:
-					# This is a special parameter
+				elif kind == 'special':
 					if param.name in kwargs:
 						value = kwargs[param.name]
 						# Check if required special param is None
 						if value is None and param.default == Parameter.empty:
-							if param.name == 'browser_session':
-								raise ValueError(f'Action {func.__name__} requires browser_session but none provided.')
-							elif param.name == 'page_extraction_llm':
-								raise ValueError(f'Action {func.__name__} requires page_extraction_llm but none provided.')
-							else:
-								raise ValueError(f"{func.__name__}() missing required special parameter '{param.name}'")
+							raise missing_special_param(param.name)
 						call_args.append(value)
 					elif param.default != Parameter.empty:
 						call_args.append(param.default)
 					else:
 						# Special param is required but not provided
-						if param.name == 'browser_session':
-							raise ValueError(f'Action {func.__name__} requires browser_session but none provided.')
-						elif param.name == 'page_extraction_llm':
-							raise ValueError(f'Action {func.__name__} requires page_extraction_llm but none provided.')
-						else:
-							raise ValueError(f"{func.__name__}() missing required special parameter '{param.name}'")
+						raise missing_special_param(param.name)
+				elif param.name in params_dict:
+					call_args.append(params_dict[param.name])
+				elif param.default != Parameter.empty:
+					call_args.append(param.default)
 				else:
-					# This is an action parameter
-					if param.name in params_dict:
-						call_args.append(params_dict[param.name])
-					elif param.default != Parameter.empty:
-						call_args.append(param.default)
-					else:
-						raise ValueError(f"{func.__name__}() missing required parameter '{param.name}'")
+					raise ValueError(f"{func.__name__}() missing required parameter '{param.name}'")
 
 			# Call original function with positional args
-			if iscoroutinefunction(func):
+			if is_async:
 				return await func(*call_args)
 			else:
 				return await asyncio.to_thread(func, *call_args)
@@ -235,7 +238,7 @@ class Registry(Generic[Context]):
 
 		normalized_wrapper.__signature__ = sig.replace(parameters=new_params)
 
-		return normalized_wrapper, param_model
+		return normalized_wrapper, param_model, frozenset(sp.name for sp in special_params)
 
 	# @time_execution_sync('--create_param_model')
 	def _create_param_model(self, function: Callable) -> type[BaseModel]:
@@ -275,7 +278,9 @@ class Registry(Generic[Context]):
 				return func
 
 			# Normalize the function signature
-			normalized_func, actual_param_model = self._normalize_action_function_signature(func, description, param_model)
+			normalized_func, actual_param_model, special_param_names = self._normalize_action_function_signature(
+				func, description, param_model
+			)
 
 			action = RegisteredAction(
 				name=func.__name__,
@@ -284,8 +289,11 @@ class Registry(Generic[Context]):
 				param_model=actual_param_model,
 				domains=final_domains,
 				page_filter=page_filter,
+				special_param_names=special_param_names,
 			)
 			self.registry.actions[func.__name__] = action
+			self._action_model_cache.clear()
+			self._page_actions_cache.clear()
 
 			# Return the normalized function so it can be called with kwargs
 			return normalized_func
@@ -296,7 +304,7 @@ class Registry(Generic[Context]):
 	async def execute_action(
 		self,
 		action_name: str,
-		params: dict,
+		params: dict | BaseModel,
 		browser_session: BrowserSession | None = None,
 		page_extraction_llm: BaseChatModel | None = None,
 		sensitive_data: dict[str, str | dict[str, str]] | None = None,
@@ -310,11 +318,17 @@ class Registry(Generic[Context]):
 
 		action = self.registry.actions[action_name]
 		try:
-			# Create the validated Pydantic model
-			try:
-				validated_params = action.param_model(**params)
-			except Exception as e:
-				raise ValueError(f'Invalid parameters {params} for action {action_name}: {type(e)}: {e}') from e
+			# Create the validated Pydantic model (params coming from an ActionModel are validated already)
+			if isinstance(params, action.param_model):
+				validated_params = params
+			else:
+				if isinstance(params, BaseModel):
+					# e.g. from an ActionModel built by another registry, or before the action was re-registered
+					params = params.model_dump()
+				try:
+					validated_params = action.param_model(**params)
+				except Exception as e:
+					raise ValueError(f'Invalid parameters {params} for action {action_name}: {type(e)}: {e}') from e
 
 			if sensitive_data:
 				# Get current URL if browser_session is provided
@@ -327,23 +341,21 @@ class Registry(Generic[Context]):
 						current_url = current_page.url if current_page else None
 				validated_params = self._replace_sensitive_data(validated_params, sensitive_data, current_url)
 
-			# Build special context dict
-			special_context = {
-				'context': context,
-				'browser_session': browser_session,
-				'browser': browser_session,  # legacy support
-				'browser_context': browser_session,  # legacy support
-				'page_extraction_llm': page_extraction_llm,
-				'available_file_paths': available_file_paths,
-				'has_sensitive_data': action_name == 'input_text' and bool(sensitive_data),
-			}
-
-			# Handle async page parameter if needed
-			if browser_session:
-				# Check if function signature includes 'page' parameter
-				sig = signature(action.function)
-				if 'page' in sig.parameters:
-					special_context['page'] = await browser_session.get_current_page()
+			# Build the special context, only with the special params the action function actually takes
+			special_context = {}
+			for name in action.special_param_names:
+				if name == 'context':
+					special_context[name] = context
+				elif name in ('browser_session', 'browser', 'browser_context'):  # browser + browser_context: legacy support
+					special_context[name] = browser_session
+				elif name == 'page_extraction_llm':
+					special_context[name] = page_extraction_llm
+				elif name == 'available_file_paths':
+					special_context[name] = available_file_paths
+				elif name == 'has_sensitive_data':
+					special_context[name] = action_name == 'input_text' and bool(sensitive_data)
+				elif name == 'page' and browser_session:
+					special_context[name] = await browser_session.get_current_page()
 
 			# All functions are now normalized to accept kwargs only
 			# Call with params and unpacked special context
@@ -379,45 +391,26 @@ class Registry(Generic[Context]):
 		Returns:
 			BaseModel: The parameter object with placeholders replaced by actual values
 		"""
-		secret_pattern = re.compile(r'<secret>(.*?)</secret>')
-
 		# Set to track all missing placeholders across the full object
 		all_missing_placeholders = set()
 		# Set to track successfully replaced placeholders
 		replaced_placeholders = set()
 
-		# Process sensitive data based on format and current URL
-		applicable_secrets = {}
-
-		for domain_or_key, content in sensitive_data.items():
-			if isinstance(content, dict):
-				# New format: {domain_pattern: {key: value}}
-				# Only include secrets for domains that match the current URL
-				if current_url and current_url != 'about:blank':
-					# it's a real url, check it using our custom allowed_domains scheme://*.example.com glob matching
-					if match_url_with_domain_pattern(current_url, domain_or_key):
-						applicable_secrets.update(content)
-			else:
-				# Old format: {key: value}, expose to all domains (only allowed for legacy reasons)
-				applicable_secrets[domain_or_key] = content
+		# Secrets applicable on the current URL, memoized per URL on the compiled sensitive_data
+		applicable_secrets = SensitiveDataMatcher.for_sensitive_data(sensitive_data).secrets_for_url(current_url)
 
-		# Filter out empty values
-		applicable_secrets = {k: v for k, v in applicable_secrets.items() if v}
+		def replace_placeholder(match: re.Match) -> str:
+			placeholder = match.group(1)
+			if placeholder in applicable_secrets:
+				replaced_placeholders.add(placeholder)
+				return applicable_secrets[placeholder]
+			# Keep track of missing placeholders, don't replace the tag, keep it as is
+			all_missing_placeholders.add(placeholder)
+			return match.group(0)
 
 		def recursively_replace_secrets(value: str | dict | list) -> str | dict | list:
 			if isinstance(value, str):
-				matches = secret_pattern.findall(value)
-
-				for placeholder in matches:
-					if placeholder in applicable_secrets:
-						value = value.replace(f'<secret>{placeholder}</secret>', applicable_secrets[placeholder])
-						replaced_placeholders.add(placeholder)
-					else:
-						# Keep track of missing placeholders
-						all_missing_placeholders.add(placeholder)
-						# Don't replace the tag, keep it as is
-
-				return value
+				return SECRET_PLACEHOLDER_PATTERN.sub(replace_placeholder, value) if '<secret>' in value else value
 			elif isinstance(value, dict):
 				return {k: recursively_replace_secrets(v) for k, v in value.items()}
 			elif isinstance(value, list):
@@ -434,21 +427,18 @@ class Registry(Generic[Context]):
 		if all_missing_placeholders:
 			logger.warning(f'Missing or empty keys in sensitive_data dictionary: {", ".join(all_missing_placeholders)}')
 
+		# nothing substituted -> the params are unchanged, skip re-validating them
+		if not replaced_placeholders:
+			return params
 		return type(params).model_validate(processed_params)
 
-	# @time_execution_sync('--create_action_model')
-	def create_action_model(self, include_actions: list[str] | None = None, page=None) -> type[ActionModel]:
-		"""Creates a Pydantic model from registered actions, used by LLM APIs that support tool calling & enforce a schema"""
-
-		# Filter actions based on page if provided:
-		#   if page is None, only include actions with no filters
-		#   if page is provided, only include actions that match the page
-
+	def _filter_actions(self, page=None) -> dict[str, RegisteredAction]:
+		"""Filter actions based on page if provided:
+		- if page is None, only include actions with no filters
+		- if page is provided, only include actions that match the page
+		"""
 		available_actions = {}
 		for name, action in self.registry.actions.items():
-			if include_actions is not None and name not in include_actions:
-				continue
-
 			# If no page provided, only include actions with no filters
 			if page is None:
 				if action.page_filter is None and action.domains is None:
@@ -462,6 +452,44 @@ class Registry(Generic[Context]):
 			# Include action if both filters match (or if either is not present)
 			if domain_is_allowed and page_is_allowed:
 				available_actions[name] = action
+		return available_actions
+
+	def get_page_actions(self, page=None) -> PageActions:
+		"""Get the actions, prompt description and ActionModel for a page, memoized per URL until the registry changes"""
+		url = None if page is None else page.url
+		if (page_actions := self._page_actions_cache.get(url)) is not None:
+			return page_actions
+
+		actions = self._filter_actions(page)
+		page_actions = PageActions(
+			actions=actions,
+			# for a page only describe the filtered actions, the unfiltered ones are already in the system prompt
+			prompt_description='\n'.join(
+				action.prompt_description() for action in actions.values() if page is None or action.domains or action.page_filter
+			),
+			action_model=self._build_action_model(actions),
+		)
+
+		if len(self._page_actions_cache) >= PAGE_ACTIONS_CACHE_SIZE:
+			self._page_actions_cache.pop(next(iter(self._page_actions_cache)))  # drop the oldest URL
+		self._page_actions_cache[url] = page_actions
+		return page_actions
+
+	# @time_execution_sync('--create_action_model')
+	def create_action_model(self, include_actions: list[str] | None = None, page=None) -> type[ActionModel]:
+		"""Creates a Pydantic model from registered actions, used by LLM APIs that support tool calling & enforce a schema"""
+		page_actions = self.get_page_actions(page)
+		if include_actions is None:
+			return page_actions.action_model
+
+		return self._build_action_model(
+			{name: action for name, action in page_actions.actions.items() if name in include_actions}
+		)
+
+	def _build_action_model(self, available_actions: dict[str, RegisteredAction]) -> type[ActionModel]:
+		cache_key = frozenset(available_actions)
+		if cached_model := self._action_model_cache.get(cache_key):
+			return cached_model
 
 		fields = {
 			name: (
@@ -480,7 +508,9 @@ class Registry(Generic[Context]):
 			)
 		)
 
-		return create_model('ActionModel', __base__=ActionModel, **fields)  # type:ignore
+		action_model = create_model('ActionModel', __base__=ActionModel, **fields)  # type:ignore
+		self._action_model_cache[cache_key] = action_model
+		return action_model
 
 	def get_prompt_description(self, page=None) -> str:
 		"""Get a description of all actions for the prompt
@@ -488,4 +518,4 @@ class Registry(Generic[Context]):
 		If page is provided, only include actions that are available for that page
 		based on their filter_func
 		"""
-		return self.registry.get_prompt_description(page=page)
+		return self.get_page_actions(page).prompt_description
@@ -18,8 +18,11 @@ class RegisteredAction(BaseModel):
 	description: str
 	function: Callable
 	param_model: type[BaseModel]
+	# the special params the function takes besides params (browser_session, page, ...), execute_action only builds those
+	special_param_names: frozenset[str] = frozenset()
 
 	# filters: provide specific domains or a function to determine whether the action should be available on the given page or not
+	# (the Registry memoizes the result per page URL, so page_filter should only depend on the URL)
 	domains: list[str] | None = None  # e.g. ['*.google.com', 'www.bing.com', 'yahoo.*]
 	page_filter: Callable[[Page], bool] | None = None
 
@@ -72,6 +75,16 @@ class ActionModel(BaseModel):
 			action_params.index = index
 
 
+class PageActions(BaseModel):
+	"""Actions available on a page (or the unfiltered ones when there is no page), evaluated together once per URL"""
+
+	actions: dict[str, RegisteredAction]
+	prompt_description: str
+	action_model: type[ActionModel]
+
+	model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
 class ActionRegistry(BaseModel):
 	"""Model representing the action registry"""
 
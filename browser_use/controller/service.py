@@ -143,11 +143,8 @@ class Controller(Generic[Context]):
 			msg = None
 
 			try:
-				download_path = await browser_session._click_element_node(element_node)
-				if download_path:
-					msg = f'💾  Downloaded file to {download_path}'
-				else:
-					msg = f'🖱️  Clicked button with index {params.index}: {element_node.get_all_text_till_next_clickable_element(max_depth=2)}'
+				await browser_session._click_element_node(element_node)
+				msg = f'🖱️  Clicked button with index {params.index}: {element_node.get_all_text_till_next_clickable_element(max_depth=2)}'
 
 				logger.info(msg)
 				logger.debug(f'Element xpath: {element_node.xpath}')
@@ -281,7 +278,7 @@ class Controller(Generic[Context]):
 			return ActionResult(extracted_content=msg, include_in_memory=False)
 
 		@self.registry.action(
-			'Scroll down the page by pixel amount - if none is given, scroll one page',
+			'Scroll down the page by pixel amount - if none is given, scroll one page. Pass the index of a scrollable element to scroll it instead of the page',
 			param_model=ScrollAction,
 		)
 		async def scroll_down(params: ScrollAction, browser_session: BrowserSession):
@@ -289,39 +286,14 @@ class Controller(Generic[Context]):
 			(a) Use browser._scroll_container for container-aware scrolling.
 			(b) If that JavaScript throws, fall back to window.scrollBy().
 			"""
-			page = await browser_session.get_current_page()
-			dy = params.amount or await page.evaluate('() => window.innerHeight')
-
-			try:
-				await browser_session._scroll_container(dy)
-			except Exception as e:
-				# Hard fallback: always works on root scroller
-				await page.evaluate('(y) => window.scrollBy(0, y)', dy)
-				logger.debug('Smart scroll failed; used window.scrollBy fallback', exc_info=e)
-
-			amount_str = f'{params.amount} pixels' if params.amount is not None else 'one page'
-			msg = f'🔍 Scrolled down the page by {amount_str}'
-			logger.info(msg)
-			return ActionResult(extracted_content=msg, include_in_memory=True)
+			return await self._scroll(params, browser_session, direction=1)
 
 		@self.registry.action(
-			'Scroll up the page by pixel amount - if none is given, scroll one page',
+			'Scroll up the page by pixel amount - if none is given, scroll one page. Pass the index of a scrollable element to scroll it instead of the page',
 			param_model=ScrollAction,
 		)
 		async def scroll_up(params: ScrollAction, browser_session: BrowserSession):
-			page = await browser_session.get_current_page()
-			dy = -(params.amount or await page.evaluate('() => window.innerHeight'))
-
-			try:
-				await browser_session._scroll_container(dy)
-			except Exception as e:
-				await page.evaluate('(y) => window.scrollBy(0, y)', dy)
-				logger.debug('Smart scroll failed; used window.scrollBy fallback', exc_info=e)
-
-			amount_str = f'{params.amount} pixels' if params.amount is not None else 'one page'
-			msg = f'🔍 Scrolled up the page by {amount_str}'
-			logger.info(msg)
-			return ActionResult(extracted_content=msg, include_in_memory=True)
+			return await self._scroll(params, browser_session, direction=-1)
 
 		# send keys
 		@self.registry.action(
@@ -349,44 +321,21 @@ class Controller(Generic[Context]):
 		@self.registry.action(
 			description='If you dont find something which you want to interact with, scroll to it',
 		)
-		async def scroll_to_text(text: str, page: Page):  # type: ignore
+		async def scroll_to_text(text: str, browser_session: BrowserSession):  # type: ignore
 			try:
-				# Try different locator strategies
-				locators = [
-					page.get_by_text(text, exact=False),
-					page.locator(f'text={text}'),
-					page.locator(f"//*[contains(text(), '{text}')]"),
-				]
-
-				for locator in locators:
-					try:
-						if await locator.count() == 0:
-							continue
-
-						element = locator.first
-						is_visible = await element.is_visible()
-						bbox = await element.bounding_box()
-
-						if is_visible and bbox is not None and bbox['width'] > 0 and bbox['height'] > 0:
-							await element.scroll_into_view_if_needed()
-							await asyncio.sleep(0.5)  # Wait for scroll to complete
-							msg = f'🔍  Scrolled to text: {text}'
-							logger.info(msg)
-							return ActionResult(extracted_content=msg, include_in_memory=True)
-
-					except Exception as e:
-						logger.debug(f'Locator attempt failed: {str(e)}')
-						continue
-
-				msg = f"Text '{text}' not found or not visible on page"
-				logger.info(msg)
-				return ActionResult(extracted_content=msg, include_in_memory=True)
-
+				match = await browser_session.scroll_to_text(text)
 			except Exception as e:
 				msg = f"Failed to scroll to text '{text}': {str(e)}"
 				logger.error(msg)
 				return ActionResult(error=msg, include_in_memory=True)
 
+			if match is None:
+				msg = f"Text '{text}' not found or not visible on page"
+			else:
+				msg = f'🔍  Scrolled to text: {text}'
+			logger.info(msg)
+			return ActionResult(extracted_content=msg, include_in_memory=True)
+
 		@self.registry.action(
 			description='Get all options from a native dropdown',
 		)
@@ -865,7 +814,9 @@ class Controller(Generic[Context]):
 	) -> ActionResult:
 		"""Execute an action"""
 
-		for action_name, params in action.model_dump(exclude_unset=True).items():
+		# only the chosen action is set on the ActionModel, its (already validated) params are passed on as they are
+		for action_name in action.model_fields_set:
+			params = getattr(action, action_name)
 			if params is not None:
 				# with Laminar.start_as_current_span(
 				# 	name=action_name,
@@ -875,24 +826,70 @@ class Controller(Generic[Context]):
 				# 	},
 				# 	span_type='TOOL',
 				# ):
-				result = await self.registry.execute_action(
-					action_name=action_name,
-					params=params,
-					browser_session=browser_session,
-					page_extraction_llm=page_extraction_llm,
-					sensitive_data=sensitive_data,
-					available_file_paths=available_file_paths,
-					context=context,
-				)
+				# other agents sharing the browser must not act on (or read the state of) this tab mid-action
+				async with browser_session.tab_lock():
+					result = await self.registry.execute_action(
+						action_name=action_name,
+						params=params,
+						browser_session=browser_session,
+						page_extraction_llm=page_extraction_llm,
+						sensitive_data=sensitive_data,
+						available_file_paths=available_file_paths,
+						context=context,
+					)
 
 				# Laminar.set_span_output(result)
 
 				if isinstance(result, str):
-					return ActionResult(extracted_content=result)
-				elif isinstance(result, ActionResult):
-					return result
+					result = ActionResult(extracted_content=result)
 				elif result is None:
-					return ActionResult()
-				else:
+					result = ActionResult()
+				elif not isinstance(result, ActionResult):
 					raise ValueError(f'Invalid action result type: {type(result)} of {result}')
+				return self._attach_finished_downloads(result, browser_session)
 		return ActionResult()
+
+	@staticmethod
+	async def _scroll(params: ScrollAction, browser_session: BrowserSession, direction: int) -> ActionResult:
+		"""Scroll an inner scroll container by index, or the page's own scroll container, by params.amount (default one page)"""
+		page = await browser_session.get_current_page()
+		element_node = None
+		if params.index is not None:
+			selector_map = await browser_session.get_selector_map()
+			if params.index not in selector_map:
+				raise Exception(f'Element with index {params.index} does not exist - retry or use alternative actions')
+			element_node = selector_map[params.index]
+
+		if params.amount is not None:
+			dy = params.amount
+		elif element_node is not None and element_node.scroll_info:
+			dy = element_node.scroll_info.client_height
+		else:
+			dy = (await browser_session.get_page_probe(page)).viewport_height
+		dy *= direction
+
+		try:
+			await browser_session._scroll_container(dy, element_node=element_node)
+		except Exception as e:
+			if element_node is not None:
+				raise
+			# Hard fallback: always works on root scroller
+			await page.evaluate('(y) => window.scrollBy(0, y)', dy)
+			logger.debug('Smart scroll failed; used window.scrollBy fallback', exc_info=e)
+
+		amount_str = f'{params.amount} pixels' if params.amount is not None else 'one page'
+		target_str = f'element {params.index}' if params.index is not None else 'the page'
+		msg = f'🔍 Scrolled {"down" if direction > 0 else "up"} {target_str} by {amount_str}'
+		logger.info(msg)
+		return ActionResult(extracted_content=msg, include_in_memory=True)
+
+	@staticmethod
+	def _attach_finished_downloads(result: ActionResult, browser_session: BrowserSession) -> ActionResult:
+		"""Report any downloads that finished saving in the background since the last action"""
+		downloaded_files = browser_session.pop_finished_downloads()
+		if not downloaded_files:
+			return result
+		msg = '\n'.join(f'💾  Downloaded file to {path}' for path in downloaded_files)
+		logger.info(msg)
+		extracted_content = f'{result.extracted_content}\n{msg}' if result.extracted_content else msg
+		return result.model_copy(update={'extracted_content': extracted_content, 'include_in_memory': True})
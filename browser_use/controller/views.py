@@ -40,6 +40,7 @@ class CloseTabAction(BaseModel):
 
 class ScrollAction(BaseModel):
 	amount: int | None = None  # The number of pixels to scroll. If None, scroll down/up one page
+	index: int | None = None  # index of a scrollable element to scroll instead of the page
 
 
 class SendKeysAction(BaseModel):
@@ -4,11 +4,31 @@
     focusHighlightIndex: -1,
     viewportExpansion: 0,
     debugMode: false,
+    collectInteractiveElements: false,
+    reportScrollContainers: false,
   }
 ) => {
-  const { doHighlightElements, focusHighlightIndex, viewportExpansion, debugMode } = args;
+  const {
+    doHighlightElements,
+    focusHighlightIndex,
+    viewportExpansion,
+    debugMode,
+    collectInteractiveElements,
+    reportScrollContainers,
+  } = args;
   let highlightIndex = 0; // Reset highlight index
 
+  // Keep references to the highlighted elements so the python side can resolve their CDP backendNodeIds by highlight index
+  // (only for BrowserProfile(cdp_element_actions=True), otherwise the page keeps no references to its elements)
+  if (collectInteractiveElements) {
+    window._browserUseInteractiveElements = [];
+  }
+  // Inner scroll containers found on the page, reused by the scroll actions instead of scanning every element again
+  // (only for BrowserProfile(report_scroll_containers=True), like the interactive elements above)
+  if (reportScrollContainers) {
+    window._browserUseScrollContainers = [];
+  }
+
   // Add timing stack to handle recursion
   const TIMING_STACK = {
     nodeProcessing: [],
@@ -1116,6 +1136,24 @@
   }
   // --- End distinct interaction check ---
 
+  /**
+   * Returns the vertical scroll extents of an inner scroll container, or null if the element doesn't scroll.
+   * The page itself (body/html) is not reported, its scroll position is part of the page state already.
+   */
+  function getScrollInfo(element) {
+    if (element === document.body || element === document.documentElement || element === document.scrollingElement) {
+      return null;
+    }
+    if (element.scrollHeight <= element.clientHeight + 1) return null;
+    const style = getCachedComputedStyle(element);
+    if (!style || !/(auto|scroll|overlay)/.test(style.overflowY)) return null;
+    return {
+      scrollTop: Math.round(element.scrollTop),
+      scrollHeight: element.scrollHeight,
+      clientHeight: element.clientHeight,
+    };
+  }
+
   /**
    * Handles the logic for deciding whether to highlight an element and performing the highlight.
    */
@@ -1144,6 +1182,9 @@
       // regardless of viewport status
       if (nodeData.isInViewport || viewportExpansion === -1) {
         nodeData.highlightIndex = highlightIndex++;
+        if (collectInteractiveElements) {
+          window._browserUseInteractiveElements[nodeData.highlightIndex] = node;
+        }
 
         if (doHighlightElements) {
           if (focusHighlightIndex >= 0) {
@@ -1291,6 +1332,17 @@
           // Call the dedicated highlighting function
           nodeWasHighlighted = handleHighlighting(nodeData, node, parentIframe, isParentHighlighted);
         }
+        const scrollInfo = reportScrollContainers ? getScrollInfo(node) : null;
+        if (scrollInfo) {
+          nodeData.scrollInfo = scrollInfo;
+          window._browserUseScrollContainers.push(node);
+          // give scroll containers an index so they can be scrolled directly,
+          // but don't let that hide the highlights of the interactive elements inside of them
+          if (nodeData.isTopElement && nodeData.highlightIndex === undefined) {
+            nodeData.isInteractive = true;
+            handleHighlighting(nodeData, node, parentIframe, false);
+          }
+        }
       }
     }
 
@@ -1,23 +1,53 @@
+import asyncio
 import logging
 from dataclasses import dataclass
+from functools import cache
 from importlib import resources
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 if TYPE_CHECKING:
-	from playwright.async_api import Page
+	from playwright.async_api import CDPSession, Page
 
 from browser_use.dom.views import (
 	DOMBaseNode,
 	DOMElementNode,
 	DOMState,
 	DOMTextNode,
+	PageProbe,
+	ScrollInfo,
 	SelectorMap,
 )
 from browser_use.utils import time_execution_async
 
 logger = logging.getLogger(__name__)
 
+# Bundles all the tiny per-step page reads into one round-trip, each separate evaluate() costs a full CDP round-trip
+# (adds up quickly on remote cdp_url/wss_url browsers)
+PAGE_PROBE_JS = """() => {
+	let transfer_size = 0;
+	for (const entry of performance.getEntriesByType('resource')) {
+		transfer_size += entry.transferSize || 0;
+	}
+	for (const nav of performance.getEntriesByType('navigation')) {
+		transfer_size += nav.transferSize || 0;
+	}
+	return {
+		url: document.location.href,
+		title: document.title,
+		scroll_y: Math.round(window.scrollY),
+		viewport_height: window.innerHeight,
+		scroll_height: document.documentElement ? document.documentElement.scrollHeight : 0,
+		transfer_size: transfer_size,
+	};
+}"""
+
+
+@cache
+def _build_dom_tree_js() -> str:
+	"""buildDomTree.js source, read from disk once per process instead of once per DomService"""
+	return resources.files('browser_use.dom').joinpath('buildDomTree.js').read_text()
+
 
 @dataclass
 class ViewportInfo:
@@ -26,11 +56,12 @@ class ViewportInfo:
 
 
 class DomService:
-	def __init__(self, page: 'Page'):
+	def __init__(self, page: 'Page', page_probe: PageProbe | None = None):
 		self.page = page
+		self.page_probe = page_probe  # reuse a probe the caller already took this step instead of re-checking liveness
 		self.xpath_cache = {}
 
-		self.js_code = resources.files('browser_use.dom').joinpath('buildDomTree.js').read_text()
+		self.js_code = _build_dom_tree_js()
 
 	# region - Clickable elements
 	@time_execution_async('--get_clickable_elements')
@@ -39,10 +70,63 @@ class DomService:
 		highlight_elements: bool = True,
 		focus_element: int = -1,
 		viewport_expansion: int = 0,
+		cdp_session: 'CDPSession | None' = None,
+		report_scroll_containers: bool = False,
 	) -> DOMState:
-		element_tree, selector_map = await self._build_dom_tree(highlight_elements, focus_element, viewport_expansion)
+		element_tree, selector_map = await self._build_dom_tree(
+			highlight_elements,
+			focus_element,
+			viewport_expansion,
+			collect_interactive_elements=cdp_session is not None,
+			report_scroll_containers=report_scroll_containers,
+		)
+		if cdp_session is not None:
+			await self._capture_backend_node_ids(cdp_session, selector_map)
 		return DOMState(element_tree=element_tree, selector_map=selector_map)
 
+	@time_execution_async('--capture_backend_node_ids')
+	async def _capture_backend_node_ids(self, cdp_session: 'CDPSession', selector_map: SelectorMap) -> None:
+		"""Fill in DOMElementNode.backend_node_id for the highlighted elements, so actions can target them directly via CDP"""
+		if not selector_map:
+			return
+		object_group = 'browser-use-backend-node-ids'
+		try:
+			elements = await cdp_session.send(
+				'Runtime.evaluate', {'expression': 'window._browserUseInteractiveElements', 'objectGroup': object_group}
+			)
+			elements_object_id = elements['result'].get('objectId')
+			if not elements_object_id:
+				return
+			properties = await cdp_session.send('Runtime.getProperties', {'objectId': elements_object_id, 'ownProperties': True})
+			object_ids = {
+				int(prop['name']): prop['value']['objectId']
+				for prop in properties['result']
+				if prop['name'].isdigit() and int(prop['name']) in selector_map and prop.get('value', {}).get('objectId')
+			}
+			# CDP messages are pipelined over one websocket, so resolving all of them concurrently costs ~1 round-trip
+			descriptions = await asyncio.gather(
+				*(cdp_session.send('DOM.describeNode', {'objectId': object_id}) for object_id in object_ids.values()),
+				return_exceptions=True,
+			)
+			for highlight_index, description in zip(object_ids, descriptions):
+				if isinstance(description, dict):
+					selector_map[highlight_index].backend_node_id = description['node']['backendNodeId']
+		except Exception as e:
+			# e.g. buildDomTree.js ran in an isolated world (patchright), actions will just use the css selector path instead
+			logger.debug(f'Failed to capture backend node ids for interactive elements: {type(e).__name__}: {e}')
+		finally:
+			try:
+				await cdp_session.send('Runtime.releaseObjectGroup', {'objectGroup': object_group})
+			except Exception:
+				pass
+
+	@time_execution_async('--get_page_probe')
+	async def get_page_probe(self) -> PageProbe:
+		"""Get liveness, title, scroll position and bytes loaded for the page in a single evaluate round-trip"""
+		probe = await self.page.evaluate(PAGE_PROBE_JS)
+		self.page_probe = PageProbe(**probe)
+		return self.page_probe
+
 	@time_execution_async('--get_cross_origin_iframes')
 	async def get_cross_origin_iframes(self) -> list[str]:
 		# invisible cross-origin iframes are used for ads and tracking, dont open those
@@ -67,9 +151,14 @@ class DomService:
 		highlight_elements: bool,
 		focus_element: int,
 		viewport_expansion: int,
+		collect_interactive_elements: bool = False,
+		report_scroll_containers: bool = False,
 	) -> tuple[DOMElementNode, SelectorMap]:
-		if await self.page.evaluate('1+1') != 2:
-			raise ValueError('The page cannot evaluate javascript code properly')
+		if self.page_probe is None:
+			try:
+				await self.get_page_probe()
+			except Exception as e:
+				raise ValueError('The page cannot evaluate javascript code properly') from e
 
 		if self.page.url == 'about:blank':
 			# short-circuit if the page is a new empty tab for speed, no need to inject buildDomTree.js
@@ -94,6 +183,8 @@ class DomService:
 			'focusHighlightIndex': focus_element,
 			'viewportExpansion': viewport_expansion,
 			'debugMode': debug_mode,
+			'collectInteractiveElements': collect_interactive_elements,
+			'reportScrollContainers': report_scroll_containers,
 		}
 
 		try:
@@ -199,6 +290,14 @@ class DomService:
 				height=node_data['viewport']['height'],
 			)
 
+		scroll_info = None
+		if 'scrollInfo' in node_data:
+			scroll_info = ScrollInfo(
+				scroll_top=node_data['scrollInfo']['scrollTop'],
+				scroll_height=node_data['scrollInfo']['scrollHeight'],
+				client_height=node_data['scrollInfo']['clientHeight'],
+			)
+
 		element_node = DOMElementNode(
 			tag_name=node_data['tagName'],
 			xpath=node_data['xpath'],
@@ -212,6 +311,7 @@ class DomService:
 			shadow_root=node_data.get('shadowRoot', False),
 			parent=None,
 			viewport_info=viewport_info,
+			scroll_info=scroll_info,
 		)
 
 		children_ids = node_data.get('children', [])
@@ -52,6 +52,23 @@ class DOMTextNode(DOMBaseNode):
 		}
 
 
+@dataclass
+class ScrollInfo:
+	"""Vertical scroll extents of an inner scroll container (the page's own scroll position is in PageProbe)"""
+
+	scroll_top: int
+	scroll_height: int
+	client_height: int
+
+	@property
+	def pixels_above(self) -> int:
+		return self.scroll_top
+
+	@property
+	def pixels_below(self) -> int:
+		return max(self.scroll_height - (self.scroll_top + self.client_height), 0)
+
+
 @dataclass(frozen=False)
 class DOMElementNode(DOMBaseNode):
 	"""
@@ -68,9 +85,11 @@ class DOMElementNode(DOMBaseNode):
 	is_in_viewport: bool = False
 	shadow_root: bool = False
 	highlight_index: int | None = None
+	backend_node_id: int | None = None  # CDP DOM.BackendNodeId, only captured when BrowserProfile(cdp_element_actions=True)
 	viewport_coordinates: CoordinateSet | None = None
 	page_coordinates: CoordinateSet | None = None
 	viewport_info: ViewportInfo | None = None
+	scroll_info: ScrollInfo | None = None  # set if the element is an inner scroll container
 
 	"""
 	### State injected by the browser context.
@@ -193,6 +212,13 @@ class DOMElementNode(DOMBaseNode):
 							# Format as key1='value1' key2='value2'
 							attributes_html_str = ' '.join(f"{key}='{value}'" for key, value in attributes_to_include.items())
 
+					# tell the LLM which elements scroll on their own + how far, so it can scroll them by index
+					if node.scroll_info:
+						scroll_str = (
+							f"scrollable='{node.scroll_info.pixels_above}px above, {node.scroll_info.pixels_below}px below'"
+						)
+						attributes_html_str = f'{attributes_html_str} {scroll_str}' if attributes_html_str else scroll_str
+
 					# Build the line
 					if node.is_new:
 						highlight_indicator = f'*[{node.highlight_index}]*'
@@ -241,3 +267,23 @@ SelectorMap = dict[int, DOMElementNode]
 class DOMState:
 	element_tree: DOMElementNode
 	selector_map: SelectorMap
+
+
+@dataclass
+class PageProbe:
+	"""Cheap per-step page facts (liveness, title, scroll position, bytes loaded) collected in a single evaluate round-trip"""
+
+	url: str
+	title: str
+	scroll_y: int
+	viewport_height: int
+	scroll_height: int
+	transfer_size: int = 0
+
+	@property
+	def pixels_above(self) -> int:
+		return self.scroll_y
+
+	@property
+	def pixels_below(self) -> int:
+		return self.scroll_height - (self.scroll_y + self.viewport_height)
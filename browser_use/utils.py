@@ -2,6 +2,7 @@ import asyncio
 import logging
 import os
 import platform
+import re
 import signal
 import time
 from collections.abc import Callable, Coroutine
@@ -477,3 +478,95 @@ def match_url_with_domain_pattern(url: str, domain_pattern: str, log_warnings: b
 		logger = logging.getLogger(__name__)
 		logger.error(f'⛔️ Error matching URL {url} with pattern {domain_pattern}: {type(e).__name__}: {e}')
 		return False
+
+
+SECRET_PLACEHOLDER_PATTERN = re.compile(r'<secret>(.*?)</secret>')
+
+
+def _trie_pattern(words: list[str]) -> str:
+	"""Regex matching any of words, shaped like their prefix trie so a match attempt never re-scans a shared prefix"""
+	trie: dict = {}
+	for word in words:
+		node = trie
+		for char in word:
+			node = node.setdefault(char, {})
+		node[''] = {}  # end of a word
+
+	def to_pattern(node: dict) -> str:
+		parts = []
+		# follow single-child chains iteratively, only branches recurse
+		while len(node) == 1 and '' not in node:
+			char, node = next(iter(node.items()))
+			parts.append(re.escape(char))
+		branches = [re.escape(char) + to_pattern(child) for char, child in node.items() if char]
+		if branches:
+			body = '(?:' + '|'.join(branches) + ')' if len(branches) > 1 or '' in node else branches[0]
+			# a shorter word ending here only matches if no longer one does
+			parts.append(body + '?' if '' in node else body)
+		return ''.join(parts)
+
+	return to_pattern(trie)
+
+
+class SensitiveDataMatcher:
+	"""
+	sensitive_data compiled once into a single trie-shaped regex over all secret values, so redacting a text is one pass
+	instead of one str.replace per secret, plus the memoized per-URL secrets used to fill in <secret>placeholders</secret>.
+	Shared by the MessageManager (redaction) and the Registry (placeholder substitution) via for_sensitive_data().
+	"""
+
+	URL_CACHE_SIZE = 256
+	_compiled: dict[int, 'SensitiveDataMatcher'] = {}
+
+	def __init__(self, sensitive_data: dict[str, str | dict[str, str]]):
+		# snapshot, so in-place changes of the original dict are noticed by for_sensitive_data
+		self.sensitive_data = {k: dict(v) if isinstance(v, dict) else v for k, v in sensitive_data.items()}
+
+		# secret value -> placeholder name, secrets of all domains are redacted
+		self.placeholders: dict[str, str] = {}
+		for key_or_domain, content in self.sensitive_data.items():
+			if isinstance(content, dict):
+				for key, value in content.items():
+					if value:
+						self.placeholders.setdefault(value, key)
+			elif content:
+				self.placeholders.setdefault(content, key_or_domain)
+
+		self._pattern = re.compile(_trie_pattern(list(self.placeholders))) if self.placeholders else None
+		self._secrets_by_url: dict[str | None, dict[str, str]] = {}
+
+	@classmethod
+	def for_sensitive_data(cls, sensitive_data: dict[str, str | dict[str, str]]) -> 'SensitiveDataMatcher':
+		"""Get the compiled matcher for a sensitive_data dict, it is only recompiled when the dict's contents change"""
+		matcher = cls._compiled.get(id(sensitive_data))
+		if matcher is None or matcher.sensitive_data != sensitive_data:
+			if len(cls._compiled) >= 32:
+				cls._compiled.clear()
+			matcher = cls._compiled[id(sensitive_data)] = cls(sensitive_data)
+		return matcher
+
+	def redact(self, text: str) -> str:
+		"""Replace every secret value in text with its <secret>placeholder</secret> (longest secret wins on overlaps)"""
+		if self._pattern is None:
+			return text
+		return self._pattern.sub(lambda match: f'<secret>{self.placeholders[match.group(0)]}</secret>', text)
+
+	def secrets_for_url(self, url: str | None) -> dict[str, str]:
+		"""Placeholder name -> value of the secrets usable on url, domain-specific ones only on matching (real) URLs"""
+		secrets = self._secrets_by_url.get(url)
+		if secrets is None:
+			secrets = {}
+			for domain_or_key, content in self.sensitive_data.items():
+				if isinstance(content, dict):
+					# it's a real url, check it using our custom allowed_domains scheme://*.example.com glob matching
+					if url and url != 'about:blank' and match_url_with_domain_pattern(url, domain_or_key):
+						secrets.update(content)
+				else:
+					# Old format: {key: value}, expose to all domains (only allowed for legacy reasons)
+					secrets[domain_or_key] = content
+			secrets = {k: v for k, v in secrets.items() if v}
+
+			if len(self._secrets_by_url) >= self.URL_CACHE_SIZE:
+				self._secrets_by_url.clear()
+			self._secrets_by_url[url] = secrets
+		return secrets
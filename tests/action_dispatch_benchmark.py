@@ -0,0 +1,71 @@
+"""
+Measure the per-action dispatch overhead of Controller.act / Registry.execute_action: 10k calls of no-op actions,
+compared to awaiting the action functions directly (best of REPEATS runs).
+No browser is started, the actions don't touch the page.
+
+Usage:
+	python tests/action_dispatch_benchmark.py
+"""
+
+import asyncio
+import os
+import time
+
+os.environ.setdefault('ANONYMIZED_TELEMETRY', 'false')
+
+from pydantic import BaseModel
+
+from browser_use import Controller
+from browser_use.agent.views import ActionResult
+from browser_use.browser import BrowserSession
+
+CALLS = 10_000
+REPEATS = 3  # best of, the timings are small enough for scheduler noise to matter
+
+
+class NoteParams(BaseModel):
+	text: str
+	priority: int = 0
+
+
+async def test_action_dispatch_overhead():
+	controller = Controller()
+
+	@controller.action('Take a note', param_model=NoteParams)
+	async def take_note(params: NoteParams):
+		return ActionResult(extracted_content=params.text)
+
+	@controller.action('Count something')
+	async def count_items(count: int, browser_session: BrowserSession):
+		return ActionResult()
+
+	browser_session = BrowserSession()
+	ActionModel = controller.registry.create_action_model()
+	actions = {
+		'take_note (param model)': ActionModel(take_note=NoteParams(text='remember this')),
+		'count_items (plain args + browser_session)': ActionModel(count_items={'count': 3}),
+	}
+
+	async def per_call_us(call) -> float:
+		timings = []
+		for _ in range(REPEATS):
+			start = time.perf_counter()
+			for _ in range(CALLS):
+				await call()
+			timings.append((time.perf_counter() - start) / CALLS * 1e6)
+		return min(timings)
+
+	direct_us = await per_call_us(lambda: take_note.__wrapped__(NoteParams(text='remember this')))
+	print(f'\n{"direct call of the action function":>45}: {direct_us:6.1f}µs per action')
+
+	for label, action in actions.items():
+		action_name, params = next(iter(action.model_dump(exclude_unset=True).items()))
+		act_us = await per_call_us(lambda: controller.act(action, browser_session=browser_session))
+		execute_us = await per_call_us(
+			lambda: controller.registry.execute_action(action_name, params, browser_session=browser_session)
+		)
+		print(f'{label:>45}: {act_us:6.1f}µs per Controller.act | {execute_us:6.1f}µs per Registry.execute_action')
+
+
+if __name__ == '__main__':
+	asyncio.run(test_action_dispatch_overhead())
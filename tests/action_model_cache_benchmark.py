@@ -0,0 +1,94 @@
+"""
+Measure the per-step cost of rebuilding the dynamic ActionModel/AgentOutput types (what Agent._update_action_models_for_page
+does before every LLM call) with a cold cache vs the per-action-set cache, and the cost of filtering 150 domain/page-filtered
+custom actions for the prompt + model on every step vs the per-URL memoization.
+
+Usage:
+	python tests/action_model_cache_benchmark.py
+"""
+
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault('ANONYMIZED_TELEMETRY', 'false')
+
+from browser_use.agent.views import AgentOutput
+from browser_use.controller.service import Controller
+
+ROUNDS = 200
+CUSTOM_ACTIONS = 150
+
+
+class FakePage:
+	def __init__(self, url: str):
+		self.url = url
+
+
+def update_action_models_for_page(controller: Controller, page: FakePage) -> None:
+	action_model = controller.registry.create_action_model(page=page)
+	AgentOutput.type_with_custom_actions(action_model)
+	done_action_model = controller.registry.create_action_model(include_actions=['done'], page=page)
+	AgentOutput.type_with_custom_actions(done_action_model)
+
+
+def measure(controller: Controller, cold: bool) -> list[float]:
+	timings = []
+	for i in range(ROUNDS):
+		if cold:
+			controller.registry._action_model_cache.clear()
+			controller.registry._page_actions_cache.clear()
+			AgentOutput.type_with_custom_actions.cache_clear()
+		page = FakePage(f'https://example.com/page-{i}')
+		start = time.perf_counter()
+		update_action_models_for_page(controller, page)
+		timings.append(time.perf_counter() - start)
+	return timings
+
+
+def register_custom_actions(controller: Controller) -> None:
+	for i in range(CUSTOM_ACTIONS):
+
+		async def custom_action(text: str):
+			pass
+
+		custom_action.__name__ = f'custom_action_{i}'
+		controller.registry.action(f'Custom action {i}', domains=[f'*.site-{i}.com', 'example.com'])(custom_action)
+
+
+def measure_step_filtering(controller: Controller, cold: bool) -> list[float]:
+	timings = []
+	page = FakePage('https://example.com/')
+	for _ in range(ROUNDS):
+		if cold:
+			controller.registry._page_actions_cache.clear()
+		start = time.perf_counter()
+		# what a step asks for: the page's action model + done model + the page-specific and system prompt descriptions
+		update_action_models_for_page(controller, page)
+		controller.registry.get_prompt_description(page)
+		controller.registry.get_prompt_description()
+		timings.append(time.perf_counter() - start)
+	return timings
+
+
+async def test_action_model_cache():
+	controller = Controller()
+	cold_ms = statistics.median(measure(controller, cold=True)) * 1000
+	warm_ms = statistics.median(measure(controller, cold=False)) * 1000
+	print(
+		f'{len(controller.registry.registry.actions)} actions: cold {cold_ms:7.2f}ms | cached {warm_ms:7.3f}ms per step '
+		f'({cold_ms / warm_ms:.0f}x, median of {ROUNDS})'
+	)
+
+	register_custom_actions(controller)
+	unmemoized_ms = statistics.median(measure_step_filtering(controller, cold=True)) * 1000
+	memoized_ms = statistics.median(measure_step_filtering(controller, cold=False)) * 1000
+	print(
+		f'{len(controller.registry.registry.actions)} actions: filtering per call {unmemoized_ms:7.2f}ms | '
+		f'memoized per URL {memoized_ms:7.3f}ms per step (median of {ROUNDS})'
+	)
+
+
+if __name__ == '__main__':
+	asyncio.run(test_action_model_cache())
@@ -0,0 +1,89 @@
+"""
+Compare how long a page takes to settle in a foreground tab vs a background tab (one that another tab is in front of),
+with and without BrowserProfile(disable_background_throttling=True).
+
+The test page only settles after a chain of timers + animation frames, which is exactly what chromium throttles/pauses
+in background tabs. Run it headful to see the difference (headless tabs are not occluded by each other):
+
+Usage:
+	python tests/background_tab_benchmark.py
+	HEADLESS=false python tests/background_tab_benchmark.py
+"""
+
+import asyncio
+import os
+import statistics
+import time
+
+from browser_use.browser import BrowserProfile, BrowserSession
+
+ROUNDS = 5
+SETTLE_TIMEOUT = 10_000
+HEADLESS = os.environ.get('HEADLESS', 'true').lower()[0] in 'ty1'
+SETTLE_PAGE_HTML = """
+<html><body><script>
+	let ticks = 0;
+	function tick() {
+		if (++ticks >= 20) { document.title = 'settled'; return; }
+		setTimeout(() => requestAnimationFrame(tick), 10);
+	}
+	requestAnimationFrame(tick);
+</script></body></html>
+"""
+
+
+async def settle_time(page) -> float:
+	start = time.perf_counter()
+	await page.set_content(SETTLE_PAGE_HTML)
+	try:
+		await page.wait_for_function('document.title === "settled"', timeout=SETTLE_TIMEOUT)
+	except Exception:
+		return float('inf')  # never settled, rAF is paused entirely in hidden tabs
+	return time.perf_counter() - start
+
+
+async def measure(disable_background_throttling: bool) -> dict[str, list[float]]:
+	browser_session = BrowserSession(
+		browser_profile=BrowserProfile(
+			headless=HEADLESS,
+			user_data_dir=None,
+			disable_background_throttling=disable_background_throttling,
+			# measure the real chromium defaults without the option, our CHROME_DEFAULT_ARGS already include the flags
+			# (disable_background_throttling=True drops them from ignore_default_args again, so that run gets both the
+			# launch flags and the CDP focus emulation)
+			ignore_default_args=[
+				'--disable-background-timer-throttling',
+				'--disable-backgrounding-occluded-windows',
+				'--disable-renderer-backgrounding',
+			],
+		)
+	)
+	await browser_session.start()
+	timings: dict[str, list[float]] = {'foreground': [], 'background': []}
+	try:
+		background_page = await browser_session.get_current_page()
+		foreground_page = await browser_session.browser_context.new_page()
+		await foreground_page.bring_to_front()
+		await asyncio.sleep(1)  # let the CDP overrides for the new tab apply
+
+		for _ in range(ROUNDS):
+			timings['foreground'].append(await settle_time(foreground_page))
+			timings['background'].append(await settle_time(background_page))
+	finally:
+		await browser_session.stop()
+	return timings
+
+
+async def test_background_tab_settle_time():
+	for disable_background_throttling in (False, True):
+		timings = await measure(disable_background_throttling)
+		foreground_ms = statistics.median(timings['foreground']) * 1000
+		background_ms = statistics.median(timings['background']) * 1000
+		print(
+			f'disable_background_throttling={disable_background_throttling!s:>5}: '
+			f'foreground {foreground_ms:8.1f}ms | background {background_ms:8.1f}ms (median of {ROUNDS}, headless={HEADLESS})'
+		)
+
+
+if __name__ == '__main__':
+	asyncio.run(test_background_tab_settle_time())
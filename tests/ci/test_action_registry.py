@@ -12,13 +12,14 @@ Tests cover:
 
 import asyncio
 import logging
+from unittest.mock import MagicMock
 
 import pytest
 from playwright.async_api import Page
 from pydantic import Field
 from pytest_httpserver import HTTPServer
 
-from browser_use.agent.views import ActionResult
+from browser_use.agent.views import ActionResult, AgentOutput
 from browser_use.browser import BrowserSession
 from browser_use.controller.registry.service import Registry
 from browser_use.controller.registry.views import ActionModel as BaseActionModel
@@ -707,6 +708,49 @@ class TestType1Pattern:
 			return ActionResult(extracted_content=params.goal)
 
 		assert 'extract_content' in registry.registry.actions
+		assert registry.registry.actions['extract_content'].special_param_names == {
+			'browser_session',
+			'page',
+			'page_extraction_llm',
+		}
+
+	async def test_dispatch_passes_validated_params_and_only_needed_context(self):
+		"""Test that params from an ActionModel are not re-validated and the page is only fetched for actions taking it"""
+		registry = Registry()
+
+		class NoteAction(BaseActionModel):
+			text: str
+
+		@registry.action('Take a note', param_model=NoteAction)
+		async def take_note(params: NoteAction, browser_session: BrowserSession):
+			return ActionResult(extracted_content=f'{params.text} {id(params)}')
+
+		params = NoteAction(text='remember')
+		browser_session = MagicMock(spec=BrowserSession)
+
+		result = await registry.execute_action('take_note', params, browser_session=browser_session)
+
+		assert result.extracted_content == f'remember {id(params)}'
+		browser_session.get_current_page.assert_not_called()
+
+	async def test_dispatch_revalidates_params_from_another_param_model(self):
+		"""Test that params built for an earlier registration of the action are dumped and validated by the current one"""
+		registry = Registry()
+
+		class OldNoteAction(BaseActionModel):
+			text: str
+
+		class NoteAction(BaseActionModel):
+			text: str
+			pinned: bool = False
+
+		@registry.action('Take a note', param_model=NoteAction)
+		async def take_note(params: NoteAction):
+			return ActionResult(extracted_content=f'{params.text} pinned={params.pinned}')
+
+		result = await registry.execute_action('take_note', OldNoteAction(text='remember'))
+
+		assert result.extracted_content == 'remember pinned=False'
 
 
 class TestType2Pattern:
@@ -940,6 +984,83 @@ class TestParamsModelGeneration:
 		# Optional should allow null
 		assert 'null' in schema['properties']['name']['anyOf'][1]['type']
 
+	def test_action_models_are_cached_per_action_set(self):
+		"""ActionModel/AgentOutput should be reused while the set of available actions is unchanged"""
+		registry = Registry()
+
+		@registry.action('First action')
+		async def first_action(text: str):
+			return ActionResult()
+
+		@registry.action('Admin action', domains=['admin.example.com'])
+		async def admin_action(text: str):
+			return ActionResult()
+
+		page = MagicMock(spec=Page)
+		page.url = 'https://example.com/a'
+		model = registry.create_action_model(page=page)
+		page.url = 'https://example.com/b'
+		assert registry.create_action_model(page=page) is model
+		assert registry.create_action_model() is model
+		assert AgentOutput.type_with_custom_actions(model) is AgentOutput.type_with_custom_actions(model)
+		assert AgentOutput.type_with_custom_actions.cache_info().maxsize is not None  # bounded, models aren't kept forever
+
+		# a different action set gets its own model, include_actions subsets (e.g. done-only) share the cache
+		page.url = 'https://admin.example.com'
+		admin_model = registry.create_action_model(page=page)
+		assert admin_model is not model
+		assert 'admin_action' in admin_model.model_fields
+		assert registry.create_action_model(include_actions=['first_action'], page=page) is model
+
+		# registering a new action invalidates the cache
+		@registry.action('Second action')
+		async def second_action(text: str):
+			return ActionResult()
+
+		new_model = registry.create_action_model()
+		assert new_model is not model
+		assert 'second_action' in new_model.model_fields
+
+	def test_page_actions_are_memoized_per_url(self):
+		"""Filters should run once per URL, returning the actions, prompt and model together"""
+		registry = Registry()
+		filter_calls = []
+
+		def admin_only(page):
+			filter_calls.append(page.url)
+			return '/admin' in page.url
+
+		@registry.action('Plain action')
+		async def plain_action(text: str):
+			return ActionResult()
+
+		@registry.action('Admin action', page_filter=admin_only)
+		async def admin_action(text: str):
+			return ActionResult()
+
+		page = MagicMock(spec=Page)
+		page.url = 'https://example.com/admin'
+		page_actions = registry.get_page_actions(page)
+		assert set(page_actions.actions) == {'plain_action', 'admin_action'}
+		assert page_actions.prompt_description.startswith('Admin action')
+		assert 'Plain action' not in page_actions.prompt_description  # already in the system prompt
+		assert registry.create_action_model(page=page) is page_actions.action_model
+		assert registry.get_prompt_description(page) == page_actions.prompt_description
+		assert filter_calls == ['https://example.com/admin']
+
+		page.url = 'https://example.com/home'
+		assert registry.get_prompt_description(page) == ''
+		assert 'Plain action' in registry.get_prompt_description()
+		assert len(filter_calls) == 2
+
+		# registering an action invalidates the memoized results
+		@registry.action('Other action')
+		async def other_action(text: str):
+			return ActionResult()
+
+		assert 'other_action' in registry.get_page_actions(page).actions
+		assert len(filter_calls) == 3
+
 
 class TestErrorMessages:
 	"""Test error messages for validation failures (from normalization tests)"""
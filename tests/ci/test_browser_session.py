@@ -1,10 +1,15 @@
 import asyncio
 import base64
+from urllib.parse import urlparse
 
 import pytest
+from playwright.async_api import Error as PlaywrightError
 from pytest_httpserver import HTTPServer
 
+from browser_use.agent.service import is_browser_error
 from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.profile import InputTextStrategy
+from browser_use.browser.views import BrowserError
 from browser_use.dom.views import DOMElementNode
 
 
@@ -106,6 +111,26 @@ class TestBrowserContext:
 		# urlparse will return an empty netloc for some malformed URLs.
 		assert context2._is_url_allowed('notaurl') is False
 
+	def test_input_text_strategies_for(self):
+		"""Test that input_text tries the configured strategy only (per-character typing by default), or the last one that worked on the domain first in auto mode."""
+		browser_session = BrowserSession(browser_profile=BrowserProfile())
+		assert browser_session._input_text_strategies_for('https://example.com/form') == [InputTextStrategy.TYPE]
+
+		browser_session = BrowserSession(browser_profile=BrowserProfile(input_text_strategy='fill'))
+		assert browser_session._input_text_strategies_for('https://example.com/form') == [InputTextStrategy.FILL]
+
+		browser_session = BrowserSession(browser_profile=BrowserProfile(input_text_strategy='auto'))
+		fastest_first = [InputTextStrategy.FILL, InputTextStrategy.INSERT_TEXT, InputTextStrategy.TYPE]
+		assert browser_session._input_text_strategies_for('https://example.com/form') == fastest_first
+
+		browser_session._input_text_strategy_by_domain['example.com'] = InputTextStrategy.TYPE
+		assert browser_session._input_text_strategies_for('https://example.com/other') == [
+			InputTextStrategy.TYPE,
+			InputTextStrategy.FILL,
+			InputTextStrategy.INSERT_TEXT,
+		]
+		assert browser_session._input_text_strategies_for('https://other.com/') == fastest_first
+
 	def test_convert_simple_xpath_to_css_selector(self):
 		"""
 		Test the _convert_simple_xpath_to_css_selector method of BrowserSession.
@@ -239,6 +264,23 @@ class TestBrowserContext:
 		assert pixels_above_after_scroll >= 400, 'Page should be scrolled down at least 400px'
 		assert pixels_below_after_scroll < pixels_below_initial, 'Less content should be below viewport after scrolling'
 
+	@pytest.mark.asyncio
+	async def test_get_page_probe(self, browser_session, base_url):
+		"""Test that get_page_probe returns title, scroll and transfer info in one call."""
+		await browser_session.navigate(f'{base_url}/scroll_test')
+		page = await browser_session.get_current_page()
+
+		probe = await browser_session.get_page_probe(page)
+		assert probe.url == page.url
+		assert probe.title == await page.title()
+		assert probe.viewport_height > 0
+		assert probe.pixels_above == 0
+		assert probe.pixels_below > 0
+		assert probe.transfer_size >= 0
+
+		# the probe and get_scroll_info must agree
+		assert (probe.pixels_above, probe.pixels_below) == await browser_session.get_scroll_info(page)
+
 	@pytest.mark.asyncio
 	async def test_take_screenshot(self, browser_session, base_url):
 		"""Test that take_screenshot returns a valid base64 encoded image."""
@@ -331,3 +373,175 @@ class TestBrowserContext:
 			"document.querySelector('h1').hasAttribute('browser-user-highlight-id')"
 		)
 		assert not attribute_exists, 'browser-user-highlight-id attribute should be removed'
+
+	@pytest.mark.asyncio
+	async def test_element_handle_cache(self, browser_session, base_url):
+		"""Test that get_locate_element reuses ElementHandles until the element moves in the DOM or the page navigates."""
+		await browser_session.navigate(f'{base_url}/')
+		heading = DOMElementNode(tag_name='h1', is_visible=True, parent=None, xpath='html/body/h1', attributes={}, children=[])
+		stats = browser_session.element_handle_cache_stats
+		hits, misses, invalidations = stats.hits, stats.misses, stats.invalidations
+
+		first_handle = await browser_session.get_locate_element(heading)
+		second_handle = await browser_session.get_locate_element(heading)
+		assert first_handle is not None and second_handle is first_handle
+		assert (stats.hits, stats.misses) == (hits + 1, misses + 1)
+
+		# inserting a sibling h1 before it changes its xpath to html/body/h1[2], so the cached handle must not be reused
+		await browser_session.execute_javascript("document.body.prepend(document.createElement('h1'))")
+		third_handle = await browser_session.get_locate_element(heading)
+		assert third_handle is not first_handle
+		assert stats.invalidations == invalidations + 1
+
+		# navigating drops every cached handle for the page
+		await browser_session.navigate(f'{base_url}/')
+		assert stats.invalidations == invalidations + 2
+		await browser_session.get_locate_element(heading)
+		assert stats.misses == misses + 3
+
+	@pytest.mark.asyncio
+	async def test_cdp_element_actions(self, base_url, monkeypatch):
+		"""Test that cdp_element_actions=True captures backend node ids and clicks/types through them."""
+		browser_session = BrowserSession(
+			browser_profile=BrowserProfile(headless=True, user_data_dir=None, cdp_element_actions=True)
+		)
+		await browser_session.start()
+		try:
+			page = await browser_session.get_current_page()
+			await page.set_content(
+				'<input id="name"><input id="agree" type="checkbox">'
+				'<button onclick="window.clicks = (window.clicks || 0) + 1; document.title = `clicked`">Go</button>'
+			)
+			state = await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+			input_node = next(node for node in state.selector_map.values() if node.attributes.get('id') == 'name')
+			checkbox_node = next(node for node in state.selector_map.values() if node.attributes.get('id') == 'agree')
+			button_node = next(node for node in state.selector_map.values() if node.tag_name == 'button')
+			assert input_node.backend_node_id is not None
+			assert button_node.backend_node_id is not None
+
+			await browser_session._input_text_element_node(input_node, 'hello')
+			assert await page.input_value('#name') == 'hello'
+
+			# checkboxes have a value too, but aren't text fields
+			with pytest.raises(BrowserError):
+				await browser_session._input_text_backend_node(page, checkbox_node.backend_node_id, 'hello')
+
+			await browser_session._click_element_node(button_node)
+			assert await page.title() == 'clicked'
+			assert await page.evaluate('window.clicks') == 1
+
+			# a failure after the click went through must not fall back to clicking the element again
+			async def failing_navigation_check(self, page):
+				raise RuntimeError('navigation check failed')
+
+			monkeypatch.setattr(BrowserSession, '_check_and_handle_navigation', failing_navigation_check)
+			with pytest.raises(Exception, match='navigation check failed'):
+				await browser_session._click_element_node(button_node)
+			assert await page.evaluate('window.clicks') == 2
+		finally:
+			await browser_session.stop()
+
+	@pytest.mark.asyncio
+	async def test_input_text_strategies(self, browser_session, base_url):
+		"""Test the events each input_text strategy produces: fill and insert_text set the value without key events, type presses every key."""
+		await browser_session.navigate(f'{base_url}/')
+		page = await browser_session.get_current_page()
+		await page.set_content(
+			'<input id="field" onkeydown="window.keys++" oninput="window.inputs++">'
+			'<script>window.keys = 0; window.inputs = 0;</script>'
+		)
+		field = await page.query_selector('#field')
+
+		for strategy, expected_keys in (
+			(InputTextStrategy.FILL, 0),
+			(InputTextStrategy.INSERT_TEXT, 0),
+			(InputTextStrategy.TYPE, len('hello')),
+		):
+			await page.evaluate('window.keys = 0; window.inputs = 0')
+			await field.focus()
+			await browser_session._apply_input_text_strategy(page, field, strategy, 'hello')
+			assert await page.input_value('#field') == 'hello', strategy
+			assert await page.evaluate('window.keys') == expected_keys, strategy
+			assert await page.evaluate('window.inputs') >= 1, strategy
+
+	@pytest.mark.asyncio
+	async def test_input_text_auto_strategy_learns_per_domain(self, browser_session, base_url, monkeypatch):
+		"""Test that auto mode falls through to typing on a key-driven widget and tries typing first on that domain afterwards."""
+		monkeypatch.setattr(browser_session.browser_profile, 'input_text_strategy', InputTextStrategy.AUTO)
+		monkeypatch.setattr(browser_session, '_input_text_strategy_by_domain', {})
+		await browser_session.navigate(f'{base_url}/')
+		page = await browser_session.get_current_page()
+		# the widget only accepts text that was entered with key presses, like many autocomplete/masked inputs
+		await page.set_content(
+			'<input id="widget" onkeydown="this.dataset.keys = (+this.dataset.keys || 0) + 1" '
+			'oninput="if (!+this.dataset.keys) this.value = \'\'; this.dataset.keys = 0">'
+		)
+		state = await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+		widget = next(node for node in state.selector_map.values() if node.attributes.get('id') == 'widget')
+
+		await browser_session._input_text_element_node(widget, 'hello')
+		assert await page.input_value('#widget') == 'hello'
+		assert browser_session._input_text_strategy_by_domain == {urlparse(base_url).hostname: InputTextStrategy.TYPE}
+		assert browser_session._input_text_strategies_for(page.url)[0] == InputTextStrategy.TYPE
+
+	@pytest.mark.asyncio
+	async def test_no_element_references_without_cdp_element_actions(self, browser_session, base_url):
+		"""Test that the DOM extraction only keeps references to the page's elements with cdp_element_actions=True."""
+		await browser_session.navigate(f'{base_url}/')
+		await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+		page = await browser_session.get_current_page()
+		assert await page.evaluate('window._browserUseInteractiveElements') is None
+
+	async def test_recover_from_browser_crash(self, base_url):
+		"""Test that a browser that dies between steps is relaunched with its cookies, tabs, and current tab restored."""
+		browser_session = BrowserSession(browser_profile=BrowserProfile(headless=True, user_data_dir=None))
+		await browser_session.start()
+		try:
+			await browser_session.navigate(f'{base_url}/')
+			await browser_session.create_new_tab(f'{base_url}/scroll_test')
+			await browser_session.switch_to_tab(0)
+			await browser_session.browser_context.add_cookies([{'name': 'session', 'value': 'abc', 'url': base_url}])
+			await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+			assert not await browser_session.detect_crash()  # also snapshots the cookies, like the heartbeat does
+
+			await browser_session.browser.close()  # simulate the browser process going away
+			assert browser_session.crash_reason in ('browser disconnected', 'browser context closed')
+
+			state = await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+			assert browser_session.crash_reason is None
+			assert state.url == f'{base_url}/'
+			assert [tab.url for tab in state.tabs] == [f'{base_url}/', f'{base_url}/scroll_test']
+			assert [c['name'] for c in await browser_session.browser_context.cookies()] == ['session']
+			assert browser_session.health_stats.crashes == 1
+			assert browser_session.health_stats.recoveries == 1
+			assert browser_session.health_stats.tabs_restored == 2
+		finally:
+			await browser_session.stop()
+
+
+def test_disable_background_throttling_keeps_launch_flags():
+	"""Test that disable_background_throttling=True stops ignore_default_args from dropping the background throttling flags"""
+	ignore_default_args = ['--enable-automation', '--disable-renderer-backgrounding']
+	launch_args = BrowserSession(
+		browser_profile=BrowserProfile(ignore_default_args=ignore_default_args), disable_background_throttling=True
+	).browser_profile.kwargs_for_launch()
+
+	assert launch_args.ignore_default_args == ['--enable-automation']
+	assert '--disable-renderer-backgrounding' in launch_args.args
+	assert BrowserProfile(ignore_default_args=ignore_default_args).kwargs_for_launch().ignore_default_args == ignore_default_args
+
+
+def test_only_browser_errors_probe_for_a_crash():
+	"""Test that step errors raised from browser errors are probed for a crash, but LLM/parsing errors are not"""
+	try:
+		try:
+			raise PlaywrightError('Target page, context or browser has been closed')
+		except PlaywrightError as e:
+			raise RuntimeError('Error executing action click_element_by_index') from e
+	except RuntimeError as e:
+		action_error = e
+
+	assert is_browser_error(action_error)
+	assert is_browser_error(BrowserError('Element not found'))
+	assert not is_browser_error(ValueError('Could not parse response.'))
+	assert not is_browser_error(RuntimeError('LLM API call failed'))
@@ -0,0 +1,63 @@
+import pytest
+from pytest_httpserver import HTTPServer
+
+from browser_use.browser import BrowserProfile, BrowserSession
+
+
+class TestPageChangeDetection:
+	"""Tests for the cheap page change signal used by Agent.multi_act instead of a full state capture per action"""
+
+	@pytest.fixture(scope='module')
+	def http_server(self):
+		"""Create and provide a test HTTP server that serves a small form."""
+		server = HTTPServer()
+		server.start()
+		server.expect_request('/form').respond_with_data(
+			"""
+			<html><head><title>Form</title></head><body>
+			<form><input name="first"><input name="last"><input name="email"><button type="button">Send</button></form>
+			<p id="status">Fill in the form</p>
+			</body></html>
+			""",
+			content_type='text/html',
+		)
+		yield server
+		server.stop()
+
+	@pytest.fixture
+	async def browser_session(self):
+		browser_session = BrowserSession(browser_profile=BrowserProfile(headless=True, user_data_dir=None))
+		await browser_session.start()
+		yield browser_session
+		await browser_session.stop()
+
+	async def test_typing_and_text_changes_keep_the_signal(self, browser_session, http_server):
+		"""Test that filling inputs and changing text doesn't count as a change, so no full state capture is needed"""
+		await browser_session.navigate(http_server.url_for('/form'))
+		await browser_session.get_state_summary(cache_clickable_elements_hashes=True)
+		await browser_session.remove_highlights()
+		page = await browser_session.get_current_page()
+
+		for name in ('first', 'last', 'email'):
+			await page.fill(f'input[name={name}]', 'value')
+			await page.evaluate("document.getElementById('status').textContent = 'Typing...'")
+			assert not await browser_session.page_changed_since_state_summary()
+
+		assert browser_session.change_detection_stats.checks == 3
+		assert browser_session.change_detection_stats.skipped_captures == 3
+
+	async def test_new_interactive_elements_and_navigation_change_the_signal(self, browser_session, http_server):
+		"""Test that new interactive elements or a new document are reported as a change"""
+		await browser_session.navigate(http_server.url_for('/form'))
+		await browser_session.get_state_summary(cache_clickable_elements_hashes=True)
+		page = await browser_session.get_current_page()
+
+		await page.evaluate("document.body.insertAdjacentHTML('beforeend', '<ul><li><a href=\"#\">Suggestion</a></li></ul>')")
+		assert await browser_session.page_changed_since_state_summary()
+
+		await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+		assert not await browser_session.page_changed_since_state_summary()
+
+		await page.reload()
+		assert await browser_session.page_changed_since_state_summary()
+		assert browser_session.change_detection_stats.full_captures == 2
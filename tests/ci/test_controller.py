@@ -1363,3 +1363,99 @@ class TestControllerIntegration:
 		# Verify the click actually had an effect on the page
 		result_text = await page.evaluate("document.getElementById('result').textContent")
 		assert result_text == expected_result_text, f"Expected result text '{expected_result_text}', got '{result_text}'"
+
+	async def test_click_download_link(self, controller, base_url, http_server, tmp_path):
+		"""Test that clicking a download link returns immediately and the saved file is reported on a following action."""
+		http_server.expect_request('/download_page').respond_with_data(
+			'<html><body><a href="/report.csv" download="report.csv">Download report</a></body></html>',
+			content_type='text/html',
+		)
+		http_server.expect_request('/report.csv').respond_with_data('a,b\n1,2\n', content_type='text/csv')
+
+		browser_session = BrowserSession(headless=True, user_data_dir=None, save_downloads_path=str(tmp_path))
+		await browser_session.start()
+		try:
+			await browser_session.navigate(f'{base_url}/download_page')
+			state = await browser_session.get_state_summary(cache_clickable_elements_hashes=True)
+			link_index = next(idx for idx, element in state.selector_map.items() if element.tag_name == 'a')
+
+			class ClickElementActionModel(ActionModel):
+				click_element_by_index: ClickElementAction | None = None
+
+			class WaitActionModel(ActionModel):
+				wait: dict | None = None
+
+			start_time = time.time()
+			result = await controller.act(ClickElementActionModel(click_element_by_index={'index': link_index}), browser_session)
+			assert result.error is None
+			assert time.time() - start_time < 4, 'click should not wait for a download timeout'
+
+			# the download finishes in the background and is attached to the next action result
+			await asyncio.sleep(1)
+			result = await controller.act(WaitActionModel(wait={'seconds': 0}), browser_session)
+			assert 'Downloaded file to' in result.extracted_content
+			assert (tmp_path / 'report.csv').read_text() == 'a,b\n1,2\n'
+		finally:
+			await browser_session.stop()
+
+	async def test_scroll_inner_container_by_index(self, controller, browser_session):
+		"""Test that inner scroll containers are reported with their extents and can be scrolled by index, if enabled."""
+		page = await browser_session.get_current_page()
+		await page.set_content(
+			'<html><body><div id="feed" style="height: 200px; overflow-y: auto">'
+			+ ''.join(f'<p style="height: 100px">item {i}</p>' for i in range(20))
+			+ '</div></body></html>'
+		)
+		state = await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+		assert not state.selector_map  # by default the element list is unchanged, the feed is not interactive
+		assert await page.evaluate('window._browserUseScrollContainers') is None
+
+		browser_session.browser_profile.report_scroll_containers = True
+		try:
+			state = await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+		finally:
+			browser_session.browser_profile.report_scroll_containers = False
+		feed_index, feed = next((idx, el) for idx, el in state.selector_map.items() if el.attributes.get('id') == 'feed')
+		assert feed.scroll_info is not None
+		assert feed.scroll_info.pixels_above == 0
+		assert feed.scroll_info.pixels_below > 0
+		assert "scrollable='0px above" in state.element_tree.clickable_elements_to_string()
+
+		class ScrollActionModel(ActionModel):
+			scroll_down: ScrollAction | None = None
+
+		result = await controller.act(ScrollActionModel(scroll_down=ScrollAction(index=feed_index, amount=150)), browser_session)
+		assert f'Scrolled down element {feed_index}' in result.extracted_content
+		assert await page.evaluate('document.getElementById("feed").scrollTop') == 150
+		assert await page.evaluate('window.scrollY') == 0
+
+	async def test_scroll_to_text(self, controller, browser_session):
+		"""Test that scroll_to_text finds text with quotes, split across inline elements, inside shadow roots, and prefers the visible, exact match."""
+		page = await browser_session.get_current_page()
+		await page.set_content(
+			'<html><body><div style="height: 3000px">top</div>'
+			'<p style="display: none">It\'s "quoted" here</p>'
+			'<p id="target">It\'s "quoted" here</p>'
+			'<div style="height: 3000px"></div><p id="split"><b>Total</b> <i>price</i>: 42</p>'
+			'<div style="height: 3000px"></div><div id="host"></div>'
+			'<script>document.getElementById("host").attachShadow({mode: "open"}).innerHTML = "<span>deep in the shadow</span>"</script>'
+			'</body></html>'
+		)
+
+		class ScrollToTextActionModel(ActionModel):
+			scroll_to_text: dict | None = None
+
+		result = await controller.act(ScrollToTextActionModel(scroll_to_text={'text': 'it\'s "QUOTED"'}), browser_session)
+		assert 'Scrolled to text' in result.extracted_content
+		assert await page.evaluate(
+			'(() => { const r = document.getElementById("target").getBoundingClientRect(); return r.top >= 0 && r.bottom <= window.innerHeight })()'
+		)
+
+		match = await browser_session.scroll_to_text('total price')
+		assert match is not None and match['tag'] == 'p' and match['text'] == 'total price: 42'
+
+		match = await browser_session.scroll_to_text('deep in the shadow')
+		assert match is not None and match['tag'] == 'span'
+
+		result = await controller.act(ScrollToTextActionModel(scroll_to_text={'text': 'not on the page'}), browser_session)
+		assert 'not found' in result.extracted_content
@@ -0,0 +1,56 @@
+import asyncio
+import json
+
+import pytest
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.cookies import CookiePersistence
+
+
+class TestCookiePersistence:
+	"""Tests for the debounced, change-aware, atomic cookies_file writer."""
+
+	@pytest.fixture
+	def cookies(self):
+		return [{'name': 'session', 'value': 'abc', 'domain': 'example.com', 'path': '/'}]
+
+	@pytest.fixture
+	def persistence(self, tmp_path, cookies):
+		async def get_cookies():
+			return list(cookies)
+
+		return CookiePersistence(path=tmp_path / 'cookies.json', get_cookies=get_cookies, debounce_seconds=0.05)
+
+	async def test_save_requests_are_coalesced(self, persistence, cookies):
+		"""Test that a burst of save requests results in a single write."""
+		for _ in range(5):
+			persistence.schedule_save()
+		await asyncio.sleep(0.2)
+
+		assert persistence.stats.save_requests == 5
+		assert persistence.stats.coalesced == 4
+		assert persistence.stats.writes == 1
+		assert json.loads(persistence.path.read_text()) == cookies
+
+	async def test_unchanged_cookies_are_not_rewritten(self, persistence, cookies):
+		"""Test that flushing identical cookies (even in a different order) skips the write."""
+		await persistence.flush()
+		cookies.append({'name': 'other', 'value': '1', 'domain': 'a.com', 'path': '/'})
+		await persistence.flush()
+		cookies.reverse()
+		await persistence.flush()
+
+		assert persistence.stats.writes == 2
+		assert persistence.stats.unchanged == 1
+		assert len(json.loads(persistence.path.read_text())) == 2
+
+	async def test_atomic_write_leaves_no_temp_files(self, persistence):
+		"""Test that writes go through a temp file that is renamed into place."""
+		await persistence.flush()
+		assert sorted(p.name for p in persistence.path.parent.iterdir()) == ['cookies.json', 'cookies.json.lock']
+
+	def test_relative_cookies_file_resolves_to_downloads_dir(self, tmp_path):
+		"""Test that a relative cookies_file is stored inside downloads_dir."""
+		browser_session = BrowserSession(browser_profile=BrowserProfile(cookies_file='cookies.json', downloads_dir=tmp_path))
+		assert browser_session.cookie_persistence.path == tmp_path / 'cookies.json'
+		assert BrowserSession(browser_profile=BrowserProfile()).cookie_persistence is None
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from browser_use.browser import BrowserProfile, BrowserSession
+
+
+class TestHarReplay:
+	"""Tests for recording a HAR with record_har_path=... and replaying it offline with replay_har_path=..."""
+
+	@pytest.fixture(scope='module')
+	def event_loop(self):
+		"""Create and provide an event loop for async tests."""
+		loop = asyncio.get_event_loop_policy().new_event_loop()
+		yield loop
+		loop.close()
+
+	@pytest.fixture
+	def http_server(self):
+		"""Create and provide a test HTTP server that serves a single page."""
+		server = HTTPServer()
+		server.start()
+		server.expect_request('/recorded').respond_with_data(
+			'<html><head><title>Recorded Page</title></head><body><h1>Recorded</h1></body></html>',
+			content_type='text/html',
+		)
+		yield server
+		if server.is_running():
+			server.stop()
+
+	async def test_replay_recorded_har_offline(self, http_server, tmp_path):
+		"""Test that a page recorded into a HAR is served from it after the server is gone, and missing entries are aborted."""
+		har_path = tmp_path / 'recording.har'
+		page_url = http_server.url_for('/recorded')
+
+		# record
+		recording_session = BrowserSession(
+			browser_profile=BrowserProfile(headless=True, user_data_dir=None, record_har_path=har_path)
+		)
+		await recording_session.start()
+		await recording_session.navigate(page_url)
+		await recording_session.stop()  # the HAR is written when the context closes
+		assert har_path.exists()
+
+		http_server.stop()  # from here on the page is only available from the HAR
+
+		# replay
+		replay_session = BrowserSession(
+			browser_profile=BrowserProfile(headless=True, user_data_dir=None, replay_har_path=str(har_path))
+		)
+		await replay_session.start()
+		try:
+			await replay_session.navigate(page_url)
+			page = await replay_session.get_current_page()
+			assert await page.title() == 'Recorded Page'
+
+			# requests missing from the HAR are aborted by default, instead of going to the (stopped) server
+			with pytest.raises(Exception):
+				await page.goto(page_url.replace('/recorded', '/never-recorded'))
+		finally:
+			await replay_session.stop()
@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage, SystemMessage, ToolMessage
+
+from browser_use.agent.message_manager.compaction import BudgetedCompactionPolicy
+from browser_use.agent.message_manager.service import MessageManager, MessageManagerSettings
+from browser_use.agent.views import ActionResult, AgentOutput
+from browser_use.browser.views import BrowserStateSummary, TabInfo
+from browser_use.controller.service import Controller
+from browser_use.dom.views import DOMElementNode
+
+MAX_INPUT_TOKENS = 12000
+
+
+class TestHistoryCompaction:
+	"""Tests for the budgeted history compaction of long-running agents (Agent(compaction_policy=...))"""
+
+	@pytest.fixture
+	def agent_output(self):
+		action_model = Controller().registry.create_action_model()
+		return AgentOutput.type_with_custom_actions(action_model)(
+			current_state={
+				'evaluation_previous_goal': 'Success',
+				'memory': 'Reading the results',
+				'next_goal': 'Open the next page',
+			},
+			action=[action_model(scroll_down={'amount': 500})],
+		)
+
+	@staticmethod
+	def browser_state(step: int) -> BrowserStateSummary:
+		url = f'https://example.com/results?page={step}'
+		return BrowserStateSummary(
+			url=url,
+			title='Results',
+			element_tree=DOMElementNode(tag_name='div', attributes={}, children=[], is_visible=True, parent=None, xpath='//div'),
+			selector_map={},
+			tabs=[TabInfo(page_id=0, url=url, title='Results')],
+		)
+
+	@staticmethod
+	def make_message_manager(policy: BudgetedCompactionPolicy) -> MessageManager:
+		return MessageManager(
+			task='Collect every result of the search',
+			system_message=SystemMessage(content='You are a browser agent.'),
+			settings=MessageManagerSettings(max_input_tokens=MAX_INPUT_TOKENS, compaction_policy=policy),
+		)
+
+	def run_step(self, message_manager: MessageManager, agent_output, step: int) -> list:
+		message_manager.add_state_message(
+			browser_state_summary=self.browser_state(step),
+			result=[ActionResult(extracted_content=f'Result {step}: ' + 'x' * 600, include_in_memory=True)],
+		)
+		message_manager.compact_history()
+		messages = message_manager.get_messages()
+		message_manager._remove_last_state_message()
+		message_manager.add_model_output(agent_output)
+		return messages
+
+	@staticmethod
+	def assert_well_formed(messages: list) -> None:
+		"""Every tool call is directly followed by its tool response and every tool response belongs to a tool call"""
+		for i, message in enumerate(messages):
+			if isinstance(message, AIMessage) and message.tool_calls:
+				assert isinstance(messages[i + 1], ToolMessage)
+				assert messages[i + 1].tool_call_id == message.tool_calls[0]['id']
+			if isinstance(message, ToolMessage):
+				assert isinstance(messages[i - 1], AIMessage) and messages[i - 1].tool_calls
+
+	def test_input_stays_bounded_over_500_steps(self, agent_output):
+		"""Test that the history stays inside max_input_tokens and keeps the task and the recent steps verbatim"""
+		message_manager = self.make_message_manager(BudgetedCompactionPolicy(keep_recent_steps=5))
+
+		message_counts = []
+		for step in range(500):
+			messages = self.run_step(message_manager, agent_output, step)
+			assert message_manager.state.history.current_tokens <= MAX_INPUT_TOKENS
+			self.assert_well_formed(messages)
+			message_counts.append(len(messages))
+
+		# compaction runs in batches down to the low water mark, so the size oscillates instead of growing
+		assert max(message_counts[400:]) <= max(message_counts[200:400])
+		assert message_manager.compaction_totals.evicted_action_results > 0
+		assert message_manager.compaction_totals.collapsed_steps > 0
+
+		contents = [str(m.content) for m in messages]
+		assert any('Collect every result of the search' in content for content in contents)
+		assert 'Action result: Result 499: ' + 'x' * 600 in contents
+		assert sum(isinstance(m, AIMessage) and bool(m.tool_calls) for m in messages) >= 5
+
+	def test_default_state_is_not_shared(self, agent_output):
+		"""Test that MessageManagers created without a state don't compact each other's history"""
+		first, second = (
+			MessageManager(
+				task='Collect every result of the search', system_message=SystemMessage(content='You are a browser agent.')
+			)
+			for _ in range(2)
+		)
+		self.run_step(first, agent_output, 0)
+
+		assert first.state is not second.state
+		assert first.settings is not second.settings
+		assert len(second.state.history.messages) < len(first.state.history.messages)
+
+	def test_old_steps_collapse_into_one_line(self, agent_output):
+		"""Test that a tool call + tool response pair older than keep_recent_steps becomes a one-line summary"""
+		message_manager = self.make_message_manager(
+			BudgetedCompactionPolicy(keep_recent_steps=2, type_budgets={'model_output': 500})
+		)
+		for step in range(10):
+			self.run_step(message_manager, agent_output, step)
+
+		collapsed = [m for m in message_manager.state.history.messages if m.metadata.message_type == 'collapsed']
+		assert collapsed
+		assert collapsed[0].message.content == 'Earlier step: scroll_down({"amount": 500}) - goal: Open the next page'
+		assert sum(m.metadata.message_type == 'model_output' for m in message_manager.state.history.messages) >= 4
+
+	async def test_background_summary_replaces_collapsed_steps(self, agent_output):
+		"""Test that the collapsed steps are merged into one summary without blocking the step that started it"""
+		policy = BudgetedCompactionPolicy(
+			keep_recent_steps=2,
+			type_budgets={'model_output': 500},
+			summary_llm=FakeListChatModel(responses=['Read result pages 0 to 5']),
+			summarize_after=3,
+		)
+		message_manager = self.make_message_manager(policy)
+
+		for step in range(12):
+			self.run_step(message_manager, agent_output, step)
+			if policy._summary_task is not None:
+				break
+		assert policy._summary_task is not None
+
+		await asyncio.sleep(0.1)
+		self.run_step(message_manager, agent_output, 12)
+
+		summaries = [m for m in message_manager.state.history.messages if m.metadata.message_type == 'summary']
+		assert [m.message.content for m in summaries] == ['Summary of the earlier steps:\nRead result pages 0 to 5']
+		assert message_manager.compaction_totals.summarized_messages >= 3
+		self.assert_well_formed(message_manager.get_messages())
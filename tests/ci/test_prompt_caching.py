@@ -0,0 +1,82 @@
+import pytest
+from langchain_core.load import dumps
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from browser_use.agent.message_manager.service import MessageManager, MessageManagerSettings
+from browser_use.agent.views import ActionResult, AgentOutput
+from browser_use.browser.views import BrowserStateSummary, TabInfo
+from browser_use.controller.service import Controller
+from browser_use.dom.views import DOMElementNode
+
+
+class TestPromptCacheLayout:
+	"""Tests for the prompt-cache-friendly message layout (Agent(prompt_caching=True))"""
+
+	@pytest.fixture
+	def message_manager(self):
+		return MessageManager(
+			task='Find the price of the cheapest flight',
+			system_message=SystemMessage(content='You are a browser agent. Available actions: ...'),
+			settings=MessageManagerSettings(cache_breakpoints=True),
+		)
+
+	@pytest.fixture
+	def agent_output(self):
+		action_model = Controller().registry.create_action_model()
+		return AgentOutput.type_with_custom_actions(action_model)(
+			current_state={'evaluation_previous_goal': 'Unknown', 'memory': 'Started', 'next_goal': 'Open the site'},
+			action=[action_model(go_to_url={'url': 'https://example.com'})],
+		)
+
+	@staticmethod
+	def browser_state(url: str) -> BrowserStateSummary:
+		return BrowserStateSummary(
+			url=url,
+			title='Flights',
+			element_tree=DOMElementNode(tag_name='div', attributes={}, children=[], is_visible=True, parent=None, xpath='//div'),
+			selector_map={},
+			tabs=[TabInfo(page_id=0, url=url, title='Flights')],
+		)
+
+	def run_step(self, message_manager: MessageManager, agent_output, url: str, **kwargs) -> list:
+		message_manager.add_state_message(browser_state_summary=self.browser_state(url), **kwargs)
+		messages = message_manager.get_messages()
+		message_manager._remove_last_state_message()
+		message_manager.add_model_output(agent_output)
+		return messages
+
+	def test_history_is_an_append_only_prefix(self, message_manager, agent_output):
+		"""Test that everything before the state message is sent again byte-for-byte in the next step"""
+		message_manager.settings.cache_breakpoints = False
+		first_step = self.run_step(message_manager, agent_output, 'https://example.com/1')
+		second_step = self.run_step(
+			message_manager,
+			agent_output,
+			'https://example.com/2',
+			result=[ActionResult(extracted_content='Clicked', include_in_memory=True)],
+			page_actions='Book flight: {book_flight: {}}',
+		)
+
+		assert [dumps(m) for m in second_step[: len(first_step) - 1]] == [dumps(m) for m in first_step[:-1]]
+		# page-specific actions only go into the (uncached) state message, not into the history
+		assert 'Book flight' in str(second_step[-1].content)
+		assert not any('Book flight' in str(m.message.content) for m in message_manager.state.history.messages)
+
+	def test_cache_breakpoints(self, message_manager, agent_output):
+		"""Test that the system prompt and the last history message before the state message are cache breakpoints"""
+		self.run_step(message_manager, agent_output, 'https://example.com/1')
+		message_manager.add_state_message(
+			browser_state_summary=self.browser_state('https://example.com/2'),
+			result=[ActionResult(extracted_content='Clicked', include_in_memory=True)],
+		)
+		messages = message_manager.get_messages()
+
+		marked = [i for i, m in enumerate(messages) if 'cache_control' in str(m.content)]
+		assert marked == [0, len(messages) - 2]
+		# the markers are only added to the copies that are sent, the stored history is untouched
+		assert not any('cache_control' in str(m.message.content) for m in message_manager.state.history.messages)
+		assert isinstance(messages[-2], HumanMessage)
+		assert messages[-2].content == [
+			{'type': 'text', 'text': 'Action result: Clicked', 'cache_control': {'type': 'ephemeral'}}
+		]
+		assert 'cache_control' not in str(messages[-1].content)
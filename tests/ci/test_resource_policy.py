@@ -0,0 +1,117 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.profile import ResourceClass
+from browser_use.browser.session import _classify_request
+
+
+class TestResourcePolicy:
+	"""Tests for BrowserProfile(blocked_resource_classes=..., blocked_url_patterns=..., resource_policy_overrides=...)"""
+
+	def test_classify_request(self):
+		"""Test that requests are classified by provider hostname, playwright resource type, and file extension."""
+		assert _classify_request('https://securepubads.g.doubleclick.net/tag/js/gpt.js', 'script') == {ResourceClass.ADS}
+		assert _classify_request('https://www.google-analytics.com/analytics.js', 'script') == {ResourceClass.ANALYTICS}
+		assert _classify_request('https://fonts.gstatic.com/s/roboto/v30/font.woff2', 'font') == {ResourceClass.FONTS}
+		assert _classify_request('https://cdn.example.com/font.woff2', 'other') == {ResourceClass.FONTS}
+		assert _classify_request('https://cdn.example.com/intro.mp4', 'media') == {ResourceClass.MEDIA}
+		assert _classify_request('https://cdn.example.com/hero.jpg', 'image') == {ResourceClass.IMAGES}
+
+		# a request can fall into several classes
+		assert _classify_request('https://googleads.g.doubleclick.net/pagead/banner.png', 'image') == {
+			ResourceClass.ADS,
+			ResourceClass.IMAGES,
+		}
+
+		# lookalike domains and regular resources are not classified
+		assert _classify_request('https://notdoubleclick.net/tag.js', 'script') == set()
+		assert _classify_request('https://example.com/app.js', 'script') == set()
+		assert _classify_request('https://example.com/style.css', 'stylesheet') == set()
+
+	async def test_image_from_ad_host_is_blocked_as_image(self):
+		"""Test that a request is blocked when any of its classes is blocked, not only the first one it matched."""
+		browser_session = BrowserSession(browser_profile=BrowserProfile(blocked_resource_classes=['images']))
+		request = SimpleNamespace(url='https://googleads.g.doubleclick.net/pagead/banner.png', resource_type='image')
+		route = SimpleNamespace(fulfill=AsyncMock(), abort=AsyncMock(), fallback=AsyncMock())
+
+		await browser_session._route_resource_policy(route, request)
+
+		route.fulfill.assert_awaited_once()
+		route.fallback.assert_not_awaited()
+		assert browser_session.resource_blocking_stats.blocked_requests == {'images': 1}
+
+	def test_per_domain_overrides(self):
+		"""Test that resource_policy_overrides replace the default blocked classes for matching pages."""
+		browser_session = BrowserSession(
+			browser_profile=BrowserProfile(
+				blocked_resource_classes=['images', 'fonts'],
+				resource_policy_overrides={'*.maps.example.com': ['fonts']},
+			)
+		)
+
+		class FakeRequest:
+			def __init__(self, page_url):
+				self.frame = type('Frame', (), {'page': type('Page', (), {'url': page_url})()})()
+
+		assert browser_session._blocked_resource_classes_for(FakeRequest('https://maps.example.com/')) == [ResourceClass.FONTS]
+		assert browser_session._blocked_resource_classes_for(FakeRequest('https://example.com/')) == [
+			ResourceClass.IMAGES,
+			ResourceClass.FONTS,
+		]
+
+	@pytest.fixture(scope='module')
+	def event_loop(self):
+		"""Create and provide an event loop for async tests."""
+		loop = asyncio.get_event_loop_policy().new_event_loop()
+		yield loop
+		loop.close()
+
+	@pytest.fixture(scope='module')
+	def http_server(self):
+		"""Create and provide a test HTTP server that serves a page with an image, a font and an analytics script."""
+		server = HTTPServer()
+		server.start()
+		server.expect_request('/').respond_with_data(
+			"""
+			<html><head><title>Resource Policy</title>
+			<style>@font-face { font-family: test; src: url('/font.woff2'); } body { font-family: test; }</style>
+			<script src="https://www.google-analytics.com/analytics.js"></script>
+			</head><body><h1>Hello</h1><img src="/hero.png"></body></html>
+			""",
+			content_type='text/html',
+		)
+		server.expect_request('/hero.png').respond_with_data(b'\x89PNG' + b'0' * 1000, content_type='image/png')
+		server.expect_request('/font.woff2').respond_with_data(b'0' * 1000, content_type='font/woff2')
+		yield server
+		server.stop()
+
+	async def test_blocked_requests_never_reach_the_server(self, http_server):
+		"""Test that blocked requests are stubbed/aborted in the browser and counted in resource_blocking_stats."""
+		browser_session = BrowserSession(
+			browser_profile=BrowserProfile(
+				headless=True,
+				user_data_dir=None,
+				blocked_resource_classes=['images', 'fonts', 'analytics'],
+			)
+		)
+		await browser_session.start()
+		try:
+			await browser_session.navigate(http_server.url_for('/'))
+			page = await browser_session.get_current_page()
+			await page.wait_for_load_state('load')
+
+			requested_paths = [request.path for request, _ in http_server.log]
+			assert '/' in requested_paths
+			assert '/hero.png' not in requested_paths
+
+			stats = browser_session.resource_blocking_stats
+			assert stats.blocked_requests.get('images') == 1
+			assert stats.blocked_requests.get('analytics') == 1
+			assert stats.estimated_bytes_saved > 0
+		finally:
+			await browser_session.stop()
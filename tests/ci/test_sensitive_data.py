@@ -5,7 +5,7 @@ from pydantic import BaseModel, Field
 from browser_use.agent.message_manager.service import MessageManager, MessageManagerSettings
 from browser_use.agent.views import MessageManagerState
 from browser_use.controller.registry.service import Registry
-from browser_use.utils import match_url_with_domain_pattern
+from browser_use.utils import SensitiveDataMatcher, match_url_with_domain_pattern
 
 
 class SensitiveParams(BaseModel):
@@ -261,3 +261,32 @@ def test_filter_sensitive_data(message_manager):
 	assert '<secret>username</secret>' in result.content
 	assert '<secret>password</secret>' in result.content
 	assert '<secret>email</secret>' in result.content
+
+
+def test_sensitive_data_matcher_is_compiled_once():
+	"""Test that the matcher is reused for the same sensitive_data and recompiled when it changes in place"""
+	sensitive_data = {'example.com': {'password': 'hunter2'}}
+	matcher = SensitiveDataMatcher.for_sensitive_data(sensitive_data)
+	assert SensitiveDataMatcher.for_sensitive_data(sensitive_data) is matcher
+
+	sensitive_data['example.com']['pin'] = '1234'
+	updated_matcher = SensitiveDataMatcher.for_sensitive_data(sensitive_data)
+	assert updated_matcher is not matcher
+	assert updated_matcher.redact('pin 1234') == 'pin <secret>pin</secret>'
+
+
+def test_sensitive_data_matcher_redacts_in_one_pass():
+	"""Test that overlapping secrets redact the longest one and inserted placeholder tags are never redacted again"""
+	matcher = SensitiveDataMatcher(
+		{'short': 'abc', 'long': 'abcdef', 'example.com': {'tag_lookalike': 'secret', 'email': 'user@example.com'}}
+	)
+
+	assert matcher.redact('abcdef abc abcde') == '<secret>long</secret> <secret>short</secret> <secret>short</secret>de'
+	assert matcher.redact('my secret is user@example.com') == ('my <secret>tag_lookalike</secret> is <secret>email</secret>')
+	assert matcher.secrets_for_url('https://example.com/login') == {
+		'short': 'abc',
+		'long': 'abcdef',
+		'tag_lookalike': 'secret',
+		'email': 'user@example.com',
+	}
+	assert matcher.secrets_for_url(None) == {'short': 'abc', 'long': 'abcdef'}
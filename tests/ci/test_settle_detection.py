@@ -0,0 +1,118 @@
+import time
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from browser_use.browser import BrowserProfile, BrowserSession
+
+
+def slow_response(request: Request) -> Response:
+	time.sleep(0.4)
+	return Response('{}', content_type='application/json')
+
+
+class TestSettleDetection:
+	"""Tests for BrowserSession.wait_for_page_settle(), the adaptive wait between actions of Agent.multi_act"""
+
+	@pytest.fixture(scope='module')
+	def http_server(self):
+		"""Create and provide a test HTTP server with a static page."""
+		server = HTTPServer()
+		server.start()
+		server.expect_request('/').respond_with_data(
+			'<html><head><title>Settle</title></head><body><input name="q"><ul id="results"></ul></body></html>',
+			content_type='text/html',
+		)
+		server.expect_request('/deferred').respond_with_data(
+			"""<html><head><title>Deferred</title></head><body>
+			<button id="search" onclick="setTimeout(() => {
+				document.body.insertAdjacentHTML('beforeend', '<a id=result href=#>Result</a>');
+			}, 50)">Search</button>
+			</body></html>""",
+			content_type='text/html',
+		)
+		yield server
+		server.stop()
+
+	@pytest.fixture
+	async def browser_session(self, http_server):
+		browser_session = BrowserSession(
+			browser_profile=BrowserProfile(headless=True, user_data_dir=None, wait_between_actions=1.0)
+		)
+		await browser_session.start()
+		await browser_session.navigate(http_server.url_for('/'))
+		await browser_session.get_state_summary(cache_clickable_elements_hashes=True)
+		await browser_session.remove_highlights()
+		yield browser_session
+		await browser_session.stop()
+
+	async def test_no_side_effects_waits_only_the_quiet_time(self, browser_session):
+		"""Test that an action that didn't change anything waits settle_quiet_time instead of wait_between_actions"""
+		await browser_session.wait_for_page_settle()  # let the highlight removal settle
+		waited = await browser_session.wait_for_page_settle()
+
+		assert 0.1 <= waited < 0.3
+		assert browser_session.settle_stats.early_returns == 2
+		assert browser_session.settle_stats.saved_seconds > 1.4
+
+	async def test_waits_for_deferred_reaction_on_idle_page(self, browser_session, http_server):
+		"""Test that a click handler rendering its result with setTimeout is waited for, although the page was idle before"""
+		await browser_session.navigate(http_server.url_for('/deferred'))
+		await browser_session.get_state_summary(cache_clickable_elements_hashes=True)
+		await browser_session.remove_highlights()
+		page = await browser_session.get_current_page()
+		await page.wait_for_timeout(300)  # the page is idle for longer than settle_quiet_time before the action
+
+		await page.click('#search')
+		waited = await browser_session.wait_for_page_settle()
+
+		assert waited < 1.0
+		assert await page.locator('#result').count() == 1
+		assert await browser_session.page_changed_since_state_summary()
+
+	async def test_waits_for_dom_mutations_to_stop(self, browser_session):
+		"""Test that the wait lasts while the page keeps rendering new results, and stops once it's quiet"""
+		page = await browser_session.get_current_page()
+		await page.evaluate("""() => {
+			let added = 0;
+			const timer = setInterval(() => {
+				document.getElementById('results').insertAdjacentHTML('beforeend', '<li>result</li>');
+				if (++added === 8) clearInterval(timer);
+			}, 40);
+		}""")
+		waited = await browser_session.wait_for_page_settle()
+
+		assert 0.3 <= waited < 1.0
+		assert await page.locator('#results li').count() == 8
+
+	async def test_waits_for_pending_requests(self, browser_session, http_server):
+		"""Test that a fetch started by the action is waited for even if the DOM is quiet meanwhile"""
+		http_server.expect_request('/api/slow').respond_with_handler(slow_response)
+		page = await browser_session.get_current_page()
+		await page.evaluate(f"() => {{ fetch('{http_server.url_for('/api/slow')}'); }}")
+		waited = await browser_session.wait_for_page_settle()
+
+		assert 0.35 <= waited < 1.0
+
+	async def test_ceiling_with_endless_activity(self, browser_session):
+		"""Test that a page that never settles only costs the fixed wait_between_actions"""
+		page = await browser_session.get_current_page()
+		await page.evaluate('() => setInterval(() => { document.title = String(Math.random()); }, 20)')
+		waited = await browser_session.wait_for_page_settle(timeout=0.3)
+
+		assert waited == pytest.approx(0.3, abs=0.05)
+		assert browser_session.settle_stats.early_returns == 0
+
+
+async def test_fixed_wait_without_adaptive_settle_detection():
+	"""Test that adaptive_wait_between_actions=False sleeps the full wait_between_actions and saves nothing"""
+	browser_session = BrowserSession(
+		browser_profile=BrowserProfile(wait_between_actions=0.05, adaptive_wait_between_actions=False)
+	)
+	waited = await browser_session.wait_for_page_settle()
+
+	assert waited == pytest.approx(0.05, abs=0.02)
+	assert browser_session.settle_stats.waits == 1
+	assert browser_session.settle_stats.early_returns == 0
+	assert browser_session.settle_stats.saved_seconds == 0
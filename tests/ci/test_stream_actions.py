@@ -0,0 +1,201 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import RunnableLambda
+
+from browser_use import Agent, Controller
+from browser_use.agent.message_manager.utils import StreamingActionParser
+from browser_use.agent.views import ActionResult
+from browser_use.browser import BrowserProfile, BrowserSession
+
+MODEL_OUTPUT = {
+	'current_state': {
+		'evaluation_previous_goal': 'Unknown - the "action" {key} [is] only a string here',
+		'memory': 'Nothing done yet',
+		'next_goal': 'Open the page',
+	},
+	'action': [
+		{'go_to_url': {'url': 'https://example.com/?q={1}'}},
+		{'input_text': {'index': 3, 'text': 'a \\"quoted\\" [value]'}},
+	],
+}
+
+
+class TestStreamingActionParser:
+	"""Tests for the incremental parser used by Agent(stream_actions=True)"""
+
+	@pytest.mark.parametrize('chunk_size', [1, 2, 5, 17, 10_000])
+	def test_actions_are_returned_as_soon_as_they_are_complete(self, chunk_size):
+		"""Test that each action comes out of the chunk containing its closing brace, whatever the chunking"""
+		text = '```json\n' + json.dumps(MODEL_OUTPUT) + '\n```'
+		first_action_end = text.index('}}') + 2
+
+		parser = StreamingActionParser()
+		first_action_at = None
+		for start in range(0, len(text), chunk_size):
+			if parser.feed(text[start : start + chunk_size]) and first_action_at is None:
+				first_action_at = start + chunk_size
+
+		assert parser.actions == MODEL_OUTPUT['action']
+		assert first_action_at is not None
+		assert first_action_at < first_action_end + chunk_size
+
+	def test_actions_before_current_state_and_wrapping_list(self):
+		"""Test that the action list is found regardless of key order, inside a [...] wrapper, after reasoning text"""
+		parser = StreamingActionParser()
+		text = 'Thinking about it...\n' + json.dumps(
+			[{'action': [{'done': {'text': 'ok', 'success': True}}], 'current_state': {'memory': 'x'}}]
+		)
+
+		assert parser.feed(text) == [{'done': {'text': 'ok', 'success': True}}]
+
+	def test_nested_action_keys_are_ignored(self):
+		"""Test that only the top-level "action" list is treated as the list of actions"""
+		parser = StreamingActionParser()
+		assert parser.feed(json.dumps({'current_state': {'action': [{'fake': {}}]}, 'action': [{'real': {}}]})) == [{'real': {}}]
+
+
+CURRENT_STATE = {'evaluation_previous_goal': 'Success', 'memory': 'Nothing done yet', 'next_goal': 'Count and finish'}
+STREAMED_OUTPUT = {
+	'action': [{'count_call': {}}, {'done': {'text': 'Counted', 'success': True}}],
+	'current_state': CURRENT_STATE,
+}
+
+
+class FakeStreamingChatModel(BaseChatModel):
+	"""Returns the same response every call, streamed in 4 character tokens (like tests/stream_actions_benchmark.py)"""
+
+	response: str
+
+	@property
+	def _llm_type(self) -> str:
+		return 'fake-streaming'
+
+	def _generate(self, messages: list[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+		return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.response))])
+
+	async def _astream(self, messages: list[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> AsyncIterator:
+		for i in range(0, len(self.response), 4):
+			await asyncio.sleep(0.001)
+			yield ChatGenerationChunk(message=AIMessageChunk(content=self.response[i : i + 4]))
+
+
+class CustomStructuredOutputModel(FakeStreamingChatModel):
+	"""A provider whose with_structured_output() isn't the usual RunnableMap(raw=llm) | parser sequence"""
+
+	def with_structured_output(self, schema, *, include_raw: bool = False, **kwargs: Any):
+		return RunnableLambda(lambda messages: {'raw': AIMessage(content=self.response), 'parsed': None})
+
+
+class TestStreamedEarlyAction:
+	"""Tests for executing the first streamed action while the LLM is still responding (Agent(stream_actions=True))"""
+
+	@pytest.fixture
+	def controller(self):
+		controller = Controller()
+		controller.calls = []
+
+		@controller.action('Count the calls of this action')
+		async def count_call():
+			controller.calls.append('count_call')
+			return ActionResult(extracted_content='counted')
+
+		return controller
+
+	def make_agent(self, controller: Controller, llm: BaseChatModel, **kwargs) -> Agent:
+		# the fake model needs no connection test, whatever SKIP_LLM_API_KEY_VERIFICATION was when the agent was imported
+		llm._verified_api_keys = True
+		return Agent(
+			task='Count once',
+			llm=llm,
+			controller=controller,
+			browser_session=BrowserSession(browser_profile=BrowserProfile(headless=True, user_data_dir=None)),
+			stream_actions=True,
+			enable_memory=False,
+			**kwargs,
+		)
+
+	async def test_step_executes_the_streamed_first_action_exactly_once(self, controller):
+		"""Test that the early started first action isn't executed again by multi_act and is recorded in the history"""
+		agent = self.make_agent(
+			controller, FakeStreamingChatModel(response=json.dumps(STREAMED_OUTPUT)), tool_calling_method='raw'
+		)
+		await agent.browser_session.start()
+		try:
+			await agent.step()
+		finally:
+			await agent.browser_session.stop()
+
+		assert controller.calls == ['count_call']
+		assert agent._early_action is None
+		last_step = agent.state.history.history[-1]
+		assert last_step.model_output.action[0].model_dump(exclude_unset=True) == {'count_call': {}}
+		assert last_step.result[0].extracted_content == 'counted'
+		assert last_step.result[-1].is_done
+
+	async def test_get_next_action_starts_the_first_action_while_streaming(self, controller, monkeypatch):
+		"""Test that the first action is running before get_next_action returns, and stays first in the model output"""
+		agent = self.make_agent(
+			controller, FakeStreamingChatModel(response=json.dumps(STREAMED_OUTPUT)), tool_calling_method='raw'
+		)
+		monkeypatch.setattr(BrowserSession, 'remove_highlights', lambda self: asyncio.sleep(0))
+		agent._act = lambda action: asyncio.sleep(0, ActionResult(extracted_content='early'))
+
+		model_output = await agent.get_next_action([HumanMessage(content='Count once')])
+
+		assert agent._early_action is not None
+		early_action, task = agent._early_action
+		assert early_action.model_dump(exclude_unset=True) == {'count_call': {}}
+		assert (await task).extracted_content == 'early'
+		assert model_output.action[0].model_dump(exclude_unset=True) == {'count_call': {}}
+
+	async def test_unknown_structured_output_shape_falls_back_to_regular_call(self, controller):
+		"""Test that providers with a different with_structured_output() are called without streaming"""
+		agent = self.make_agent(
+			controller,
+			CustomStructuredOutputModel(response=json.dumps(STREAMED_OUTPUT)),
+			tool_calling_method='function_calling',
+		)
+
+		model_output = await agent.get_next_action([HumanMessage(content='Count once')])
+
+		assert agent._early_action is None
+		assert [a.model_dump(exclude_unset=True) for a in model_output.action][0] == {'count_call': {}}
+
+	async def test_reconcile_keeps_the_executed_action_first(self, controller):
+		"""Test that the history records the executed streamed action even if the final output starts differently"""
+		agent = self.make_agent(controller, FakeStreamingChatModel(response='{}'), tool_calling_method='raw')
+		executed = agent.ActionModel(count_call={})
+		agent._early_action = (executed, asyncio.create_task(asyncio.sleep(0, ActionResult())))
+		model_output = agent.AgentOutput(
+			current_state=CURRENT_STATE,
+			action=[agent.ActionModel(done={'text': 'Counted', 'success': True})],
+		)
+
+		agent._reconcile_early_action(model_output)
+
+		assert model_output.action[0] is executed
+		assert len(model_output.action) == 1
+		await agent._discard_early_action()
+
+	async def test_discard_waits_for_the_early_action(self, controller):
+		"""Test that a streamed action whose step failed is awaited (and its error swallowed) before the next step"""
+		agent = self.make_agent(controller, FakeStreamingChatModel(response='{}'), tool_calling_method='raw')
+
+		async def failing_action():
+			await asyncio.sleep(0.01)
+			raise RuntimeError('element not found')
+
+		task = asyncio.create_task(failing_action())
+		agent._early_action = (agent.ActionModel(count_call={}), task)
+
+		await agent._discard_early_action()
+
+		assert task.done()
+		assert agent._early_action is None
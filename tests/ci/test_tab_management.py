@@ -9,7 +9,7 @@ load_dotenv()
 
 from browser_use.agent.views import ActionModel
 from browser_use.browser.profile import BrowserProfile
-from browser_use.browser.session import BrowserSession
+from browser_use.browser.session import BrowserSession, TabLock
 from browser_use.controller.service import Controller
 
 # Set up test logging
@@ -329,3 +329,130 @@ class TestTabManagement:
 		# close_tab should have called get_current_page, which creates a new about:blank tab if none are left
 		assert browser_session.human_current_page.url == 'about:blank'
 		assert browser_session.agent_current_page.url == 'about:blank'
+
+	@pytest.mark.asyncio
+	async def test_get_tabs_info_from_registry(self, browser_session, base_url):
+		"""Test that get_tabs_info reflects navigations/new/closed tabs from page events without polling each tab."""
+
+		await self._reset_tab_state(browser_session, base_url)
+		await browser_session.navigate(f'{base_url}/page1')
+		new_tab = await browser_session.create_new_tab(f'{base_url}/page2')
+		await asyncio.sleep(0.5)  # let the background title refresh triggered by the load event finish
+
+		tabs = await browser_session.get_tabs_info()
+		assert [tab.url for tab in tabs][-2:] == [f'{base_url}/page1', f'{base_url}/page2']
+		assert [tab.title for tab in tabs][-2:] == ['Test Page 1', 'Test Page 2']
+
+		# navigating updates the registry from the framenavigated/load events
+		await new_tab.goto(f'{base_url}/page3')
+		await asyncio.sleep(0.5)
+		tabs = await browser_session.get_tabs_info()
+		assert tabs[-1].url == f'{base_url}/page3'
+		assert tabs[-1].title == 'Test Page 3'
+
+		# closed tabs are dropped from the registry
+		await browser_session.close_tab()
+		await asyncio.sleep(0.5)
+		tabs = await browser_session.get_tabs_info()
+		assert f'{base_url}/page3' not in [tab.url for tab in tabs]
+		assert new_tab not in browser_session._tab_records
+
+	@pytest.mark.asyncio
+	async def test_isolated_agent_tab_views(self, browser_session, base_url):
+		"""Test that tab views sharing one browser each see + drive only their own tabs."""
+
+		await self._reset_tab_state(browser_session, base_url)
+		view_a = browser_session.tab_view()
+		view_b = browser_session.tab_view()
+
+		# concurrent agents each get their own new tab instead of all landing on the first tab
+		page_a, page_b = await asyncio.gather(view_a.get_current_page(), view_b.get_current_page())
+		assert page_a != page_b
+		await asyncio.gather(view_a.navigate(f'{base_url}/page1'), view_b.navigate(f'{base_url}/page2'))
+		await asyncio.sleep(0.5)
+
+		assert [tab.url for tab in await view_a.get_tabs_info()] == [f'{base_url}/page1']
+		assert [tab.url for tab in await view_b.get_tabs_info()] == [f'{base_url}/page2']
+		assert {page_a, page_b} <= set(browser_session.tabs)  # the root session still sees every tab
+		assert view_a.tab_lock() is not view_b.tab_lock()
+
+		# stopping a view only closes its own tabs, the shared browser keeps running
+		await view_a.stop()
+		assert page_a.is_closed()
+		assert not page_b.is_closed()
+		assert browser_session.browser_context.pages
+		await view_b.stop()
+
+	@pytest.mark.asyncio
+	async def test_action_reading_state_under_tab_lock(self, browser_session, base_url):
+		"""Test that a custom action can call get_state_summary() although Controller.act already holds the tab lock."""
+
+		await self._reset_tab_state(browser_session, base_url)
+		await browser_session.navigate(f'{base_url}/page1')
+		controller = Controller()
+
+		@controller.action('Read the page title')
+		async def read_title(browser_session: BrowserSession):
+			state = await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+			return state.title
+
+		ActionModel = controller.registry.create_action_model()
+		result = await asyncio.wait_for(controller.act(ActionModel(read_title={}), browser_session=browser_session), timeout=10)
+		assert result.extracted_content == 'Test Page 1'
+		assert not browser_session.tab_lock().locked()
+
+	@pytest.mark.asyncio
+	async def test_tab_reaper(self, base_url):
+		"""Test that the tab reaper samples tab memory and discards/restores least recently used background tabs."""
+
+		browser_session = BrowserSession(
+			browser_profile=BrowserProfile(headless=True, user_data_dir=None, tab_reaper_interval=0.1, max_background_tabs=1)
+		)
+		await browser_session.start()
+		try:
+			await browser_session.navigate(f'{base_url}/page1')
+			await browser_session.create_new_tab(f'{base_url}/page2')
+			await browser_session.create_new_tab(f'{base_url}/page3')
+			await browser_session.create_new_tab(f'{base_url}/page4')
+			await browser_session.switch_to_tab(3)  # the human's foreground tab is protected too, move it to the agent's tab
+
+			await browser_session._sample_and_reap_tabs()
+			stats = browser_session.tab_reaper_stats
+			assert stats.samples == 4
+			assert stats.tabs_discarded == 2  # page1 + page2 are the least recently used of the 3 background tabs
+			assert stats.tabs_closed == 0
+
+			# the agent's current tab is never touched, discarded tabs keep their url and are reloaded on switch
+			tabs = await browser_session.get_tabs_info()
+			assert [tab.url for tab in tabs] == [f'{base_url}/page{i}' for i in range(1, 5)]
+			assert tabs[-1].js_heap_bytes and tabs[-1].js_heap_bytes > 0
+			assert browser_session.agent_current_page.url == f'{base_url}/page4'
+			assert browser_session.tabs[0].url == 'about:blank'
+
+			page = await browser_session.switch_to_tab(0)
+			assert page.url == f'{base_url}/page1'
+			assert stats.tabs_restored == 1
+		finally:
+			await browser_session.stop()
+
+
+async def test_tab_lock_is_reentrant_per_task():
+	"""Test that the task holding a tab lock can take it again, while other tasks still wait for it."""
+	lock = TabLock()
+	order = []
+
+	async def other_agent():
+		async with lock:
+			order.append('other agent')
+
+	async with lock:
+		other = asyncio.create_task(other_agent())
+		async with asyncio.timeout(1):
+			async with lock:
+				order.append('nested')
+		await asyncio.sleep(0.05)
+		assert lock.locked()
+		assert order == ['nested']
+	await other
+	assert order == ['nested', 'other agent']
+	assert not lock.locked()
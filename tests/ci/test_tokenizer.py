@@ -0,0 +1,68 @@
+import base64
+
+from langchain_core.messages import SystemMessage
+
+from browser_use.agent.message_manager.service import MessageManager, MessageManagerSettings
+from browser_use.agent.message_manager.tokenizer import BPETokenizer, CharacterRatioTokenizer
+
+
+class TestTokenizers:
+	"""Tests for the message manager tokenizers and the calibration against provider usage metadata"""
+
+	def test_bpe_tokenizer_from_vocab_file(self, tmp_path):
+		"""Test that the offline BPE tokenizer applies the merges of a tiktoken-format vocab file in rank order"""
+		ranks = {bytes([i]): i for i in range(256)}
+		for rank, token in enumerate([b'he', b'll', b'hell', b'hello'], start=256):
+			ranks[token] = rank
+		vocab_file = tmp_path / 'tiny.tiktoken'
+		vocab_file.write_text(''.join(f'{base64.b64encode(token).decode()} {rank}\n' for token, rank in ranks.items()))
+
+		tokenizer = BPETokenizer.from_file(vocab_file)
+		assert tokenizer.encode('hello hello') == [259, ord(' '), 259]
+		assert tokenizer.encode('help') == [256, ord('l'), ord('p')]
+		assert tokenizer.count_tokens('hello, world') == len('hello, world') - 4
+
+	def test_character_ratio_calibration(self):
+		"""Test that the first observation replaces the default ratio and later ones are smoothed"""
+		tokenizer = CharacterRatioTokenizer(characters_per_token=3)
+		assert tokenizer.count_tokens('x' * 30) == 10
+
+		tokenizer.calibrate(text_characters=4000, text_tokens=1000)
+		assert tokenizer.characters_per_token == 4.0
+		tokenizer.calibrate(text_characters=2000, text_tokens=1000)
+		assert tokenizer.characters_per_token == 3.0
+
+	def test_message_manager_recounts_history_with_reported_usage(self):
+		"""Test that the reported input tokens recalibrate the token count of the whole history"""
+		message_manager = MessageManager(
+			task='t' * 400,
+			system_message=SystemMessage(content='s' * 4000),
+			settings=MessageManagerSettings(estimated_characters_per_token=3),
+		)
+		estimated_tokens = message_manager.state.history.current_tokens
+		input_messages = message_manager.get_messages()
+		characters = estimated_tokens * 3
+
+		# the provider counted half as many tokens as we estimated -> twice as many characters per token
+		message_manager.reconcile_token_usage(input_messages, input_tokens=estimated_tokens // 2)
+
+		assert 5.5 < message_manager.tokenizer.characters_per_token < 6.5
+		assert abs(message_manager.state.history.current_tokens - characters / 6) < 0.1 * estimated_tokens
+		assert message_manager.state.history.current_tokens == sum(
+			m.metadata.tokens for m in message_manager.state.history.messages
+		)
+
+	def test_calibration_is_per_message_manager(self):
+		"""Test that calibrating one agent's token estimate doesn't skew another agent's"""
+		first, second = (
+			MessageManager(
+				task='Find the cheapest flight',
+				system_message=SystemMessage(content='You are a browser agent.'),
+				settings=MessageManagerSettings(estimated_characters_per_token=3),
+			)
+			for _ in range(2)
+		)
+		first.tokenizer.calibrate(text_characters=8000, text_tokens=1000)
+
+		assert first.tokenizer.characters_per_token == 8.0
+		assert second.tokenizer.characters_per_token == 3
@@ -0,0 +1,62 @@
+"""
+Compare per-action latency of the css selector path vs the CDP backend node id path (BrowserProfile(cdp_element_actions=True))
+for click_element_by_index + input_text style actions.
+
+Usage:
+	python tests/element_actions_benchmark.py
+"""
+
+import asyncio
+import statistics
+import time
+
+from browser_use.browser import BrowserProfile, BrowserSession
+
+ROUNDS = 20
+FORM_HTML = (
+	'<html><body><form onsubmit="return false">'
+	+ ''.join(
+		f'<div class="row r{i}"><input class="field dyn-{i}" name="field{i}"><button>Save {i}</button></div>' for i in range(50)
+	)
+	+ '</form></body></html>'
+)
+
+
+async def measure(cdp_element_actions: bool) -> dict[str, list[float]]:
+	browser_session = BrowserSession(
+		browser_profile=BrowserProfile(headless=True, user_data_dir=None, cdp_element_actions=cdp_element_actions)
+	)
+	await browser_session.start()
+	timings: dict[str, list[float]] = {'click': [], 'input_text': []}
+	try:
+		page = await browser_session.get_current_page()
+		await page.set_content(FORM_HTML)
+		for _ in range(ROUNDS):
+			state = await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+			inputs = [node for node in state.selector_map.values() if node.tag_name == 'input']
+			buttons = [node for node in state.selector_map.values() if node.tag_name == 'button']
+
+			start = time.perf_counter()
+			await browser_session._input_text_element_node(inputs[-1], 'hello world')
+			timings['input_text'].append(time.perf_counter() - start)
+
+			start = time.perf_counter()
+			await browser_session._click_element_node(buttons[-1])
+			timings['click'].append(time.perf_counter() - start)
+	finally:
+		await browser_session.stop()
+	return timings
+
+
+async def test_element_action_latency():
+	selector_timings = await measure(cdp_element_actions=False)
+	cdp_timings = await measure(cdp_element_actions=True)
+
+	for action in ('click', 'input_text'):
+		selector_ms = statistics.median(selector_timings[action]) * 1000
+		cdp_ms = statistics.median(cdp_timings[action]) * 1000
+		print(f'{action:>12}: css selector {selector_ms:7.1f}ms | cdp backend node {cdp_ms:7.1f}ms (median of {ROUNDS})')
+
+
+if __name__ == '__main__':
+	asyncio.run(test_element_action_latency())
@@ -0,0 +1,72 @@
+"""
+Compare the latency of scroll_to_text on a long document: the previous implementation (up to 3 playwright locator
+strategies with count/is_visible/bounding_box round-trips each) vs the single in-page TreeWalker search.
+
+Usage:
+	python tests/scroll_to_text_benchmark.py
+"""
+
+import asyncio
+import statistics
+import time
+
+from browser_use.browser import BrowserProfile, BrowserSession
+
+ROUNDS = 10
+PARAGRAPHS = 5000
+LONG_DOCUMENT_HTML = (
+	'<html><body>'
+	+ ''.join(f'<p>Paragraph {i}: <b>lorem</b> ipsum dolor sit amet, consectetur adipiscing elit.</p>' for i in range(PARAGRAPHS))
+	+ '<p>The needle is right here</p>'
+	+ '</body></html>'
+)
+
+
+async def legacy_scroll_to_text(page, text: str) -> bool:
+	"""The scroll_to_text action before the in-page search"""
+	locators = [
+		page.get_by_text(text, exact=False),
+		page.locator(f'text={text}'),
+		page.locator(f"//*[contains(text(), '{text}')]"),
+	]
+	for locator in locators:
+		try:
+			if await locator.count() == 0:
+				continue
+			element = locator.first
+			is_visible = await element.is_visible()
+			bbox = await element.bounding_box()
+			if is_visible and bbox is not None and bbox['width'] > 0 and bbox['height'] > 0:
+				await element.scroll_into_view_if_needed()
+				return True
+		except Exception:
+			continue
+	return False
+
+
+async def test_scroll_to_text_latency():
+	browser_session = BrowserSession(browser_profile=BrowserProfile(headless=True, user_data_dir=None))
+	await browser_session.start()
+	timings: dict[str, list[float]] = {'locators': [], 'tree_walker': []}
+	try:
+		page = await browser_session.get_current_page()
+		await page.set_content(LONG_DOCUMENT_HTML)
+		for _ in range(ROUNDS):
+			await page.evaluate('window.scrollTo(0, 0)')
+			start = time.perf_counter()
+			assert await legacy_scroll_to_text(page, 'needle is right')
+			timings['locators'].append(time.perf_counter() - start)
+
+			await page.evaluate('window.scrollTo(0, 0)')
+			start = time.perf_counter()
+			assert await browser_session.scroll_to_text('needle is right')
+			timings['tree_walker'].append(time.perf_counter() - start)
+	finally:
+		await browser_session.stop()
+
+	for strategy, durations in timings.items():
+		print(f'{strategy:>12}: {statistics.median(durations) * 1000:7.1f}ms (median of {ROUNDS}, {PARAGRAPHS} paragraphs)')
+
+
+if __name__ == '__main__':
+	asyncio.run(test_scroll_to_text_latency())
@@ -0,0 +1,107 @@
+"""
+Compare sensitive data handling with 1k secrets: redacting a state message per-secret with str.replace (the previous
+implementation) vs the precompiled SensitiveDataMatcher, and filling in the placeholders of an input_text action.
+
+Usage:
+	python tests/sensitive_data_benchmark.py
+"""
+
+import os
+import random
+import string
+import time
+
+os.environ.setdefault('ANONYMIZED_TELEMETRY', 'false')
+
+from langchain_core.messages import HumanMessage, SystemMessage
+from pydantic import BaseModel
+
+from browser_use.agent.message_manager.service import MessageManager, MessageManagerSettings
+from browser_use.controller.registry.service import Registry
+from browser_use.utils import SensitiveDataMatcher
+
+SECRETS = 1000
+DOMAINS = 50
+ROUNDS = 200
+WORDS = 'the quick brown fox jumps over lazy dog button submit search results price cart login password email'.split()
+
+
+class InputTextParams(BaseModel):
+	index: int
+	text: str
+
+
+def random_secret(rng: random.Random) -> str:
+	return ''.join(rng.choices(string.ascii_letters + string.digits, k=rng.randint(8, 24)))
+
+
+def make_sensitive_data(rng: random.Random) -> dict[str, str | dict[str, str]]:
+	secrets_per_domain = SECRETS // DOMAINS
+	return {
+		f'https://*.site{d}.com': {f'secret_{d}_{i}': random_secret(rng) for i in range(secrets_per_domain)}
+		for d in range(DOMAINS)
+	}
+
+
+def replace_per_secret(sensitive_data: dict, value: str) -> str:
+	"""The previous redaction: flatten the secrets for every text, then one str.replace per secret"""
+	sensitive_values: dict[str, str] = {}
+	for key_or_domain, content in sensitive_data.items():
+		if isinstance(content, dict):
+			for key, val in content.items():
+				if val:
+					sensitive_values[key] = val
+		elif content:
+			sensitive_values[key_or_domain] = content
+	for key, val in sensitive_values.items():
+		value = value.replace(val, f'<secret>{key}</secret>')
+	return value
+
+
+def timed(fn, rounds: int = ROUNDS) -> float:
+	start = time.perf_counter()
+	for _ in range(rounds):
+		fn()
+	return (time.perf_counter() - start) / rounds * 1000
+
+
+def test_sensitive_data_redaction_with_1k_secrets():
+	rng = random.Random(0)
+	sensitive_data = make_sensitive_data(rng)
+	some_secrets = [secret for content in sensitive_data.values() for secret in list(content.values())[:1]]
+	# ~16KB DOM-like state message with a few secrets in it
+	lines = [f'[{i}]<a>{" ".join(rng.choices(WORDS, k=5))} />' for i in range(400)] + some_secrets[:10]
+	rng.shuffle(lines)
+	state_text = '\n'.join(lines)
+
+	start = time.perf_counter()
+	matcher = SensitiveDataMatcher(sensitive_data)
+	compile_ms = (time.perf_counter() - start) * 1000
+	assert matcher.redact(state_text) == replace_per_secret(sensitive_data, state_text)
+
+	per_secret_ms = timed(lambda: replace_per_secret(sensitive_data, state_text))
+	matcher_ms = timed(lambda: SensitiveDataMatcher.for_sensitive_data(sensitive_data).redact(state_text))
+	print(f'\nredact {len(state_text) // 1024}KB state message with {SECRETS} secrets:')
+	print(f'  str.replace per secret: {per_secret_ms:7.3f}ms')
+	print(f'  compiled matcher:       {matcher_ms:7.3f}ms (one-time compile {compile_ms:.1f}ms)')
+
+	message_manager = MessageManager(
+		task='Log in',
+		system_message=SystemMessage(content='You are a browser agent.'),
+		settings=MessageManagerSettings(sensitive_data=sensitive_data),
+	)
+	message_ms = timed(lambda: message_manager._filter_sensitive_data(HumanMessage(content=state_text)))
+	print(f'  MessageManager._filter_sensitive_data: {message_ms:7.3f}ms')
+
+	registry = Registry()
+	params = InputTextParams(index=1, text='<secret>secret_7_3</secret>')
+	url = 'https://login.site7.com/'
+	substitute_ms = timed(lambda: registry._replace_sensitive_data(params, sensitive_data, url))
+	assert (
+		registry._replace_sensitive_data(params, sensitive_data, url).text == sensitive_data['https://*.site7.com']['secret_7_3']
+	)
+	print(f'  Registry._replace_sensitive_data (input_text placeholder): {substitute_ms:7.3f}ms')
+
+
+if __name__ == '__main__':
+	test_sensitive_data_redaction_with_1k_secrets()
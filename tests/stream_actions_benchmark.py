@@ -0,0 +1,116 @@
+"""
+Compare time-to-first-action of a step with the regular LLM call vs Agent(stream_actions=True), which starts the first
+action as soon as its JSON has streamed in.
+
+The LLM is a local fake chat model that streams a canned response token by token (TOKEN_DELAY per token), once with the
+default current_state-first layout and once with the action list written first.
+
+Usage:
+	python tests/stream_actions_benchmark.py
+"""
+
+import asyncio
+import json
+import os
+import statistics
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+os.environ.setdefault('ANONYMIZED_TELEMETRY', 'false')
+os.environ.setdefault('SKIP_LLM_API_KEY_VERIFICATION', 'true')
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from browser_use import Agent, Controller
+from browser_use.agent.views import ActionResult
+from browser_use.browser import BrowserProfile, BrowserSession
+
+ROUNDS = 5
+TOKEN_DELAY = 0.01  # ~100 tokens/s
+CURRENT_STATE = {
+	'evaluation_previous_goal': 'Success - the search page loaded and shows the search box at index 3 as expected.',
+	'memory': 'Opened the search page, next I need to enter the query and read the first results. 0 of 5 results read.',
+	'next_goal': 'Mark the start of the action, then finish the task.',
+}
+ACTIONS = [
+	{'mark_first_action': {}},
+	{'done': {'text': 'Finished the benchmark step, the first action was executed and timed.', 'success': True}},
+]
+
+
+class FakeStreamingChatModel(BaseChatModel):
+	"""Returns the same response every call, streamed in ~4 char tokens with TOKEN_DELAY between them"""
+
+	response: str
+	call_started_at: float = 0.0
+
+	@property
+	def _llm_type(self) -> str:
+		return 'fake-streaming'
+
+	def _tokens(self) -> list[str]:
+		return [self.response[i : i + 4] for i in range(0, len(self.response), 4)]
+
+	def _generate(self, messages: list[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+		self.call_started_at = time.perf_counter()
+		time.sleep(TOKEN_DELAY * len(self._tokens()))
+		return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.response))])
+
+	async def _astream(self, messages: list[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> AsyncIterator:
+		self.call_started_at = time.perf_counter()
+		for token in self._tokens():
+			await asyncio.sleep(TOKEN_DELAY)
+			yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+
+
+async def measure(browser_session: BrowserSession, response: str, stream_actions: bool) -> list[float]:
+	llm = FakeStreamingChatModel(response=response)
+	controller = Controller()
+	first_action_at: list[float] = []
+
+	@controller.action('Mark the start of the first action')
+	async def mark_first_action():
+		first_action_at.append(time.perf_counter())
+		return ActionResult()
+
+	timings = []
+	for _ in range(ROUNDS):
+		agent = Agent(
+			task='Benchmark step',
+			llm=llm,
+			controller=controller,
+			browser_session=browser_session,
+			tool_calling_method='raw',
+			stream_actions=stream_actions,
+			enable_memory=False,
+		)
+		await agent.step()
+		timings.append(first_action_at[-1] - llm.call_started_at)
+	return timings
+
+
+async def test_stream_actions_time_to_first_action():
+	browser_session = BrowserSession(browser_profile=BrowserProfile(headless=True, user_data_dir=None, keep_alive=True))
+	await browser_session.start()
+	try:
+		layouts = {
+			'current_state first': json.dumps({'current_state': CURRENT_STATE, 'action': ACTIONS}),
+			'action first': json.dumps({'action': ACTIONS, 'current_state': CURRENT_STATE}),
+		}
+		for layout, response in layouts.items():
+			regular_ms = statistics.median(await measure(browser_session, response, stream_actions=False)) * 1000
+			streamed_ms = statistics.median(await measure(browser_session, response, stream_actions=True)) * 1000
+			print(
+				f'{layout:>20}: time to first action {regular_ms:7.1f}ms regular | {streamed_ms:7.1f}ms stream_actions=True '
+				f'(median of {ROUNDS}, {len(response) // 4} tokens)'
+			)
+	finally:
+		browser_session.browser_profile.keep_alive = False
+		await browser_session.stop()
+
+
+if __name__ == '__main__':
+	asyncio.run(test_stream_actions_time_to_first_action())